@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Compresse les réponses de l'API en brotli, ou en gzip pour les clients
+    qui ne l'acceptent pas.
+
+    Seuls les types textuels (JSON, msgpack, HTML, CSV, iCal...) sont
+    compressés, et seulement au-delà de `COMPRESSION_MIN_SIZE` octets : en
+    dessous, le gain ne paie pas le CPU. Les flux Server-Sent Events ne sont
+    jamais compressés pour ne pas retarder les messages. Le HTML (admin,
+    pages avec jeton CSRF) reste en gzip : `GZipMiddleware` y ajoute un
+    bourrage aléatoire contre BREACH, que brotli n'offre pas. Les fichiers
+    statiques sont servis précompressés par WhiteNoise, placé avant ce
+    middleware.
+    """
+
+    compressible_types = (
+        "text/",
+        "application/json",
+        "application/msgpack",
+        "application/javascript",
+        "application/xml",
+        "application/vnd.oai.openapi",
+        "application/x-ndjson",
+    )
+    excluded_types = ("text/event-stream",)
+    gzip_only_types = ("text/html",)
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if not content_type.startswith(self.compressible_types):
+            return response
+        if content_type.startswith(self.excluded_types):
+            return response
+
+        ae = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if (
+            brotli is None
+            or not re_accepts_brotli.search(ae)
+            or content_type.startswith(self.gzip_only_types)
+        ):
+            return super().process_response(request, response)
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self.compress_async_sequence(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = self.compress_sequence(
+                    response.streaming_content
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(
+                response.content, quality=self.brotli_quality
+            )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
+
+    @property
+    def min_size(self):
+        return settings.COMPRESSION_MIN_SIZE
+
+    @property
+    def brotli_quality(self):
+        return settings.COMPRESSION_BROTLI_QUALITY
+
+    def compress_sequence(self, sequence):
+        """Compresse un flux en envoyant chaque morceau dès qu'il est prêt."""
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+        for chunk in sequence:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+
+    async def compress_async_sequence(self, sequence):
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+        async for chunk in sequence:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
@@ -0,0 +1,6 @@
+# Middleware
+from .CompressionMiddleware import CompressionMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+]
@@ -0,0 +1,59 @@
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from ft.common.models import VersionedModel
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "L'objet a été modifié depuis sa dernière lecture."
+    default_code = "precondition_failed"
+
+
+class ConditionalUpdateMixin:
+    """
+    Mises à jour conditionnelles d'un `VersionedModel`.
+
+    Les réponses de lecture et de modification d'un objet portent sa version
+    dans l'en-tête `ETag`. Un PUT ou PATCH peut envoyer cette valeur dans
+    `If-Match` : si elle ne correspond plus, la réponse est un 412 et rien
+    n'est écrit. Sans `If-Match`, la version lue pendant la requête protège
+    tout de même l'écriture d'une modification concurrente.
+
+    La comparaison ignore le préfixe `W/` : `CompressionMiddleware` affaiblit
+    l'ETag des réponses compressées, mais la valeur désigne toujours la
+    version de l'objet.
+    """
+
+    etag_actions = ("retrieve", "update", "partial_update")
+
+    @staticmethod
+    def etag(instance):
+        return quote_etag(str(instance.version))
+
+    def get_object(self):
+        self.versioned_object = super().get_object()
+        return self.versioned_object
+
+    def perform_update(self, serializer):
+        if_match = self.request.headers.get("If-Match")
+        if if_match is not None:
+            etags = {etag.removeprefix("W/") for etag in parse_etags(if_match)}
+            if "*" not in etags and self.etag(serializer.instance) not in etags:
+                raise PreconditionFailed()
+        try:
+            super().perform_update(serializer)
+        except VersionedModel.VersionConflict:
+            raise PreconditionFailed()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        instance = getattr(self, "versioned_object", None)
+        if (
+            instance is not None
+            and self.action in self.etag_actions
+            and status.is_success(response.status_code)
+        ):
+            response["ETag"] = self.etag(instance)
+        return response
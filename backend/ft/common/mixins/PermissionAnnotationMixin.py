@@ -0,0 +1,19 @@
+from ft.common.permissions import AnnotatedPermission
+
+
+class PermissionAnnotationMixin:
+    """
+    Ajoute au queryset des routes de détail les annotations des permissions
+    du viewset qui en déclarent (voir `AnnotatedPermission`).
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.detail or not self.request.user.is_authenticated:
+            return queryset
+
+        annotations = {}
+        for permission in self.get_permissions():
+            if isinstance(permission, AnnotatedPermission):
+                annotations.update(permission.get_annotations(self.request))
+        return queryset.annotate(**annotations) if annotations else queryset
@@ -0,0 +1,22 @@
+from rest_framework.permissions import SAFE_METHODS
+
+from ft.common.query import QueryOptimizer
+
+
+class QueryOptimizedMixin:
+    """
+    Applique aux querysets du viewset le plan de chargement déduit de son
+    serializer (voir `QueryOptimizer`), après les filtres. Seules les
+    lectures sont optimisées : une écriture recharge l'objet en entier et ne
+    doit pas renvoyer d'annotations calculées avant elle.
+    """
+
+    def get_query_serializer_class(self):
+        """Serializer dont les champs déterminent le plan de chargement."""
+        return self.get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return QueryOptimizer.optimize(queryset, self.get_query_serializer_class())
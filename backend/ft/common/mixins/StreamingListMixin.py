@@ -0,0 +1,42 @@
+from django.http import StreamingHttpResponse
+from rest_framework.response import Response
+
+from ft.common.renderers import ORJSONRenderer
+
+
+class StreamingListMixin:
+    """
+    Réponse de liste pour les actions personnalisées d'un viewset.
+
+    Le queryset passe par les filtres, la recherche et le tri du viewset,
+    puis est paginé comme la liste principale. Avec `?stream=ndjson`, toute
+    la liste est envoyée en flux, un objet JSON par ligne : les lignes sont
+    lues par paquets avec un curseur serveur et sérialisées une à une, sans
+    jamais tenir l'ensemble en mémoire.
+    """
+
+    stream_chunk_size = 500
+
+    def list_response(self, queryset):
+        queryset = self.filter_queryset(queryset)
+
+        if self.request.query_params.get("stream") == "ndjson":
+            return self.stream_response(queryset)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def stream_response(self, queryset):
+        serializer = self.get_serializer()
+        renderer = ORJSONRenderer()
+
+        def lines():
+            for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+                yield renderer.render(serializer.to_representation(instance)) + b"\n"
+
+        return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
@@ -0,0 +1,12 @@
+# Mixins
+from .QueryOptimizedMixin import QueryOptimizedMixin
+from .PermissionAnnotationMixin import PermissionAnnotationMixin
+from .StreamingListMixin import StreamingListMixin
+from .ConditionalUpdateMixin import ConditionalUpdateMixin
+
+__all__ = [
+    "QueryOptimizedMixin",
+    "PermissionAnnotationMixin",
+    "StreamingListMixin",
+    "ConditionalUpdateMixin",
+]
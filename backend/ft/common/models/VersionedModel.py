@@ -0,0 +1,55 @@
+from django.db import DatabaseError, models, router, transaction
+
+
+class VersionedModel(models.Model):
+    """
+    Modèle abstrait à verrouillage optimiste.
+
+    Chaque modification d'une ligne existante commence par
+    `UPDATE ... SET version = n + 1 WHERE id = ... AND version = n`, où `n`
+    est la version lue avec l'instance. Si la ligne a changé entretemps,
+    aucune ligne ne correspond : `VersionConflict` est levée sans qu'aucun
+    verrou n'ait été pris. Sinon la ligne reste verrouillée jusqu'à la fin de
+    la transaction, le temps d'écrire les autres champs.
+
+    Les écritures groupées (`update`, `bulk_update`) doivent incrémenter
+    `version` elles-mêmes.
+    """
+
+    class VersionConflict(DatabaseError):
+        """La ligne a été modifiée depuis la lecture de sa version."""
+
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name="Version",
+        help_text="Incrémentée à chaque modification",
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding or kwargs.get("force_insert"):
+            return super().save(*args, **kwargs)
+
+        expected = self.version
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        try:
+            with transaction.atomic(using=using):
+                claimed = (
+                    type(self)
+                    ._base_manager.using(using)
+                    .filter(pk=self.pk, version=expected)
+                    .update(version=expected + 1)
+                )
+                if not claimed:
+                    raise self.VersionConflict(
+                        f"{self._meta.object_name} {self.pk} a été modifié depuis "
+                        f"la version {expected}."
+                    )
+                self.version = expected + 1
+                super().save(*args, **kwargs)
+        except Exception:
+            self.version = expected
+            raise
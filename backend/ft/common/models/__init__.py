@@ -0,0 +1,6 @@
+# Models
+from .VersionedModel import VersionedModel
+
+__all__ = [
+    "VersionedModel",
+]
@@ -0,0 +1,20 @@
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from ft.common.renderers import MessagePackRenderer
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parser MessagePack (`application/msgpack`) pour les endpoints d'écriture.
+    """
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
@@ -0,0 +1,8 @@
+# Parsers
+from .ORJSONParser import ORJSONParser
+from .MessagePackParser import MessagePackParser
+
+__all__ = [
+    "ORJSONParser",
+    "MessagePackParser",
+]
@@ -0,0 +1,41 @@
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from rest_framework import permissions
+
+
+class AnnotatedPermission(permissions.BasePermission):
+    """
+    Permission dont les règles objet sont calculées par le queryset.
+
+    `annotations` associe un nom d'annotation au chemin, en notation ORM,
+    du champ qui doit désigner l'utilisateur connecté (par exemple
+    `{"is_host": "hosting__host"}`). Le `PermissionAnnotationMixin` ajoute
+    ces booléens au queryset des routes de détail : `get_object()` les
+    ramène avec l'objet, dans la même requête SQL, et la vérification ne
+    charge plus aucune relation.
+    """
+
+    annotations = {}
+
+    def get_annotations(self, request):
+        return {
+            name: ExpressionWrapper(
+                Q(**{path: request.user.pk}), output_field=BooleanField()
+            )
+            for name, path in self.annotations.items()
+        }
+
+    @classmethod
+    def resolve(cls, obj, name, user):
+        """
+        Valeur de la règle `name` pour `obj` : l'annotation si le queryset
+        l'a calculée, sinon la comparaison faite sur l'objet (objet créé ou
+        chargé hors du viewset).
+        """
+        value = getattr(obj, name, None)
+        if value is not None:
+            return value
+
+        *relations, last = cls.annotations[name].split("__")
+        for relation in relations:
+            obj = getattr(obj, relation)
+        return getattr(obj, f"{last}_id") == user.pk
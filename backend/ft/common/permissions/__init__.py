@@ -0,0 +1,6 @@
+# Permissions
+from .AnnotatedPermission import AnnotatedPermission
+
+__all__ = [
+    "AnnotatedPermission",
+]
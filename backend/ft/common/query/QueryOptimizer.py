@@ -0,0 +1,200 @@
+import logging
+import re
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+
+class PlanNode:
+    """
+    Ce qu'un serializer lit d'un modèle : ses colonnes, ses annotations, ses
+    prefetch déclarés et les relations suivies. `complete` est faux dès
+    qu'un champ lit quelque chose que l'on ne connaît pas : toutes les
+    colonnes du modèle sont alors chargées.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.columns = {model._meta.pk.name}
+        self.complete = True
+        self.annotations = {}
+        self.prefetches = []
+        self.children = {}
+        self.many = set()
+
+    def child(self, name):
+        field = self.model._meta.get_field(name)
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = PlanNode(field.related_model)
+        if field.many_to_many or field.one_to_many:
+            self.many.add(name)
+        if field.concrete and not field.many_to_many:
+            self.columns.add(name)
+        elif field.one_to_many:
+            node.columns.add(field.field.name)
+        return node
+
+    def add_path(self, path):
+        """Ajoute une colonne ou une relation lue, en notation `a__b__c`."""
+        node = self
+        *relations, last = path.split("__")
+        for name in relations:
+            node = node.child(name)
+        field = node.model._meta.get_field(last)
+        if field.is_relation:
+            node.child(last).complete = False
+        else:
+            node.columns.add(last)
+
+    def is_prefetched(self, name):
+        """Une relation est chargée à part si elle est multiple ou annotée."""
+        return name in self.many or bool(self.children[name].annotations)
+
+
+class QueryOptimizer:
+    """
+    Déduit d'un serializer le plan de chargement d'un queryset :
+    `select_related` pour les relations simples imbriquées,
+    `prefetch_related` pour les relations multiples ou annotées, `only()`
+    sur les colonnes réellement lues, plus les annotations et prefetch que
+    les serializers déclarent pour leurs champs calculés
+    (`Meta.query_plans`, voir `QueryPlan`).
+
+    Un champ calculé sans déclaration est signalé : erreur si
+    `QUERY_PLAN_STRICT` est actif, avertissement sinon. Un nouveau champ ne
+    peut donc pas réintroduire silencieusement des requêtes par ligne.
+    """
+
+    DISPLAY = re.compile(r"get_(\w+)_display")
+
+    _plans = {}
+
+    @classmethod
+    def optimize(cls, queryset, serializer_class):
+        """Applique à `queryset` le plan de chargement de `serializer_class`."""
+        if not issubclass(serializer_class, serializers.ModelSerializer):
+            return queryset
+        if not issubclass(queryset.model, serializer_class.Meta.model):
+            return queryset
+
+        node = cls._plans.get(serializer_class)
+        if node is None:
+            node = cls._plans[serializer_class] = cls().build(serializer_class())
+        return cls.apply(queryset, node)
+
+    def build(self, serializer, node=None):
+        node = node or PlanNode(serializer.Meta.model)
+        declared = getattr(serializer.Meta, "query_plans", {})
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            plan = declared.get(name)
+            if plan is not None:
+                for path in plan.fields:
+                    node.add_path(path)
+                node.annotations.update(plan.annotate)
+                node.prefetches.extend(plan.prefetch)
+            elif not self.add_field(node, field):
+                node.complete = False
+                self.undeclared(serializer, name)
+        return node
+
+    def add_field(self, node, field):
+        """Ajoute au plan ce que lit `field`. Renvoie False si c'est inconnu."""
+        if field.source == "*":
+            return False
+
+        *relations, last = field.source_attrs
+        for name in relations:
+            try:
+                if not node.model._meta.get_field(name).is_relation:
+                    return False
+            except FieldDoesNotExist:
+                return False
+            node = node.child(name)
+
+        try:
+            model_field = node.model._meta.get_field(last)
+        except FieldDoesNotExist:
+            match = self.DISPLAY.fullmatch(last)
+            if match and self.has_choices(node.model, match[1]):
+                node.columns.add(match[1])
+                return True
+            return False
+
+        if not model_field.is_relation:
+            node.columns.add(last)
+            return True
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        if isinstance(nested, serializers.ModelSerializer):
+            self.build(nested, node.child(last))
+        elif isinstance(field, serializers.PrimaryKeyRelatedField):
+            node.columns.add(last)
+        else:
+            node.child(last).complete = False
+        return True
+
+    @staticmethod
+    def has_choices(model, name):
+        try:
+            return bool(model._meta.get_field(name).choices)
+        except FieldDoesNotExist:
+            return False
+
+    @staticmethod
+    def undeclared(serializer, name):
+        message = (
+            f"{type(serializer).__name__}.{name} lit des données que "
+            f"l'optimiseur ne peut pas déduire : déclarez-les dans "
+            f"Meta.query_plans."
+        )
+        if settings.QUERY_PLAN_STRICT:
+            raise ImproperlyConfigured(message)
+        logger.warning(message)
+
+    @classmethod
+    def apply(cls, queryset, node):
+        select, only, prefetch = [], [], []
+        cls.collect(node, "", select, only, prefetch)
+
+        if node.annotations:
+            queryset = queryset.annotate(**node.annotations)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if node.complete:
+            queryset = queryset.only(*only)
+        return queryset
+
+    @classmethod
+    def collect(cls, node, prefix, select, only, prefetch):
+        if node.complete:
+            only.extend(f"{prefix}{column}" for column in node.columns)
+
+        for lookup in node.prefetches:
+            if isinstance(lookup, Prefetch):
+                lookup = Prefetch(
+                    f"{prefix}{lookup.prefetch_through}",
+                    queryset=lookup.queryset,
+                    to_attr=lookup.to_attr,
+                )
+            else:
+                lookup = f"{prefix}{lookup}"
+            prefetch.append(lookup)
+
+        for name, child in node.children.items():
+            path = f"{prefix}{name}"
+            if node.is_prefetched(name):
+                queryset = child.model._default_manager.all()
+                prefetch.append(Prefetch(path, queryset=cls.apply(queryset, child)))
+            else:
+                select.append(path)
+                cls.collect(child, f"{path}__", select, only, prefetch)
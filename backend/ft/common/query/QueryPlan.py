@@ -0,0 +1,17 @@
+class QueryPlan:
+    """
+    Besoins en base d'un champ de serializer que l'optimiseur ne peut pas
+    déduire seul : `SerializerMethodField`, propriété du modèle...
+
+    Un serializer les déclare dans `Meta.query_plans`, par nom de champ :
+
+    - `fields` : colonnes lues, éventuellement à travers des relations
+      (`"trip__price_per_seat"`) ;
+    - `annotate` : annotations à ajouter au queryset du modèle ;
+    - `prefetch` : lookups ou objets `Prefetch` relatifs au modèle.
+    """
+
+    def __init__(self, fields=(), annotate=None, prefetch=()):
+        self.fields = tuple(fields)
+        self.annotate = dict(annotate or {})
+        self.prefetch = tuple(prefetch)
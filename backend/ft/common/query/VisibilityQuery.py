@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+
+
+class VisibilityQuery:
+    """
+    Restreint un queryset aux lignes qu'un utilisateur peut voir par l'un
+    de plusieurs chemins (passager ou conducteur, demandeur ou hôte...).
+
+    Les chemins portent sur le modèle visé par `via` (la clé étrangère du
+    queryset), ou sur le modèle du queryset lui-même sans `via`. Deux plans
+    sont possibles :
+
+    - `union` : `via IN (branche 1 UNION ALL branche 2 ...)`, chaque branche
+      ne lisant que les clés primaires des lignes de l'utilisateur par ses
+      index ;
+    - `exists` : `EXISTS (...) OR EXISTS (...)` corrélé à chaque ligne.
+
+    Le plan par défaut, `VISIBILITY_STRATEGY`, a été choisi avec la commande
+    `benchmark_visibility`. Contrairement à `qs.filter(a) | qs.filter(b)`, ni
+    l'un ni l'autre ne joint toute la chaîne de relations dans la requête
+    principale.
+    """
+
+    STRATEGIES = ("union", "exists")
+
+    def __init__(self, *paths, via=None):
+        self.paths = paths
+        self.via = via
+
+    def apply(self, queryset, user, strategy=None):
+        strategy = strategy or settings.VISIBILITY_STRATEGY
+        if self.via is None:
+            model, target = queryset.model, "pk"
+        else:
+            model = queryset.model._meta.get_field(self.via).related_model
+            target = self.via
+
+        if strategy == "union":
+            branches = [
+                model.objects.filter(**{path: user.pk}).order_by().values("pk")
+                for path in self.paths
+            ]
+            union = branches[0].union(*branches[1:], all=True)
+            return queryset.filter(**{f"{target}__in": union})
+
+        if strategy == "exists":
+            condition = Q()
+            for path in self.paths:
+                condition |= Exists(
+                    model.objects.filter(pk=OuterRef(target), **{path: user.pk})
+                )
+            return queryset.filter(condition)
+
+        raise ValueError(f"Stratégie de visibilité inconnue : {strategy}")
@@ -0,0 +1,10 @@
+# Query
+from .QueryPlan import QueryPlan
+from .QueryOptimizer import QueryOptimizer
+from .VisibilityQuery import VisibilityQuery
+
+__all__ = [
+    "QueryPlan",
+    "QueryOptimizer",
+    "VisibilityQuery",
+]
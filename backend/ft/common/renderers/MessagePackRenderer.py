@@ -0,0 +1,28 @@
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer MessagePack (`application/msgpack`), format binaire compact
+    proposé aux clients mobiles par négociation de contenu (`Accept`) ou
+    avec `?format=msgpack`.
+
+    Les types non natifs (Decimal, dates, chaînes de traduction
+    paresseuses...) sont convertis comme en JSON par l'encodeur de DRF, pour
+    que les deux formats transportent les mêmes valeurs.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def __init__(self):
+        self.encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.encoder.default, datetime=False)
@@ -0,0 +1,45 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer JSON basé sur orjson, compatible octet pour octet avec le
+    `JSONRenderer` de DRF sur les réponses compactes.
+
+    Les types qu'orjson ne connaît pas ou encode différemment (Decimal, dates
+    avec fuseau, chaînes de traduction paresseuses, QuerySet...) passent par
+    l'encodeur de DRF. Les rendus indentés, utilisés par l'API navigable,
+    restent confiés au `JSONRenderer` standard. Sans orjson installé, le
+    renderer se comporte exactement comme `JSONRenderer`.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def __init__(self):
+        self.encoder = self.encoder_class()
+
+    def default(self, obj):
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+
+        # Même échappement que JSONRenderer pour rester un sous-ensemble
+        # strict de JavaScript.
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
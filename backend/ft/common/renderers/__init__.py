@@ -0,0 +1,8 @@
+# Renderers
+from .ORJSONRenderer import ORJSONRenderer
+from .MessagePackRenderer import MessagePackRenderer
+
+__all__ = [
+    "ORJSONRenderer",
+    "MessagePackRenderer",
+]
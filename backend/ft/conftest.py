@@ -3,6 +3,29 @@ from rest_framework.test import APIClient
 from ft.user.models import User
 
 
+@pytest.fixture(autouse=True)
+def static_storage(settings):
+    """
+    Fixture qui remplace le stockage statique à manifeste par le stockage
+    simple : les tests tournent sans `collectstatic`.
+    """
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def strict_query_plans(settings):
+    """
+    Fixture qui fait échouer les tests dès qu'un champ de serializer lit des
+    données absentes de son plan de chargement.
+    """
+    settings.QUERY_PLAN_STRICT = True
+
+
 @pytest.fixture
 def api_client():
     """Fixture qui fournit un client API REST pour tester les endpoints."""
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    name = "ft.diagnostics"
+    verbose_name = "Diagnostics"
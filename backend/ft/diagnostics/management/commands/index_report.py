@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = (
+        "Signale les index inutilisés et les tables lues surtout par parcours "
+        "séquentiel, d'après pg_stat_user_indexes et pg_stat_user_tables."
+    )
+
+    UNUSED_INDEXES_SQL = """
+        SELECT s.relname, s.indexrelname, s.idx_scan,
+               pg_size_pretty(pg_relation_size(s.indexrelid))
+        FROM pg_stat_user_indexes s
+        JOIN pg_index i ON i.indexrelid = s.indexrelid
+        WHERE s.idx_scan <= %s
+          AND NOT i.indisunique
+          AND NOT i.indisprimary
+        ORDER BY pg_relation_size(s.indexrelid) DESC, s.relname, s.indexrelname
+    """
+
+    SEQ_SCANNED_TABLES_SQL = """
+        SELECT relname, seq_scan, seq_tup_read, COALESCE(idx_scan, 0), n_live_tup
+        FROM pg_stat_user_tables
+        WHERE n_live_tup >= %s
+          AND seq_scan > COALESCE(idx_scan, 0)
+        ORDER BY seq_tup_read DESC, relname
+    """
+
+    STATS_RESET_SQL = """
+        SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-scans",
+            type=int,
+            default=0,
+            help="Un index est inutilisé s'il a servi au plus ce nombre de fois",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Taille minimale d'une table pour signaler ses parcours séquentiels",
+        )
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cursor:
+            cursor.execute(self.STATS_RESET_SQL)
+            row = cursor.fetchone()
+            cursor.execute(self.UNUSED_INDEXES_SQL, [options["max_scans"]])
+            unused = cursor.fetchall()
+            cursor.execute(self.SEQ_SCANNED_TABLES_SQL, [options["min_rows"]])
+            scanned = cursor.fetchall()
+
+        stats_reset = row[0] if row else None
+        self.stdout.write(
+            "Statistiques depuis "
+            + (f"le {stats_reset:%d/%m/%Y %H:%M}" if stats_reset else "la création")
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Index inutilisés"))
+        for table, index, scans, size in unused:
+            self.stdout.write(f"  {table}.{index} : {scans} lecture(s), {size}")
+        if not unused:
+            self.stdout.write("  Aucun")
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING("Tables lues par parcours séquentiel")
+        )
+        for table, seq_scan, seq_tup_read, idx_scan, rows in scanned:
+            self.stdout.write(
+                f"  {table} : {seq_scan} parcours séquentiel(s) "
+                f"({seq_tup_read} ligne(s) lue(s)) contre {idx_scan} par index, "
+                f"{rows} ligne(s)"
+            )
+        if not scanned:
+            self.stdout.write("  Aucune")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(unused)} index inutilisé(s), "
+                f"{len(scanned)} table(s) à indexer"
+            )
+        )
@@ -0,0 +1,36 @@
+import tracemalloc
+
+from django.conf import settings
+
+from ft.diagnostics.services import MemoryTracker
+
+
+class MemoryTrackingMiddleware:
+    """
+    Mesure, si `MEMORY_TRACKING` est activé, la croissance du RSS et le pic
+    d'allocations Python de chaque requête, rattachés à la vue qui l'a
+    traitée. Les requêtes sans route résolue (404) sont regroupées sous
+    `UNRESOLVED` pour que le nombre d'entrées reste borné par celui des
+    routes.
+    """
+
+    UNRESOLVED = "<unresolved>"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.MEMORY_TRACKING:
+            return self.get_response(request)
+
+        MemoryTracker.start()
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = MemoryTracker.rss()
+
+        response = self.get_response(request)
+
+        traced_peak = tracemalloc.get_traced_memory()[1] - traced_before
+        view = getattr(request.resolver_match, "view_name", None) or self.UNRESOLVED
+        MemoryTracker.record(view, MemoryTracker.rss() - rss_before, traced_peak)
+        return response
@@ -0,0 +1,80 @@
+import datetime
+import uuid
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import timezone
+
+from ft.diagnostics.models import RequestProfile
+from ft.diagnostics.services import SamplingProfiler
+from ft.diagnostics.throttling import ProfilingThrottle
+
+
+class ProfilingMiddleware:
+    """
+    Profile à la demande une requête d'un membre du staff.
+
+    Le profil est demandé par l'en-tête `X-Profile` ou le paramètre
+    `?profile=`. Avec la valeur `inline`, la réponse est remplacée par les
+    piles au format « collapsed » ; sinon le profil est enregistré en base,
+    donc consultable depuis tous les workers, et son identifiant renvoyé
+    dans `X-Profile-Id` ; les profils expirés sont purgés à chaque
+    enregistrement. Dans les deux cas, l'en-tête `Server-Timing` donne la
+    répartition du temps entre l'ORM, les serializers, les permissions et
+    le rendu.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = request.headers.get("X-Profile") or request.GET.get("profile")
+        if not mode or not self.allowed(request):
+            return self.get_response(request)
+
+        profiler = SamplingProfiler(interval=settings.PROFILING_INTERVAL_MS / 1000)
+        with profiler:
+            response = self.get_response(request)
+
+        summary = profiler.summary()
+        timing = ", ".join(f"{name};dur={ms}" for name, ms in summary.items())
+
+        if mode == "inline":
+            response = HttpResponse(
+                profiler.collapsed(), content_type="text/plain; charset=utf-8"
+            )
+        else:
+            now = timezone.now()
+            RequestProfile.objects.filter(expires_at__lte=now).delete()
+            profile = RequestProfile.objects.create(
+                id=uuid.uuid4().hex,
+                method=request.method,
+                path=request.get_full_path(),
+                view=getattr(request.resolver_match, "view_name", None),
+                status=response.status_code,
+                duration_ms=round(profiler.duration * 1000, 2),
+                samples=profiler.samples,
+                summary=summary,
+                collapsed=profiler.collapsed(),
+                expires_at=now + datetime.timedelta(seconds=settings.PROFILING_TTL),
+            )
+            response["X-Profile-Id"] = profile.id
+
+        if timing:
+            response["Server-Timing"] = timing
+        return response
+
+    @staticmethod
+    def allowed(request):
+        if not settings.PROFILING_ENABLED:
+            return False
+        if not request.user.is_authenticated or not request.user.is_staff:
+            return False
+        return ProfilingThrottle().allow_request(request, None)
+
+    @staticmethod
+    def get_profile(profile_id):
+        profile = RequestProfile.objects.filter(
+            pk=profile_id, expires_at__gt=timezone.now()
+        ).first()
+        return profile.as_dict() if profile else None
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.db import connection
+
+from ft.diagnostics.services import SlowQueryLog
+
+
+class SlowQueryMiddleware:
+    """
+    Active le journal des requêtes lentes pendant le traitement de chaque
+    requête HTTP, si `SLOW_QUERY_LOG` est activé.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.SLOW_QUERY_LOG:
+            return self.get_response(request)
+
+        log = SlowQueryLog(path=request.path)
+        with connection.execute_wrapper(log):
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if settings.SLOW_QUERY_LOG:
+            for wrapper in connection.execute_wrappers:
+                if isinstance(wrapper, SlowQueryLog):
+                    wrapper.view = request.resolver_match.view_name
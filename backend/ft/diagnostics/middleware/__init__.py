@@ -0,0 +1,10 @@
+# Middleware
+from .SlowQueryMiddleware import SlowQueryMiddleware
+from .ProfilingMiddleware import ProfilingMiddleware
+from .MemoryTrackingMiddleware import MemoryTrackingMiddleware
+
+__all__ = [
+    "SlowQueryMiddleware",
+    "ProfilingMiddleware",
+    "MemoryTrackingMiddleware",
+]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = []
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_available_extensions
+                    WHERE name = 'pg_stat_statements'
+                ) THEN
+                    CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
+                END IF;
+            END
+            $$;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
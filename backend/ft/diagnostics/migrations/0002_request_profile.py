@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("diagnostics", "0001_pg_stat_statements"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestProfile",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        help_text="Identifiant renvoyé dans l'en-tête X-Profile-Id",
+                        max_length=32,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Identifiant",
+                    ),
+                ),
+                (
+                    "method",
+                    models.CharField(
+                        help_text="Méthode HTTP de la requête",
+                        max_length=10,
+                        verbose_name="Méthode",
+                    ),
+                ),
+                (
+                    "path",
+                    models.TextField(
+                        help_text="Chemin de la requête, avec ses paramètres",
+                        verbose_name="Chemin",
+                    ),
+                ),
+                (
+                    "view",
+                    models.CharField(
+                        blank=True,
+                        help_text="Nom de la route résolue",
+                        max_length=200,
+                        null=True,
+                        verbose_name="Vue",
+                    ),
+                ),
+                (
+                    "status",
+                    models.PositiveSmallIntegerField(
+                        help_text="Code HTTP de la réponse", verbose_name="Statut"
+                    ),
+                ),
+                (
+                    "duration_ms",
+                    models.FloatField(
+                        help_text="Durée de la requête profilée",
+                        verbose_name="Durée (ms)",
+                    ),
+                ),
+                (
+                    "samples",
+                    models.PositiveIntegerField(
+                        help_text="Nombre de piles échantillonnées",
+                        verbose_name="Échantillons",
+                    ),
+                ),
+                (
+                    "summary",
+                    models.JSONField(
+                        help_text="Temps passé dans l'ORM, les serializers, les permissions...",
+                        verbose_name="Répartition",
+                    ),
+                ),
+                (
+                    "collapsed",
+                    models.TextField(
+                        help_text="Piles au format « collapsed »", verbose_name="Piles"
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="Date à partir de laquelle le profil n'est plus consultable",
+                        verbose_name="Date d'expiration",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Profil de requête",
+                "verbose_name_plural": "Profils de requête",
+            },
+        ),
+    ]
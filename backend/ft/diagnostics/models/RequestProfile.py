@@ -0,0 +1,78 @@
+from django.db import models
+
+
+class RequestProfile(models.Model):
+    """
+    Profil d'une requête enregistré par le ProfilingMiddleware. Il est
+    conservé en base, et non dans le cache local du worker, pour être
+    consultable depuis n'importe quel worker ou réplica ; il expire après
+    `PROFILING_TTL` secondes.
+    """
+
+    id = models.CharField(
+        primary_key=True,
+        max_length=32,
+        verbose_name="Identifiant",
+        help_text="Identifiant renvoyé dans l'en-tête X-Profile-Id",
+    )
+    method = models.CharField(
+        max_length=10,
+        verbose_name="Méthode",
+        help_text="Méthode HTTP de la requête",
+    )
+    path = models.TextField(
+        verbose_name="Chemin",
+        help_text="Chemin de la requête, avec ses paramètres",
+    )
+    view = models.CharField(
+        max_length=200,
+        null=True,
+        blank=True,
+        verbose_name="Vue",
+        help_text="Nom de la route résolue",
+    )
+    status = models.PositiveSmallIntegerField(
+        verbose_name="Statut",
+        help_text="Code HTTP de la réponse",
+    )
+    duration_ms = models.FloatField(
+        verbose_name="Durée (ms)",
+        help_text="Durée de la requête profilée",
+    )
+    samples = models.PositiveIntegerField(
+        verbose_name="Échantillons",
+        help_text="Nombre de piles échantillonnées",
+    )
+    summary = models.JSONField(
+        verbose_name="Répartition",
+        help_text="Temps passé dans l'ORM, les serializers, les permissions...",
+    )
+    collapsed = models.TextField(
+        verbose_name="Piles",
+        help_text="Piles au format « collapsed »",
+    )
+    expires_at = models.DateTimeField(
+        db_index=True,
+        verbose_name="Date d'expiration",
+        help_text="Date à partir de laquelle le profil n'est plus consultable",
+    )
+
+    class Meta:
+        verbose_name = "Profil de requête"
+        verbose_name_plural = "Profils de requête"
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.id})"
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "view": self.view,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "summary": self.summary,
+            "collapsed": self.collapsed,
+        }
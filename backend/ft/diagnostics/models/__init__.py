@@ -0,0 +1,6 @@
+# Models
+from .RequestProfile import RequestProfile
+
+__all__ = [
+    "RequestProfile",
+]
@@ -0,0 +1,142 @@
+import os
+import resource
+import threading
+import tracemalloc
+
+from django.conf import settings
+
+
+class MemoryTracker:
+    """
+    Suivi mémoire d'un worker, tenu au niveau du processus.
+
+    Pour chaque vue, on cumule la croissance du RSS et le pic d'allocations
+    Python (tracemalloc) observés pendant ses requêtes. Un instantané
+    tracemalloc de référence est pris au démarrage du suivi : la
+    comparaison avec l'état courant montre les lignes dont les allocations
+    ont grossi depuis, c'est-à-dire ce qui retient la mémoire.
+
+    Les mesures par requête supposent un worker qui traite une requête à la
+    fois (workers `sync` de gunicorn) ; chaque worker a ses propres chiffres.
+    """
+
+    IGNORED = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+    _lock = threading.Lock()
+    _baseline = None
+    _endpoints = {}
+
+    @classmethod
+    def start(cls):
+        """Démarre tracemalloc et prend l'instantané de référence."""
+        with cls._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(settings.MEMORY_TRACKING_FRAMES)
+            if cls._baseline is None:
+                cls._baseline = cls.snapshot()
+
+    @classmethod
+    def reset(cls):
+        """Reprend un instantané de référence et efface les statistiques."""
+        with cls._lock:
+            cls._baseline = cls.snapshot() if tracemalloc.is_tracing() else None
+            cls._endpoints = {}
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            tracemalloc.stop()
+            cls._baseline = None
+            cls._endpoints = {}
+
+    @staticmethod
+    def rss():
+        """RSS courant du processus, en octets."""
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    @classmethod
+    def snapshot(cls):
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, pattern) for pattern in cls.IGNORED]
+        )
+
+    @classmethod
+    def record(cls, view, rss_growth, traced_peak):
+        with cls._lock:
+            stats = cls._endpoints.setdefault(
+                view,
+                {
+                    "view": view,
+                    "requests": 0,
+                    "rss_growth_bytes": 0,
+                    "max_rss_growth_bytes": 0,
+                    "max_traced_peak_bytes": 0,
+                },
+            )
+            stats["requests"] += 1
+            stats["rss_growth_bytes"] += rss_growth
+            stats["max_rss_growth_bytes"] = max(
+                stats["max_rss_growth_bytes"], rss_growth
+            )
+            stats["max_traced_peak_bytes"] = max(
+                stats["max_traced_peak_bytes"], traced_peak
+            )
+
+    @classmethod
+    def endpoints(cls):
+        """Statistiques par vue, de la plus forte croissance du RSS."""
+        with cls._lock:
+            stats = [dict(item) for item in cls._endpoints.values()]
+        return sorted(stats, key=lambda item: -item["rss_growth_bytes"])
+
+    @classmethod
+    def top(cls, limit=20):
+        """Lignes qui retiennent actuellement le plus de mémoire."""
+        if not tracemalloc.is_tracing():
+            return []
+        return [
+            {
+                "site": cls.site(stat.traceback),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in cls.snapshot().statistics("lineno")[:limit]
+        ]
+
+    @classmethod
+    def diff(cls, limit=20):
+        """Lignes dont les allocations ont le plus grossi depuis la référence."""
+        if not tracemalloc.is_tracing() or cls._baseline is None:
+            return []
+        return [
+            {
+                "site": cls.site(stat.traceback),
+                "size_diff_bytes": stat.size_diff,
+                "size_bytes": stat.size,
+                "count_diff": stat.count_diff,
+            }
+            for stat in cls.snapshot().compare_to(cls._baseline, "lineno")[:limit]
+        ]
+
+    @staticmethod
+    def site(traceback):
+        frame = traceback[0]
+        return f"{frame.filename}:{frame.lineno}"
+
+    @classmethod
+    def report(cls, limit=20):
+        traced, peak = tracemalloc.get_traced_memory()
+        return {
+            "pid": os.getpid(),
+            "tracing": tracemalloc.is_tracing(),
+            "rss_bytes": cls.rss(),
+            "traced_bytes": traced,
+            "traced_peak_bytes": peak,
+            "endpoints": cls.endpoints(),
+            "top": cls.top(limit),
+            "diff": cls.diff(limit),
+        }
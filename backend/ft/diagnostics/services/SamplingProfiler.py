@@ -0,0 +1,109 @@
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    Profileur par échantillonnage d'un seul thread, sans dépendance.
+
+    Un thread secondaire relève la pile du thread profilé toutes les
+    `interval` secondes. Les piles sont agrégées au format « collapsed »
+    (une ligne `racine;...;feuille nombre` par pile), lisible par
+    flamegraph.pl, speedscope ou inferno. Le temps est aussi réparti entre
+    l'ORM, les serializers, les permissions et le rendu, d'après le module du
+    cadre le plus profond qui relève de l'une de ces catégories.
+    """
+
+    CATEGORIES = (
+        ("orm", ("django.db",)),
+        ("rendering", ("rest_framework.renderers", "ft.common.renderers")),
+        ("permissions", ("rest_framework.permissions", "ft.event.permissions")),
+        (
+            "serializers",
+            ("rest_framework.serializers", "rest_framework.fields", ".serializers."),
+        ),
+    )
+    OTHER = "other"
+
+    def __init__(self, interval=0.005, max_depth=128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks = Counter()
+        self.categories = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._target = None
+        self._started = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self, thread_id=None):
+        self._target = thread_id or threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="ft-sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self.sample(frame)
+
+    def sample(self, frame):
+        labels = []
+        category = None
+        while frame is not None and len(labels) < self.max_depth:
+            module = frame.f_globals.get("__name__", "?")
+            if category is None:
+                category = self.categorize(module)
+            labels.append(f"{module}:{frame.f_code.co_qualname}")
+            frame = frame.f_back
+        labels.reverse()
+
+        self.stacks[";".join(labels)] += 1
+        self.categories[category or self.OTHER] += 1
+        self.samples += 1
+
+    @classmethod
+    def categorize(cls, module):
+        dotted = f".{module}."
+        for name, prefixes in cls.CATEGORIES:
+            for prefix in prefixes:
+                if prefix.startswith("."):
+                    if prefix in dotted:
+                        return name
+                elif module == prefix or module.startswith(f"{prefix}."):
+                    return name
+        return None
+
+    def collapsed(self):
+        """Piles agrégées au format « collapsed », les plus fréquentes d'abord."""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self):
+        """Temps estimé (ms) passé dans chaque catégorie."""
+        if not self.samples:
+            return {}
+        per_sample = self.duration * 1000 / self.samples
+        return {
+            name: round(count * per_sample, 2)
+            for name, count in self.categories.most_common()
+        }
@@ -0,0 +1,145 @@
+import os
+import random
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+import ft
+
+PROJECT_ROOT = str(Path(ft.__file__).resolve().parent)
+DIAGNOSTICS_ROOT = str(Path(__file__).resolve().parent.parent)
+SOURCE_ROOT = os.path.dirname(PROJECT_ROOT)
+
+
+class SlowQueryLog:
+    """
+    Journal des requêtes SQL lentes, tenu dans un tampon circulaire local au
+    processus.
+
+    Une instance sert d'`execute_wrapper` Django : chaque requête qui dépasse
+    `SLOW_QUERY_THRESHOLD_MS` est enregistrée avec son SQL, ses paramètres,
+    la vue en cours et la ligne du projet qui l'a déclenchée (vue,
+    serializer, service...). Une fraction `SLOW_QUERY_EXPLAIN_RATE` des
+    SELECT lents est rejouée avec `EXPLAIN (ANALYZE, BUFFERS)` pour capturer
+    le plan réellement exécuté.
+    """
+
+    _lock = threading.Lock()
+    _entries = None
+
+    def __init__(self, view=None, path=None):
+        self.view = view
+        self.path = path
+        self.explaining = False
+
+    @classmethod
+    def buffer(cls):
+        with cls._lock:
+            if cls._entries is None:
+                cls._entries = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+            return cls._entries
+
+    @classmethod
+    def entries(cls):
+        """Requêtes lentes enregistrées, de la plus récente à la plus ancienne."""
+        buffer = cls.buffer()
+        with cls._lock:
+            return list(reversed(buffer))
+
+    @classmethod
+    def clear(cls):
+        buffer = cls.buffer()
+        with cls._lock:
+            buffer.clear()
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.explaining:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration = (time.perf_counter() - start) * 1000
+
+        if duration >= settings.SLOW_QUERY_THRESHOLD_MS:
+            self.record(sql, params, many, duration)
+        return result
+
+    def record(self, sql, params, many, duration):
+        entry = {
+            "at": timezone.now().isoformat(),
+            "duration_ms": round(duration, 2),
+            "sql": sql,
+            "params": None if many else self.format_params(params),
+            "view": self.view,
+            "path": self.path,
+            "call_site": self.call_site(),
+            "plan": None,
+        }
+        if not many and self.should_explain(sql):
+            entry["plan"] = self.explain(sql, params)
+
+        buffer = self.buffer()
+        with self._lock:
+            buffer.append(entry)
+
+    @staticmethod
+    def format_params(params):
+        if params is None:
+            return None
+        if isinstance(params, dict):
+            return {key: SlowQueryLog.format_param(v) for key, v in params.items()}
+        return [SlowQueryLog.format_param(value) for value in params]
+
+    @staticmethod
+    def format_param(value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
+
+    @staticmethod
+    def call_site():
+        """Pile des appels du projet ayant mené à la requête, du plus proche."""
+        frames = [
+            f"{os.path.relpath(frame.filename, SOURCE_ROOT)}:{frame.lineno} "
+            f"in {frame.name}"
+            for frame in reversed(traceback.extract_stack())
+            if frame.filename.startswith(PROJECT_ROOT)
+            and not frame.filename.startswith(DIAGNOSTICS_ROOT)
+        ]
+        return frames[:5]
+
+    @staticmethod
+    def should_explain(sql):
+        statement = sql.lstrip().upper()
+        if not statement.startswith("SELECT") or " FOR UPDATE" in statement:
+            return False
+        return random.random() < settings.SLOW_QUERY_EXPLAIN_RATE
+
+    def explain(self, sql, params):
+        """
+        Rejoue la requête sous `EXPLAIN (ANALYZE, BUFFERS)`. Un échec ne doit
+        jamais casser la requête d'origine : le plan est alors omis.
+        """
+        self.explaining = True
+        try:
+            with connection.cursor() as explain_cursor:
+                if connection.in_atomic_block:
+                    sid = connection.savepoint()
+                try:
+                    explain_cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                    plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+                except Exception:
+                    if connection.in_atomic_block:
+                        connection.savepoint_rollback(sid)
+                    return None
+                if connection.in_atomic_block:
+                    connection.savepoint_commit(sid)
+                return plan
+        finally:
+            self.explaining = False
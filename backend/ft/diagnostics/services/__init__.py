@@ -0,0 +1,10 @@
+# Services
+from .SlowQueryLog import SlowQueryLog
+from .SamplingProfiler import SamplingProfiler
+from .MemoryTracker import MemoryTracker
+
+__all__ = [
+    "SlowQueryLog",
+    "SamplingProfiler",
+    "MemoryTracker",
+]
@@ -0,0 +1,27 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestIndexReportCommand:
+    """Tests pour la commande index_report."""
+
+    def test_reports_unused_indexes(self):
+        """Test que les index jamais lus de la base de test sont signalés."""
+        out = StringIO()
+
+        call_command("index_report", stdout=out)
+
+        output = out.getvalue()
+        assert "Index inutilisés" in output
+        assert "Tables lues par parcours séquentiel" in output
+        assert "index inutilisé(s)" in output
+
+    def test_min_rows_filters_small_tables(self):
+        """Test qu'un seuil élevé écarte toutes les tables."""
+        out = StringIO()
+
+        call_command("index_report", "--min-rows", "1000000000", stdout=out)
+
+        assert "0 table(s) à indexer" in out.getvalue()
@@ -0,0 +1,68 @@
+import pytest
+
+from ft.diagnostics.services import MemoryTracker
+
+
+@pytest.fixture(autouse=True)
+def tracker(settings):
+    settings.MEMORY_TRACKING_FRAMES = 1
+    MemoryTracker.start()
+    yield MemoryTracker
+    MemoryTracker.stop()
+
+
+class TestMemoryTracker:
+    """Tests pour le MemoryTracker."""
+
+    def test_rss(self):
+        """Test que le RSS du processus est mesuré."""
+        assert MemoryTracker.rss() > 0
+
+    def test_diff_shows_retained_allocations(self):
+        """Test que la comparaison montre la ligne qui retient de la mémoire."""
+        retained = [bytes(1024) for _ in range(2000)]
+
+        diff = MemoryTracker.diff(limit=5)
+
+        assert diff[0]["site"].startswith(__file__)
+        assert diff[0]["size_diff_bytes"] >= 2000 * 1024
+        assert retained
+
+    def test_top(self):
+        """Test que les lignes qui retiennent le plus de mémoire sont listées."""
+        retained = [bytes(1024) for _ in range(2000)]
+
+        top = MemoryTracker.top(limit=50)
+
+        assert any(item["site"].startswith(__file__) for item in top)
+        assert retained
+
+    def test_record_endpoints(self):
+        """Test que les mesures sont cumulées par vue."""
+        MemoryTracker.record("event-list", 100, 10)
+        MemoryTracker.record("event-list", 300, 50)
+        MemoryTracker.record("event-detail", 500, 5)
+
+        endpoints = MemoryTracker.endpoints()
+
+        assert [item["view"] for item in endpoints] == ["event-detail", "event-list"]
+        assert endpoints[1] == {
+            "view": "event-list",
+            "requests": 2,
+            "rss_growth_bytes": 400,
+            "max_rss_growth_bytes": 300,
+            "max_traced_peak_bytes": 50,
+        }
+
+    def test_reset(self):
+        """Test que reset efface les statistiques et la référence."""
+        MemoryTracker.record("event-list", 100, 10)
+        retained = [bytes(1024) for _ in range(2000)]
+
+        MemoryTracker.reset()
+
+        assert MemoryTracker.endpoints() == []
+        assert all(
+            item["size_diff_bytes"] < 2000 * 1024 for item in MemoryTracker.diff()
+        )
+        assert retained
@@ -0,0 +1,49 @@
+import time
+
+from ft.diagnostics.services import SamplingProfiler
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler:
+    """Tests pour le SamplingProfiler."""
+
+    def test_collects_collapsed_stacks(self):
+        """Test que les piles du thread profilé sont agrégées."""
+        with SamplingProfiler(interval=0.001) as profiler:
+            busy(0.05)
+
+        assert profiler.samples > 0
+        collapsed = profiler.collapsed()
+        assert "test_sampling_profiler:busy" in collapsed
+        stack, count = collapsed.splitlines()[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+    def test_summary_splits_time_by_category(self):
+        """Test que le temps est réparti entre les catégories."""
+        with SamplingProfiler(interval=0.001) as profiler:
+            busy(0.02)
+
+        summary = profiler.summary()
+        assert "other" in summary
+        assert sum(summary.values()) > 0
+
+    def test_categorize(self):
+        """Test du rattachement des modules aux catégories."""
+        assert SamplingProfiler.categorize("django.db.models.query") == "orm"
+        assert (
+            SamplingProfiler.categorize("ft.event.serializers.EventSerializer")
+            == "serializers"
+        )
+        assert SamplingProfiler.categorize("ft.event.permissions") == "permissions"
+        assert (
+            SamplingProfiler.categorize("ft.common.renderers.ORJSONRenderer")
+            == "rendering"
+        )
+        assert SamplingProfiler.categorize("django.dbx") is None
+        assert SamplingProfiler.categorize("ft.event.views.EventViewSet") is None
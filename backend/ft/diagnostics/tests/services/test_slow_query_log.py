@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection
+
+from ft.diagnostics.services import SlowQueryLog
+from ft.user.models import User
+
+
+@pytest.fixture(autouse=True)
+def slow_query_settings(settings):
+    settings.SLOW_QUERY_THRESHOLD_MS = 0
+    settings.SLOW_QUERY_EXPLAIN_RATE = 0
+    SlowQueryLog._entries = None
+    yield settings
+    SlowQueryLog._entries = None
+
+
+@pytest.mark.django_db
+class TestSlowQueryLog:
+    """Tests pour le journal des requêtes lentes."""
+
+    def test_records_queries_over_threshold(self):
+        """Test qu'une requête au-dessus du seuil est enregistrée."""
+        with connection.execute_wrapper(SlowQueryLog(view="user-list", path="/x")):
+            list(User.objects.filter(email="nobody@example.com"))
+
+        entries = SlowQueryLog.entries()
+        assert len(entries) == 1
+        entry = entries[0]
+        assert "user_user" in entry["sql"]
+        assert entry["params"] == ["nobody@example.com"]
+        assert entry["view"] == "user-list"
+        assert entry["path"] == "/x"
+        assert entry["plan"] is None
+        assert not any("ft/diagnostics" in frame for frame in entry["call_site"])
+
+    def test_ignores_fast_queries(self, slow_query_settings):
+        """Test que les requêtes sous le seuil ne sont pas enregistrées."""
+        slow_query_settings.SLOW_QUERY_THRESHOLD_MS = 60_000
+
+        with connection.execute_wrapper(SlowQueryLog()):
+            list(User.objects.all())
+
+        assert SlowQueryLog.entries() == []
+
+    def test_captures_explain_plan(self, slow_query_settings):
+        """Test que le plan EXPLAIN ANALYZE est capturé pour les SELECT."""
+        slow_query_settings.SLOW_QUERY_EXPLAIN_RATE = 1
+
+        with connection.execute_wrapper(SlowQueryLog()):
+            list(User.objects.filter(email="nobody@example.com"))
+
+        plan = SlowQueryLog.entries()[0]["plan"]
+        assert "actual time" in plan
+        assert "Buffers" in plan or "Planning" in plan
+
+    def test_failed_explain_keeps_transaction_usable(self, slow_query_settings):
+        """Test qu'un EXPLAIN en échec n'interrompt pas la transaction."""
+        slow_query_settings.SLOW_QUERY_EXPLAIN_RATE = 1
+        log = SlowQueryLog()
+
+        assert log.explain("SELECT * FROM missing_table", None) is None
+        assert User.objects.count() >= 0
+
+    def test_buffer_is_bounded(self, slow_query_settings):
+        """Test que le tampon circulaire garde les entrées les plus récentes."""
+        slow_query_settings.SLOW_QUERY_BUFFER_SIZE = 3
+
+        with connection.execute_wrapper(SlowQueryLog()):
+            for index in range(5):
+                list(User.objects.filter(pk=index))
+
+        entries = SlowQueryLog.entries()
+        assert len(entries) == 3
+        assert [entry["params"] for entry in entries] == [[4], [3], [2]]
@@ -0,0 +1,74 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from ft.diagnostics.middleware import MemoryTrackingMiddleware
+from ft.diagnostics.services import MemoryTracker
+
+
+@pytest.fixture(autouse=True)
+def memory_settings(settings):
+    settings.MEMORY_TRACKING = True
+    yield settings
+    MemoryTracker.stop()
+
+
+@pytest.mark.django_db
+class TestMemoryView:
+    """Tests pour le MemoryView et le MemoryTrackingMiddleware."""
+
+    def test_report(self, admin_client):
+        """Test que les requêtes suivies apparaissent dans le rapport."""
+        admin_client.get(reverse("event-list"))
+        admin_client.get(reverse("event-list"))
+
+        response = admin_client.get(reverse("diagnostics-memory"), {"limit": 5})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["tracing"] is True
+        assert response.data["rss_bytes"] > 0
+        assert len(response.data["top"]) <= 5
+        event_list = next(
+            item for item in response.data["endpoints"] if item["view"] == "event-list"
+        )
+        assert event_list["requests"] == 2
+        assert event_list["max_traced_peak_bytes"] > 0
+
+    def test_unresolved_paths_share_one_entry(self, admin_client):
+        """Test que les chemins sans route sont regroupés en une seule entrée."""
+        admin_client.get("/missing/a/")
+        admin_client.get("/missing/b/")
+
+        views = [item["view"] for item in MemoryTracker.endpoints()]
+
+        assert views == [MemoryTrackingMiddleware.UNRESOLVED]
+        assert MemoryTracker.endpoints()[0]["requests"] == 2
+
+    @pytest.mark.parametrize("limit", ["abc", "0", "-5", "201"])
+    def test_invalid_limit(self, admin_client, limit):
+        """Test qu'une limite invalide renvoie 400."""
+        response = admin_client.get(reverse("diagnostics-memory"), {"limit": limit})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "limit" in response.json()
+
+    def test_reset(self, admin_client):
+        """Test que DELETE efface les statistiques."""
+        admin_client.get(reverse("event-list"))
+
+        response = admin_client.delete(reverse("diagnostics-memory"))
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert [item["view"] for item in MemoryTracker.endpoints()] == [
+            "diagnostics-memory"
+        ]
+
+    def test_requires_staff(self, api_client, user):
+        """Test qu'un utilisateur non staff ne peut pas consulter le rapport."""
+        user.is_staff = False
+        user.save()
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("diagnostics-memory"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,139 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ft.diagnostics.models import RequestProfile
+from ft.diagnostics.throttling import ProfilingThrottle
+from ft.event.models import Event
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(settings, monkeypatch):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_INTERVAL_MS = 1
+    monkeypatch.setattr(ProfilingThrottle, "THROTTLE_RATES", {"profiling": "3/hour"})
+    cache.clear()
+    yield settings
+    cache.clear()
+
+
+@pytest.fixture
+def event(db):
+    return Event.objects.create(
+        name="Congrès",
+        location="Paris",
+        start_date=timezone.now() + datetime.timedelta(days=30),
+        end_date=timezone.now() + datetime.timedelta(days=32),
+        type="CONGRESS",
+    )
+
+
+@pytest.mark.django_db
+class TestProfileView:
+    """Tests pour le ProfilingMiddleware et le ProfileView."""
+
+    def test_stores_profile(self, api_client, admin_user, event):
+        """Test qu'une requête profilée renvoie l'identifiant de son profil."""
+        api_client.force_login(admin_user)
+
+        response = api_client.get(
+            reverse("event-detail", args=[event.pk]), HTTP_X_PROFILE="1"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Congrès"
+        profile_id = response["X-Profile-Id"]
+
+        response = api_client.get(reverse("diagnostics-profile", args=[profile_id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["view"] == "event-detail"
+        assert response.data["status"] == 200
+        assert response.data["samples"] == sum(
+            int(line.rsplit(" ", 1)[1])
+            for line in response.data["collapsed"].splitlines()
+        )
+
+    def test_raw_profile(self, api_client, admin_user, event):
+        """Test que `?raw=1` renvoie les piles au format texte."""
+        api_client.force_login(admin_user)
+        response = api_client.get(
+            reverse("event-detail", args=[event.pk]), {"profile": "1"}
+        )
+
+        response = api_client.get(
+            reverse("diagnostics-profile", args=[response["X-Profile-Id"]]),
+            {"raw": "1"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+
+    def test_inline_profile(self, api_client, admin_user, event):
+        """Test que le mode `inline` remplace la réponse par le profil."""
+        api_client.force_login(admin_user)
+
+        response = api_client.get(
+            reverse("event-detail", args=[event.pk]), HTTP_X_PROFILE="inline"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        assert "X-Profile-Id" not in response
+
+    def test_ignored_for_non_staff(self, api_client, user, event):
+        """Test que le drapeau est ignoré pour un utilisateur non staff."""
+        user.is_staff = False
+        user.save()
+        api_client.force_login(user)
+
+        response = api_client.get(
+            reverse("event-detail", args=[event.pk]), HTTP_X_PROFILE="1"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Profile-Id" not in response
+
+    def test_ignored_when_disabled(self, api_client, admin_user, event, settings):
+        """Test que le drapeau est ignoré quand le profilage est désactivé."""
+        settings.PROFILING_ENABLED = False
+        api_client.force_login(admin_user)
+
+        response = api_client.get(
+            reverse("event-detail", args=[event.pk]), HTTP_X_PROFILE="1"
+        )
+
+        assert "X-Profile-Id" not in response
+
+    def test_throttled(self, api_client, admin_user, event):
+        """Test que le nombre de requêtes profilées est limité."""
+        api_client.force_login(admin_user)
+        url = reverse("event-detail", args=[event.pk])
+
+        responses = [api_client.get(url, HTTP_X_PROFILE="1") for _ in range(4)]
+
+        assert ["X-Profile-Id" in r for r in responses] == [True, True, True, False]
+        assert all(r.status_code == status.HTTP_200_OK for r in responses)
+
+    def test_unknown_profile(self, admin_client):
+        """Test qu'un profil inconnu renvoie 404."""
+        response = admin_client.get(reverse("diagnostics-profile", args=["missing"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_expired_profile(self, api_client, admin_user, event):
+        """Test qu'un profil expiré renvoie 404 et est purgé ensuite."""
+        api_client.force_login(admin_user)
+        url = reverse("event-detail", args=[event.pk])
+        profile_id = api_client.get(url, HTTP_X_PROFILE="1")["X-Profile-Id"]
+        RequestProfile.objects.filter(pk=profile_id).update(expires_at=timezone.now())
+
+        response = api_client.get(reverse("diagnostics-profile", args=[profile_id]))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        api_client.get(url, HTTP_X_PROFILE="1")
+        assert not RequestProfile.objects.filter(pk=profile_id).exists()
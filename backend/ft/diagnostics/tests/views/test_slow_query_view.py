@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ft.diagnostics.services import SlowQueryLog
+from ft.event.models import Event
+
+
+@pytest.fixture(autouse=True)
+def slow_query_settings(settings):
+    settings.SLOW_QUERY_LOG = True
+    settings.SLOW_QUERY_THRESHOLD_MS = 0
+    settings.SLOW_QUERY_EXPLAIN_RATE = 0
+    SlowQueryLog._entries = None
+    yield settings
+    SlowQueryLog._entries = None
+
+
+@pytest.fixture
+def event(db):
+    return Event.objects.create(
+        name="Congrès",
+        location="Paris",
+        start_date=timezone.now() + datetime.timedelta(days=30),
+        end_date=timezone.now() + datetime.timedelta(days=32),
+        type="CONGRESS",
+    )
+
+
+@pytest.mark.django_db
+class TestSlowQueryView:
+    """Tests pour le SlowQueryView et le SlowQueryMiddleware."""
+
+    def test_middleware_records_view_and_call_site(self, api_client, user, event):
+        """Test que les requêtes d'une vue sont rattachées à la vue et au code."""
+        api_client.force_authenticate(user=user)
+        api_client.post(reverse("event-subscribe", args=[event.pk]), {"answer": "YES"})
+
+        entries = SlowQueryLog.entries()
+        assert entries
+        assert all(entry["view"] == "event-subscribe" for entry in entries)
+        assert any(
+            frame.startswith("ft/event/views/EventViewSet.py:")
+            for entry in entries
+            for frame in entry["call_site"]
+        )
+
+    def test_disabled_by_default(self, api_client, user, event, settings):
+        """Test que rien n'est enregistré quand le journal est désactivé."""
+        settings.SLOW_QUERY_LOG = False
+        api_client.force_authenticate(user=user)
+        api_client.get(reverse("event-detail", args=[event.pk]))
+
+        assert SlowQueryLog.entries() == []
+
+    def test_list_slow_queries(self, admin_client, event):
+        """Test que le staff peut consulter les requêtes enregistrées."""
+        admin_client.get(reverse("event-detail", args=[event.pk]))
+
+        response = admin_client.get(reverse("diagnostics-slow-queries"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"]
+        assert response.data["results"][0]["view"] == "event-detail"
+
+    def test_clear_slow_queries(self, admin_client, event):
+        """Test que DELETE vide le tampon."""
+        admin_client.get(reverse("event-detail", args=[event.pk]))
+
+        response = admin_client.delete(reverse("diagnostics-slow-queries"))
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert SlowQueryLog.entries() == []
+
+    def test_requires_staff(self, api_client, user):
+        """Test qu'un utilisateur non staff ne peut pas consulter le journal."""
+        user.is_staff = False
+        user.save()
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("diagnostics-slow-queries"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,10 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class ProfilingThrottle(UserRateThrottle):
+    """
+    Limite le nombre de requêtes profilées par membre du staff
+    (taux `profiling` de `DEFAULT_THROTTLE_RATES`).
+    """
+
+    scope = "profiling"
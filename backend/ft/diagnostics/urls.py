@@ -0,0 +1,12 @@
+from django.urls import path
+from ft.diagnostics.views import MemoryView, ProfileView, SlowQueryView
+
+urlpatterns = [
+    path("slow-queries/", SlowQueryView.as_view(), name="diagnostics-slow-queries"),
+    path("memory/", MemoryView.as_view(), name="diagnostics-memory"),
+    path(
+        "profiles/<str:profile_id>/",
+        ProfileView.as_view(),
+        name="diagnostics-profile",
+    ),
+]
@@ -0,0 +1,28 @@
+from rest_framework import serializers, status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ft.diagnostics.services import MemoryTracker
+
+
+class MemoryView(APIView):
+    """
+    État mémoire du worker qui répond (staff uniquement) : RSS, croissance
+    par vue, lignes qui retiennent le plus de mémoire et évolution depuis
+    l'instantané de référence. DELETE reprend un instantané de référence.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    class QuerySerializer(serializers.Serializer):
+        limit = serializers.IntegerField(min_value=1, max_value=200, default=20)
+
+    def get(self, request):
+        query = self.QuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(MemoryTracker.report(query.validated_data["limit"]))
+
+    def delete(self, request):
+        MemoryTracker.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
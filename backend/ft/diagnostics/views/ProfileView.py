@@ -0,0 +1,26 @@
+from django.http import Http404, HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ft.diagnostics.middleware import ProfilingMiddleware
+
+
+class ProfileView(APIView):
+    """
+    Profil d'une requête enregistré par le ProfilingMiddleware (staff
+    uniquement). `?raw=1` renvoie seulement les piles « collapsed », à passer
+    à flamegraph.pl ou speedscope.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, profile_id):
+        profile = ProfilingMiddleware.get_profile(profile_id)
+        if profile is None:
+            raise Http404
+        if request.query_params.get("raw"):
+            return HttpResponse(
+                profile["collapsed"], content_type="text/plain; charset=utf-8"
+            )
+        return Response(profile)
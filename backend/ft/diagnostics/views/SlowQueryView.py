@@ -0,0 +1,22 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ft.diagnostics.services import SlowQueryLog
+
+
+class SlowQueryView(APIView):
+    """
+    Requêtes SQL lentes capturées par ce processus (staff uniquement).
+    DELETE vide le tampon.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({"results": SlowQueryLog.entries()})
+
+    def delete(self, request):
+        SlowQueryLog.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,10 @@
+# Views
+from .SlowQueryView import SlowQueryView
+from .ProfileView import ProfileView
+from .MemoryView import MemoryView
+
+__all__ = [
+    "SlowQueryView",
+    "ProfileView",
+    "MemoryView",
+]
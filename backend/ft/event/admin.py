@@ -1,4 +1,15 @@
 from django.contrib import admin
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from ft.event.models import (
     Event,
     EventSubscription,
@@ -6,7 +17,10 @@ from ft.event.models import (
     EventHostingRequest,
     CarpoolTrip,
     CarpoolRequest,
+    CarpoolPayment,
+    OutboxMessage,
 )
+from ft.event.services import EventExport
 
 
 @admin.register(Event)
@@ -18,6 +32,7 @@ class EventAdmin(admin.ModelAdmin):
         "location",
         "start_date",
         "end_date",
+        "participants",
         "is_active",
         "created_at",
         "updated_at",
@@ -26,6 +41,42 @@ class EventAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at", "updated_at")
     search_fields = ("name", "description", "location")
     ordering = ("start_date", "name")
+    actions = ["export_participants", "export_hostings", "export_carpools"]
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                participants_count=Count(
+                    "eventsubscription",
+                    filter=Q(
+                        eventsubscription__answer="YES",
+                        eventsubscription__is_active=True,
+                    ),
+                )
+            )
+        )
+
+    @admin.display(description="Participants", ordering="participants_count")
+    def participants(self, obj):
+        return obj.participants_count
+
+    def export(self, queryset, kind):
+        filename = f"{kind}-{timezone.localdate():%Y%m%d}"
+        return EventExport(queryset.values("pk")).response(kind, filename)
+
+    @admin.action(description="Exporter les participants (CSV)")
+    def export_participants(self, request, queryset):
+        return self.export(queryset, "participants")
+
+    @admin.action(description="Exporter les hébergements (CSV)")
+    def export_hostings(self, request, queryset):
+        return self.export(queryset, "hostings")
+
+    @admin.action(description="Exporter les covoiturages (CSV)")
+    def export_carpools(self, request, queryset):
+        return self.export(queryset, "carpools")
 
 
 @admin.register(EventSubscription)
@@ -38,8 +89,15 @@ class EventSubscriptionAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_filter = ("answer",)
+    list_select_related = ("event", "user")
     readonly_fields = ("created_at", "updated_at")
-    search_fields = ("event", "user")
+    autocomplete_fields = ("event", "user")
+    search_fields = (
+        "event__name",
+        "^user__email",
+        "^user__first_name",
+        "^user__last_name",
+    )
     ordering = ("event", "user", "answer")
 
 
@@ -49,14 +107,35 @@ class EventHostingAdmin(admin.ModelAdmin):
         "event",
         "host",
         "available_beds",
+        "beds_taken",
         "is_active",
         "created_at",
         "updated_at",
     )
     list_filter = ("is_active",)
-    readonly_fields = ("created_at", "updated_at")
+    list_select_related = ("event", "host")
+    readonly_fields = ("beds_taken", "created_at", "updated_at")
+    autocomplete_fields = ("event", "host")
     search_fields = ("event__name", "host__first_name", "host__last_name")
     ordering = ("event", "host")
+    actions = ["recount_beds_taken"]
+
+    @admin.action(description="Recalculer les lits occupés")
+    def recount_beds_taken(self, request, queryset):
+        accepted = (
+            EventHostingRequest.objects.filter(
+                hosting=OuterRef("pk"), status=EventHostingRequest.Status.ACCEPTED
+            )
+            .order_by()
+            .values("hosting")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        updated = queryset.update(
+            beds_taken=Coalesce(Subquery(accepted, output_field=IntegerField()), 0),
+            version=F("version") + 1,
+        )
+        self.message_user(request, f"{updated} hébergement(s) recalculé(s).")
 
 
 @admin.register(EventHostingRequest)
@@ -69,7 +148,9 @@ class EventHostingRequestAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_filter = ("status",)
+    list_select_related = ("hosting__event", "hosting__host", "requester")
     readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("hosting", "requester")
     search_fields = (
         "hosting__event__name",
         "requester__first_name",
@@ -91,7 +172,9 @@ class CarpoolTripAdmin(admin.ModelAdmin):
         "is_active",
     )
     list_filter = ("event", "is_active", "has_return")
+    list_select_related = ("driver", "event")
     readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("driver", "event")
     search_fields = (
         "driver__first_name",
         "driver__last_name",
@@ -100,6 +183,20 @@ class CarpoolTripAdmin(admin.ModelAdmin):
     )
     ordering = ("-departure_datetime",)
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                seats_left=F("seats_total")
+                - Count("requests", filter=Q(requests__status="ACCEPTED"))
+            )
+        )
+
+    @admin.display(description="Places disponibles", ordering="seats_left")
+    def seats_available(self, obj):
+        return obj.seats_left
+
 
 @admin.register(CarpoolRequest)
 class CarpoolRequestAdmin(admin.ModelAdmin):
@@ -113,7 +210,9 @@ class CarpoolRequestAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("status", "is_active")
+    list_select_related = ("passenger", "trip")
     readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("passenger", "trip")
     search_fields = (
         "passenger__first_name",
         "passenger__last_name",
@@ -121,3 +220,74 @@ class CarpoolRequestAdmin(admin.ModelAdmin):
         "trip__arrival_city",
     )
     ordering = ("-created_at",)
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                paid=Exists(
+                    CarpoolPayment.objects.filter(
+                        request=OuterRef("pk"), is_completed=True
+                    )
+                )
+            )
+        )
+
+    @admin.display(description="Payée", boolean=True, ordering="paid")
+    def is_paid(self, obj):
+        return obj.paid
+
+
+@admin.register(CarpoolPayment)
+class CarpoolPaymentAdmin(admin.ModelAdmin):
+    list_display = (
+        "request",
+        "amount",
+        "payment_method",
+        "is_completed",
+        "created_at",
+    )
+    list_filter = ("is_completed", "payment_method")
+    list_select_related = ("request__passenger", "request__trip")
+    readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("request",)
+    search_fields = (
+        "request__passenger__first_name",
+        "request__passenger__last_name",
+        "request__trip__departure_city",
+    )
+    ordering = ("-created_at",)
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = (
+        "kind",
+        "status",
+        "attempts",
+        "available_at",
+        "created_at",
+        "processed_at",
+    )
+    list_filter = ("status", "kind")
+    readonly_fields = (
+        "kind",
+        "payload",
+        "attempts",
+        "last_error",
+        "created_at",
+        "processed_at",
+    )
+    ordering = ("-created_at",)
+    actions = ["retry"]
+
+    @admin.action(description="Relancer les messages sélectionnés")
+    def retry(self, request, queryset):
+        updated = queryset.exclude(status=OutboxMessage.Status.SENT).update(
+            status=OutboxMessage.Status.PENDING,
+            attempts=0,
+            available_at=timezone.now(),
+            processed_at=None,
+        )
+        self.message_user(request, f"{updated} message(s) relancé(s).")
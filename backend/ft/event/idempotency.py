@@ -0,0 +1,97 @@
+import datetime
+import functools
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from ft.event.models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def fingerprint(request):
+    """Empreinte de la méthode, du chemin et du corps de la requête."""
+    payload = json.dumps(
+        [request.method, request.path, request.data], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def idempotent(handler):
+    """
+    Rend une action POST idempotente pour l'en-tête `Idempotency-Key`.
+
+    La première exécution d'une clé est enregistrée avec sa réponse, dans la
+    même transaction que ses écritures ; les tentatives suivantes de
+    l'utilisateur reçoivent cette réponse sans repasser par la validation ni
+    par les écritures. Une tentative concurrente attend, sur la contrainte
+    d'unicité, la fin de la première. Les exceptions de l'API (validation,
+    permissions) sont converties en réponse et enregistrées comme les autres ;
+    seules les erreurs serveur ne le sont pas, et la tentative suivante est
+    alors exécutée normalement. Les clés expirent après `IDEMPOTENCY_KEY_TTL`
+    secondes.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if key is None:
+            return handler(self, request, *args, **kwargs)
+        if not 0 < len(key) <= 255:
+            return Response(
+                {"detail": f"L'en-tête {HEADER} doit faire 1 à 255 caractères."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        digest = fingerprint(request)
+        now = timezone.now()
+        with transaction.atomic():
+            IdempotencyKey.objects.filter(
+                user=request.user, expires_at__lte=now
+            ).delete()
+            entry, created = IdempotencyKey.objects.get_or_create(
+                user=request.user,
+                key=key,
+                defaults={
+                    "fingerprint": digest,
+                    "expires_at": now
+                    + datetime.timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                },
+            )
+
+            if not created:
+                if entry.fingerprint != digest:
+                    return Response(
+                        {
+                            "detail": "Cette clé d'idempotence a déjà servi pour "
+                            "une autre requête."
+                        },
+                        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    )
+                return Response(
+                    entry.response,
+                    status=entry.status_code,
+                    headers={REPLAYED_HEADER: "true"},
+                )
+
+            try:
+                with transaction.atomic():
+                    response = handler(self, request, *args, **kwargs)
+            except Exception as exc:
+                response = self.handle_exception(exc)
+            if response.status_code >= 500:
+                transaction.set_rollback(True)
+                return response
+
+            entry.status_code = response.status_code
+            entry.response = response.data
+            entry.save(update_fields=["status_code", "response"])
+            return response
+
+    return wrapper
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ft.event.models import Event
+from ft.event.services import HostingAllocation
+
+
+class Command(BaseCommand):
+    help = (
+        "Attribue automatiquement les lits des hébergements d'un événement "
+        "aux demandes d'hébergement en attente."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int, help="ID de l'événement")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Calcule l'attribution sans l'enregistrer",
+        )
+        parser.add_argument(
+            "--reject-unassigned",
+            action="store_true",
+            help="Refuse les demandes des personnes restées sans lit",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            event = Event.objects.get(pk=options["event_id"])
+        except Event.DoesNotExist:
+            raise CommandError(f"Événement {options['event_id']} introuvable.")
+
+        result = HostingAllocation(event).run(
+            dry_run=options["dry_run"],
+            reject_unassigned=options["reject_unassigned"],
+        )
+
+        for allocation in result["accepted"]:
+            self.stdout.write(
+                f"Demande {allocation['request']} → "
+                f"hébergement {allocation['hosting']}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(result['accepted'])} demande(s) acceptée(s), "
+                f"{len(result['rejected'])} refusée(s), "
+                f"{len(result['unassigned'])} sans lit"
+                + (" (simulation)" if result["dry_run"] else "")
+            )
+        )
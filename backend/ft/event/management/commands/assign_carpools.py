@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ft.event.models import Event
+from ft.event.services import CarpoolAssignment
+
+
+class Command(BaseCommand):
+    help = (
+        "Répartit automatiquement les demandes de covoiturage en attente "
+        "d'un événement sur ses trajets."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int, help="ID de l'événement")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Calcule l'affectation sans l'enregistrer",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            event = Event.objects.get(pk=options["event_id"])
+        except Event.DoesNotExist:
+            raise CommandError(f"Événement {options['event_id']} introuvable.")
+
+        result = CarpoolAssignment(event).run(dry_run=options["dry_run"])
+
+        for assignment in result["assigned"]:
+            self.stdout.write(
+                f"Demande {assignment['request']} → trajet {assignment['trip']} "
+                f"({assignment['seats']} place(s))"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(result['assigned'])} demande(s) affectée(s), "
+                f"{len(result['unassigned'])} sans place, "
+                f"{len(result['superseded'])} remplacée(s)"
+                + (" (simulation)" if result["dry_run"] else "")
+            )
+        )
@@ -0,0 +1,113 @@
+import datetime
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from ft.common.renderers import MessagePackRenderer, ORJSONRenderer
+from ft.event.models import CarpoolPayment, CarpoolRequest, CarpoolTrip, Event
+from ft.event.serializers import CarpoolRequestSerializer
+from ft.user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare le temps de rendu des renderers de l'API sur une page de "
+        "demandes de covoiturage sérialisées."
+    )
+
+    renderers = {
+        "json": JSONRenderer,
+        "orjson": ORJSONRenderer,
+        "msgpack": MessagePackRenderer,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=50, help="Nombre de demandes par page"
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=200, help="Nombre de rendus mesurés"
+        )
+
+    def handle(self, *args, **options):
+        # Les données de test sont créées dans une transaction annulée à la fin.
+        with transaction.atomic():
+            page = self.build_page(options["rows"])
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"Page de {len(page['results'])} demande(s), "
+            f"{options['iterations']} rendu(s) par renderer"
+        )
+        baseline = None
+        for name, renderer_class in self.renderers.items():
+            renderer = renderer_class()
+            content = renderer.render(page, renderer_class.media_type)
+
+            start = time.perf_counter()
+            for _ in range(options["iterations"]):
+                renderer.render(page, renderer_class.media_type)
+            elapsed = (time.perf_counter() - start) / options["iterations"] * 1000
+
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"{name:<10} {len(content):>8} octets "
+                f"{elapsed:>8.3f} ms/page  x{baseline / elapsed:.1f}"
+            )
+
+    def build_page(self, rows):
+        """Crée `rows` demandes avec paiements et renvoie la page sérialisée."""
+        now = timezone.now()
+        event = Event.objects.create(
+            name="Benchmark",
+            location="Compiègne",
+            start_date=now + datetime.timedelta(days=30),
+            end_date=now + datetime.timedelta(days=32),
+            type="CONGRESS",
+        )
+        users = User.objects.bulk_create(
+            User(
+                username=f"benchmark-{index}",
+                email=f"benchmark-{index}@example.com",
+                first_name="Bench",
+                last_name=f"Mark {index}",
+                city="Compiègne",
+            )
+            for index in range(rows + 1)
+        )
+        trip = CarpoolTrip.objects.create(
+            driver=users[0],
+            event=event,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=now + datetime.timedelta(days=30),
+            seats_total=rows,
+            price_per_seat=Decimal("7.50"),
+        )
+        requests = CarpoolRequest.objects.bulk_create(
+            CarpoolRequest(
+                passenger=passenger,
+                trip=trip,
+                status="ACCEPTED",
+                message="Départ depuis la gare, merci !",
+            )
+            for passenger in users[1:]
+        )
+        CarpoolPayment.objects.bulk_create(
+            CarpoolPayment(request=request, amount=Decimal("7.50"), is_completed=True)
+            for request in requests
+        )
+
+        queryset = CarpoolRequest.objects.filter(trip=trip).select_related(
+            "passenger", "trip", "trip__driver", "trip__event"
+        )
+        return {
+            "count": rows,
+            "next": None,
+            "previous": None,
+            "results": CarpoolRequestSerializer(queryset, many=True).data,
+        }
@@ -0,0 +1,159 @@
+import datetime
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ft.common.query import VisibilityQuery
+from ft.event.models import (
+    CarpoolPayment,
+    CarpoolRequest,
+    CarpoolTrip,
+    Event,
+    EventHosting,
+    EventHostingRequest,
+)
+from ft.event.views import (
+    CarpoolPaymentViewSet,
+    CarpoolRequestViewSet,
+    EventHostingRequestViewSet,
+)
+from ft.user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare les plans des filtres de visibilité (OR de querysets, UNION "
+        "ALL, EXISTS) des demandes de covoiturage, des paiements et des "
+        "demandes d'hébergement."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=2000, help="Nombre d'utilisateurs"
+        )
+        parser.add_argument(
+            "--per-offer",
+            type=int,
+            default=4,
+            help="Nombre de demandes par trajet et par hébergement",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=50, help="Nombre de requêtes mesurées"
+        )
+
+    def handle(self, *args, **options):
+        # Les données de test sont créées dans une transaction annulée à la fin.
+        with transaction.atomic():
+            user = self.build_data(options["users"], options["per_offer"])
+            with connection.cursor() as cursor:
+                for model in (CarpoolRequest, CarpoolPayment, EventHostingRequest):
+                    cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+            self.stdout.write(
+                f"{options['users']} utilisateur(s), "
+                f"{options['iterations']} requête(s) par stratégie"
+            )
+            for viewset, queryset in (
+                (CarpoolRequestViewSet, CarpoolRequest.objects.all()),
+                (CarpoolPaymentViewSet, CarpoolPayment.objects.all()),
+                (EventHostingRequestViewSet, EventHostingRequest.objects.all()),
+            ):
+                self.compare(viewset.visibility, queryset, user, options["iterations"])
+
+            transaction.set_rollback(True)
+
+    def compare(self, visibility, queryset, user, iterations):
+        self.stdout.write(queryset.model.__name__)
+        strategies = {"or": self.legacy(visibility, queryset, user)}
+        for strategy in VisibilityQuery.STRATEGIES:
+            strategies[strategy] = visibility.apply(queryset, user, strategy)
+
+        baseline = None
+        for name, filtered in strategies.items():
+            filtered = filtered.order_by().values_list("pk", flat=True)
+            count = len(filtered)
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                list(filtered.all())
+            elapsed = (time.perf_counter() - start) / iterations * 1000
+
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"  {name:<8} {count:>6} ligne(s) "
+                f"{elapsed:>8.3f} ms/requête  x{baseline / elapsed:.1f}"
+            )
+
+    @staticmethod
+    def legacy(visibility, queryset, user):
+        """Forme historique : `qs.filter(a) | qs.filter(b)`."""
+        prefix = f"{visibility.via}__" if visibility.via else ""
+        combined = queryset.none()
+        for path in visibility.paths:
+            combined = combined | queryset.filter(**{f"{prefix}{path}": user})
+        return combined
+
+    def build_data(self, count, per_offer):
+        """
+        Crée `count` utilisateurs, chacun conducteur d'un trajet et hôte d'un
+        hébergement demandés par les `per_offer` utilisateurs suivants, et
+        renvoie l'utilisateur dont la visibilité est mesurée.
+        """
+        now = timezone.now()
+        event = Event.objects.create(
+            name="Benchmark",
+            location="Compiègne",
+            start_date=now + datetime.timedelta(days=30),
+            end_date=now + datetime.timedelta(days=32),
+            type="CONGRESS",
+        )
+        users = User.objects.bulk_create(
+            User(
+                username=f"benchmark-{index}",
+                email=f"benchmark-{index}@example.com",
+                first_name="Bench",
+                last_name=f"Mark {index}",
+                city="Compiègne",
+            )
+            for index in range(count)
+        )
+        trips = CarpoolTrip.objects.bulk_create(
+            CarpoolTrip(
+                driver=driver,
+                event=event,
+                departure_city="Paris",
+                arrival_city="Compiègne",
+                departure_datetime=now + datetime.timedelta(days=30),
+                seats_total=per_offer,
+                price_per_seat=Decimal("7.50"),
+            )
+            for driver in users
+        )
+        hostings = EventHosting.objects.bulk_create(
+            EventHosting(event=event, host=host, available_beds=per_offer)
+            for host in users
+        )
+        requests = CarpoolRequest.objects.bulk_create(
+            CarpoolRequest(
+                passenger=users[(index + offset) % count],
+                trip=trip,
+                status="ACCEPTED",
+            )
+            for index, trip in enumerate(trips)
+            for offset in range(1, per_offer + 1)
+        )
+        CarpoolPayment.objects.bulk_create(
+            CarpoolPayment(request=request, amount=Decimal("7.50"), is_completed=True)
+            for request in requests
+        )
+        EventHostingRequest.objects.bulk_create(
+            EventHostingRequest(
+                hosting=hosting, requester=users[(index + offset) % count]
+            )
+            for index, hosting in enumerate(hostings)
+            for offset in range(1, per_offer + 1)
+        )
+        return users[0]
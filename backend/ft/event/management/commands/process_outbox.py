@@ -0,0 +1,68 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ft.event.services import OutboxWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Traite les messages de l'outbox (e-mails de changement de statut) "
+        "par lots, jusqu'à l'arrêt du processus."
+    )
+
+    purge_interval = 3600
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Traite les messages disponibles puis s'arrête",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=None, help="Nombre de messages par lot"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Attente (secondes) quand aucun message n'est disponible",
+        )
+
+    def handle(self, *args, **options):
+        worker = OutboxWorker(batch_size=options["batch_size"])
+        interval = options["interval"] or settings.OUTBOX_POLL_INTERVAL
+        self.running = True
+        handlers = {
+            signum: signal.signal(signum, self.stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            self.run(worker, interval, options["once"])
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+    def run(self, worker, interval, once):
+        last_purge = 0
+        while self.running:
+            stats = worker.run_batch()
+            if stats:
+                metrics = worker.metrics()
+                self.stdout.write(
+                    f"{stats['sent']} envoyé(s), {stats['retried']} reprogrammé(s), "
+                    f"{stats['failed']} abandonné(s) ; {metrics['pending']} en "
+                    f"attente, retard {metrics['lag_seconds']} s"
+                )
+                continue
+            if once:
+                break
+            if time.monotonic() - last_purge > self.purge_interval:
+                worker.purge()
+                last_purge = time.monotonic()
+            time.sleep(interval)
+
+    def stop(self, signum, frame):
+        self.running = False
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ft.event.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Supprime les clés d'idempotence expirées."
+
+    def handle(self, *args, **options):
+        deleted, _ = IdempotencyKey.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted} clé(s) d'idempotence supprimée(s)")
+        )
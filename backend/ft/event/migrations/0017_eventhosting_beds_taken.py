@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:34
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_beds_taken(apps, schema_editor):
+    EventHosting = apps.get_model("event", "EventHosting")
+    EventHostingRequest = apps.get_model("event", "EventHostingRequest")
+    accepted = (
+        EventHostingRequest.objects.filter(hosting=OuterRef("pk"), status="ACCEPTED")
+        .order_by()
+        .values("hosting")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    EventHosting.objects.update(
+        beds_taken=Coalesce(Subquery(accepted, output_field=IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0016_event_url_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventhosting",
+            name="beds_taken",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="Nombre de lits attribués à des demandes acceptées",
+                verbose_name="Lits occupés",
+            ),
+        ),
+        migrations.RunPython(count_beds_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:11
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("event", "0017_eventhosting_beds_taken"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="carpoolpayment",
+            index=models.Index(
+                condition=models.Q(("is_completed", True)),
+                fields=["request"],
+                name="carpoolpay_completed_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="carpoolrequest",
+            index=models.Index(
+                fields=["passenger", "-created_at"], name="carpoolreq_passenger_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="carpoolrequest",
+            index=models.Index(
+                condition=models.Q(("status", "ACCEPTED")),
+                fields=["trip", "seats_requested"],
+                name="carpoolreq_accepted_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="carpooltrip",
+            index=models.Index(
+                fields=["departure_datetime"], name="trip_departure_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="carpooltrip",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["event", "departure_datetime"],
+                name="trip_event_active_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["start_date", "name"],
+                name="event_active_start_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventhostingrequest",
+            index=models.Index(
+                fields=["requester", "-created_at"], name="evhostreq_requester_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventhostingrequest",
+            index=models.Index(
+                fields=["hosting", "-created_at"], name="evhostreq_hosting_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventhostingrequest",
+            index=models.Index(
+                condition=models.Q(("status", "ACCEPTED")),
+                fields=["hosting"],
+                name="evhostreq_accepted_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventsubscription",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "event"],
+                name="evsub_user_active_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventsubscription",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["event", "answer"],
+                name="evsub_event_answer_idx",
+            ),
+        ),
+    ]
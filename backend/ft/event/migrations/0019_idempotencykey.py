@@ -0,0 +1,100 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:30
+
+import django.db.models.deletion
+import rest_framework.utils.encoders
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0018_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Valeur de l'en-tête Idempotency-Key",
+                        max_length=255,
+                        verbose_name="Clé",
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="Empreinte SHA-256 de la méthode, du chemin et du corps",
+                        max_length=64,
+                        verbose_name="Empreinte",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        help_text="Code HTTP de la réponse enregistrée",
+                        null=True,
+                        verbose_name="Code de statut",
+                    ),
+                ),
+                (
+                    "response",
+                    models.JSONField(
+                        encoder=rest_framework.utils.encoders.JSONEncoder,
+                        help_text="Corps de la réponse enregistrée",
+                        null=True,
+                        verbose_name="Réponse",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Date de la première exécution",
+                        verbose_name="Date de création",
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="Date après laquelle la clé est oubliée",
+                        verbose_name="Date d'expiration",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="Utilisateur qui a envoyé la requête",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Utilisateur",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Clé d'idempotence",
+                "verbose_name_plural": "Clés d'idempotence",
+                "indexes": [
+                    models.Index(fields=["expires_at"], name="idempotency_expires_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="idempotency_user_key_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0019_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carpoolrequest",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incrémentée à chaque modification",
+                verbose_name="Version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="carpooltrip",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incrémentée à chaque modification",
+                verbose_name="Version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventhosting",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incrémentée à chaque modification",
+                verbose_name="Version",
+            ),
+        ),
+    ]
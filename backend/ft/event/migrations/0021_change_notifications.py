@@ -0,0 +1,85 @@
+from django.db import migrations
+
+# Chaque trigger publie sur le canal `ft_changes` (voir ChangeFeed) un message
+# JSON compact : `u` liste les utilisateurs concernés, `t` le type d'objet.
+# Les mises à jour sans changement de valeur ne publient rien, et Postgres
+# fusionne les messages identiques d'une même transaction.
+NOTIFICATIONS = {
+    "event_carpoolrequest": """
+        json_build_object(
+            'u', ARRAY[
+                r.passenger_id,
+                (SELECT driver_id FROM event_carpooltrip WHERE id = r.trip_id)
+            ],
+            't', 'carpool_request', 'id', r.id, 'op', lower(TG_OP),
+            's', r.status, 'trip', r.trip_id
+        )
+    """,
+    "event_eventhostingrequest": """
+        json_build_object(
+            'u', ARRAY[
+                r.requester_id,
+                (SELECT host_id FROM event_eventhosting WHERE id = r.hosting_id)
+            ],
+            't', 'hosting_request', 'id', r.id, 'op', lower(TG_OP),
+            's', r.status, 'hosting', r.hosting_id
+        )
+    """,
+    "event_carpoolpayment": """
+        json_build_object(
+            'u', (
+                SELECT ARRAY[request.passenger_id, trip.driver_id]
+                FROM event_carpoolrequest request
+                JOIN event_carpooltrip trip ON trip.id = request.trip_id
+                WHERE request.id = r.request_id
+            ),
+            't', 'carpool_payment', 'id', r.id, 'op', lower(TG_OP),
+            'request', r.request_id
+        )
+    """,
+    "event_eventsubscription": """
+        json_build_object('t', 'event', 'id', r.event_id)
+    """,
+}
+
+
+def create_sql(table, message):
+    return f"""
+        CREATE FUNCTION ft_notify_{table}() RETURNS trigger AS $$
+        DECLARE
+            r {table}%ROWTYPE;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN r := OLD; ELSE r := NEW; END IF;
+            PERFORM pg_notify('ft_changes', ({message})::text);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER ft_notify_{table}
+            AFTER INSERT OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION ft_notify_{table}();
+
+        CREATE TRIGGER ft_notify_{table}_update
+            AFTER UPDATE ON {table}
+            FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+            EXECUTE FUNCTION ft_notify_{table}();
+    """
+
+
+def drop_sql(table):
+    return f"""
+        DROP TRIGGER IF EXISTS ft_notify_{table}_update ON {table};
+        DROP TRIGGER IF EXISTS ft_notify_{table} ON {table};
+        DROP FUNCTION IF EXISTS ft_notify_{table}();
+    """
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0020_version"),
+    ]
+
+    operations = [
+        migrations.RunSQL(create_sql(table, message), drop_sql(table))
+        for table, message in NOTIFICATIONS.items()
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:55
+
+import django.utils.timezone
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0021_change_notifications"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        help_text="Type de message, qui détermine son traitement",
+                        max_length=50,
+                        verbose_name="Type",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=rest_framework.utils.encoders.JSONEncoder,
+                        help_text="Données nécessaires au traitement du message",
+                        verbose_name="Contenu",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "En attente"),
+                            ("SENT", "Envoyé"),
+                            ("FAILED", "Abandonné"),
+                        ],
+                        default="PENDING",
+                        help_text="Statut du message",
+                        max_length=10,
+                        verbose_name="Statut",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="Nombre de tentatives de traitement",
+                        verbose_name="Tentatives",
+                    ),
+                ),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Date à partir de laquelle le message peut être traité",
+                        verbose_name="Disponible le",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="Erreur de la dernière tentative échouée",
+                        verbose_name="Dernière erreur",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Date d'enregistrement du message",
+                        verbose_name="Date de création",
+                    ),
+                ),
+                (
+                    "processed_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date d'envoi ou d'abandon du message",
+                        null=True,
+                        verbose_name="Date de traitement",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Message sortant",
+                "verbose_name_plural": "Messages sortants",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "PENDING")),
+                        fields=["available_at"],
+                        name="outbox_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
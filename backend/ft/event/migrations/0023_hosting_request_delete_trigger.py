@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Une demande acceptée supprimée libère son lit, quel que soit le chemin de
+# suppression : instance, queryset ou cascade (suppression d'un utilisateur).
+CREATE_SQL = """
+    CREATE FUNCTION ft_release_hosting_bed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE event_eventhosting
+        SET beds_taken = beds_taken - 1, version = version + 1
+        WHERE id = OLD.hosting_id AND beds_taken > 0;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER ft_release_hosting_bed
+        AFTER DELETE ON event_eventhostingrequest
+        FOR EACH ROW WHEN (OLD.status = 'ACCEPTED')
+        EXECUTE FUNCTION ft_release_hosting_bed();
+"""
+
+DROP_SQL = """
+    DROP TRIGGER IF EXISTS ft_release_hosting_bed ON event_eventhostingrequest;
+    DROP FUNCTION IF EXISTS ft_release_hosting_bed();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event", "0022_outboxmessage"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
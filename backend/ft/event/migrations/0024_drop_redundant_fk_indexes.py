@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Index simples des clés étrangères, redondants avec les index composites
+# de 0018 qui commencent par la même colonne. Supprimés sans bloquer les
+# écritures (DROP INDEX CONCURRENTLY).
+REDUNDANT_INDEXES = [
+    (
+        "event_carpoolrequest",
+        "passenger_id",
+        "event_carpoolrequest_passenger_id_ecb4c4e3",
+    ),
+    (
+        "event_eventhostingrequest",
+        "hosting_id",
+        "event_eventhostingrequest_hosting_id_dfa9d216",
+    ),
+    (
+        "event_eventhostingrequest",
+        "requester_id",
+        "event_eventhostingrequest_requester_id_175aafda",
+    ),
+]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("event", "0023_hosting_request_delete_trigger"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {name}",
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} ({column})",
+                )
+                for table, column, name in REDUNDANT_INDEXES
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="carpoolrequest",
+                    name="passenger",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="Utilisateur demandant une place",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="carpool_requests_as_passenger",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Passager",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="eventhostingrequest",
+                    name="hosting",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="Hébergement demandé",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="requests",
+                        to="event.eventhosting",
+                        verbose_name="Hébergement",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="eventhostingrequest",
+                    name="requester",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="Utilisateur qui fait la demande d'hébergement",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="hosting_requests",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Demandeur",
+                    ),
+                ),
+            ],
+        ),
+    ]
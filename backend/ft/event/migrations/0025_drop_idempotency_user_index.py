@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Index simple de la clé étrangère, redondant avec la contrainte unique
+# idempotency_user_key_unique (user, key). Supprimé sans bloquer les
+# écritures (DROP INDEX CONCURRENTLY).
+REDUNDANT_INDEX = "event_idempotencykey_user_id_0c9006e6"
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("event", "0024_drop_redundant_fk_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {REDUNDANT_INDEX}",
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {REDUNDANT_INDEX} "
+                    "ON event_idempotencykey (user_id)",
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="idempotencykey",
+                    name="user",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="Utilisateur qui a envoyé la requête",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Utilisateur",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -61,6 +61,13 @@ class CarpoolPayment(models.Model):
         verbose_name = "Paiement de covoiturage"
         verbose_name_plural = "Paiements de covoiturage"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["request"],
+                condition=models.Q(is_completed=True),
+                name="carpoolpay_completed_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Paiement de {self.amount}€ pour {self.request}"
@@ -1,9 +1,10 @@
 from django.db import models
+from ft.common.models import VersionedModel
 from ft.user.models import User
 from .CarpoolTrip import CarpoolTrip
 
 
-class CarpoolRequest(models.Model):
+class CarpoolRequest(VersionedModel):
     """
     A CarpoolRequest represents a request for a seat in a carpool trip.
     """
@@ -15,9 +16,11 @@ class CarpoolRequest(models.Model):
         ("CANCELLED", "Annulée"),
     ]
 
+    # Couvert par carpoolreq_passenger_idx (passenger, -created_at).
     passenger = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
+        db_index=False,
         verbose_name="Passager",
         help_text="Utilisateur demandant une place",
         related_name="carpool_requests_as_passenger",
@@ -73,6 +76,16 @@ class CarpoolRequest(models.Model):
         verbose_name = "Demande de covoiturage"
         verbose_name_plural = "Demandes de covoiturage"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["passenger", "-created_at"], name="carpoolreq_passenger_idx"
+            ),
+            models.Index(
+                fields=["trip", "seats_requested"],
+                condition=models.Q(status="ACCEPTED"),
+                name="carpoolreq_accepted_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["passenger", "trip", "status"],
@@ -1,9 +1,10 @@
 from django.db import models
+from ft.common.models import VersionedModel
 from ft.user.models import User
 from .Event import Event
 
 
-class CarpoolTrip(models.Model):
+class CarpoolTrip(VersionedModel):
     """
     Un CarpoolTrip représente un trajet de covoiturage proposé par un
     conducteur.
@@ -102,6 +103,14 @@ class CarpoolTrip(models.Model):
         verbose_name = "Trajet de covoiturage"
         verbose_name_plural = "Trajets de covoiturage"
         ordering = ["departure_datetime", "event"]
+        indexes = [
+            models.Index(fields=["departure_datetime"], name="trip_departure_idx"),
+            models.Index(
+                fields=["event", "departure_datetime"],
+                condition=models.Q(is_active=True),
+                name="trip_event_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -111,8 +120,13 @@ class CarpoolTrip(models.Model):
 
     @property
     def seats_available(self):
-        """Renvoie le nombre de places encore disponibles."""
-        accepted_requests = self.requests.filter(status="ACCEPTED").count()
+        """
+        Renvoie le nombre de places encore disponibles. Utilise l'annotation
+        `accepted_requests_count` si le queryset l'a calculée.
+        """
+        accepted_requests = getattr(self, "accepted_requests_count", None)
+        if accepted_requests is None:
+            accepted_requests = self.requests.filter(status="ACCEPTED").count()
         return self.seats_total - accepted_requests
 
     @property
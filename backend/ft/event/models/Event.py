@@ -93,6 +93,13 @@ class Event(models.Model):
         verbose_name = "Événement"
         verbose_name_plural = "Événements"
         ordering = ["start_date", "name"]
+        indexes = [
+            models.Index(
+                fields=["start_date", "name"],
+                condition=models.Q(is_active=True),
+                name="event_active_start_idx",
+            ),
+        ]
 
     def __str__(self):
         return "{} ({})".format(self.name, self.location)
@@ -1,11 +1,12 @@
 from datetime import datetime
 from django.db import models
 
+from ft.common.models import VersionedModel
 from ft.user.models import User
 from ft.event.models import Event
 
 
-class EventHosting(models.Model):
+class EventHosting(VersionedModel):
     """
     An EventHosting represents an offer of hosting proposed by a user for an event.
     """
@@ -75,6 +76,11 @@ class EventHosting(models.Model):
             "Pays spécifique pour cet hébergement " "(si différent du pays habituel)"
         ),
     )
+    beds_taken: int = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Lits occupés",
+        help_text="Nombre de lits attribués à des demandes acceptées",
+    )
     is_active: bool = models.BooleanField(
         default=True,
         verbose_name="Actif",
@@ -108,3 +114,8 @@ class EventHosting(models.Model):
                 self.custom_rules = self.host.home_rules
 
         super().save(*args, **kwargs)
+
+    @property
+    def places_available(self):
+        """Renvoie le nombre de lits encore disponibles."""
+        return self.available_beds - self.beds_taken
@@ -1,13 +1,28 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from ft.user.models import User
-from ft.event.models import EventHosting
+from ft.event.models import EventHosting, OutboxMessage
 
 
 class EventHostingRequest(models.Model):
     """
     Une EventHostingRequest représente une demande d'hébergement faite
     par un utilisateur pour un hébergement proposé.
+
+    Le compteur `beds_taken` de l'hébergement est tenu à jour à chaque
+    changement de statut vers ou depuis ACCEPTED. `accept`, `reject` et
+    `cancel` changent le statut par un UPDATE conditionnel sur le statut lu :
+    une transition concurrente fait échouer l'autre au lieu de fausser le
+    compteur. Un `save()` vers ACCEPTED (admin, création directe) réserve
+    son lit par le même UPDATE conditionnel et lève une ValidationError si
+    l'hébergement est complet. Les suppressions, y compris en cascade ou par queryset, sont
+    décomptées par un trigger (migration 0023). Un `QuerySet.update()` du
+    statut ne met pas le compteur à jour : l'action d'admin « Recalculer les
+    lits occupés » le corrige. Les changements faits par `accept`, `reject`
+    et `cancel` sont notifiés par e-mail via l'outbox.
     """
 
     class Status(models.TextChoices):
@@ -16,9 +31,12 @@ class EventHostingRequest(models.Model):
         REJECTED = "REJECTED", "Refusée"
         CANCELLED = "CANCELLED", "Annulée"
 
+    # Les deux clés étrangères sont couvertes par evhostreq_hosting_idx et
+    # evhostreq_requester_idx, qui commencent par elles.
     hosting = models.ForeignKey(
         EventHosting,
         on_delete=models.CASCADE,
+        db_index=False,
         verbose_name="Hébergement",
         help_text="Hébergement demandé",
         related_name="requests",
@@ -26,6 +44,7 @@ class EventHostingRequest(models.Model):
     requester = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
+        db_index=False,
         verbose_name="Demandeur",
         help_text="Utilisateur qui fait la demande d'hébergement",
         related_name="hosting_requests",
@@ -64,30 +83,171 @@ class EventHostingRequest(models.Model):
         verbose_name = "Demande d'hébergement"
         verbose_name_plural = "Demandes d'hébergement"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["requester", "-created_at"], name="evhostreq_requester_idx"
+            ),
+            models.Index(
+                fields=["hosting", "-created_at"], name="evhostreq_hosting_idx"
+            ),
+            models.Index(
+                fields=["hosting"],
+                condition=models.Q(status="ACCEPTED"),
+                name="evhostreq_accepted_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Demande de {self.requester} pour {self.hosting}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "status" in field_names:
+            instance._saved_status = instance.status
+        return instance
+
+    def clean(self):
+        super().clean()
+        if (
+            self.status == self.Status.ACCEPTED
+            and getattr(self, "_saved_status", None) != self.Status.ACCEPTED
+            and self.hosting_id
+            and self.hosting.places_available <= 0
+        ):
+            raise ValidationError(
+                {"status": "L'hébergement n'a plus de places disponibles."}
+            )
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "status" not in update_fields:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            if hasattr(self, "_saved_status") or self._state.adding:
+                previous_status = getattr(self, "_saved_status", None)
+            else:
+                # Statut différé ou instance construite à la main : le statut
+                # enregistré est inconnu, on le relit sous verrou.
+                previous_status = (
+                    EventHostingRequest.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("status", flat=True)
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            delta = (self.status == self.Status.ACCEPTED) - (
+                previous_status == self.Status.ACCEPTED
+            )
+            if not self._shift_beds_taken(delta):
+                raise ValidationError(
+                    {"status": "L'hébergement n'a plus de places disponibles."}
+                )
+        self._saved_status = self.status
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._saved_status = None
+        return result
+
+    def _shift_beds_taken(self, delta):
+        """
+        Décale le compteur de lits de l'hébergement. Une réservation
+        (`delta` > 0) ne dépasse jamais `available_beds` : renvoie False si
+        les lits manquent.
+        """
+        if delta > 0:
+            updated = EventHosting.objects.filter(
+                pk=self.hosting_id, beds_taken__lte=F("available_beds") - delta
+            ).update(beds_taken=F("beds_taken") + delta, version=F("version") + 1)
+        elif delta < 0:
+            updated = EventHosting.objects.filter(
+                pk=self.hosting_id, beds_taken__gte=-delta
+            ).update(beds_taken=F("beds_taken") + delta, version=F("version") + 1)
+        else:
+            return True
+        if updated and EventHostingRequest.hosting.is_cached(self):
+            self.hosting.beds_taken += delta
+            self.hosting.version += 1
+        return delta < 0 or bool(updated)
+
     def accept(self):
         """
-        Accepte la demande d'hébergement.
+        Accepte la demande d'hébergement si l'hôte a encore un lit libre.
+
+        Le lit est réservé par un UPDATE conditionnel sur le compteur de
+        l'hébergement : deux acceptations concurrentes ne peuvent pas
+        dépasser `available_beds`. Renvoie True si la demande a été acceptée.
         """
-        if self.status == self.Status.PENDING:
-            self.status = self.Status.ACCEPTED
-            self.save()
+        if self.status != self.Status.PENDING:
+            return False
+
+        now = timezone.now()
+        with transaction.atomic():
+            accepted = EventHostingRequest.objects.filter(
+                pk=self.pk, status=self.Status.PENDING
+            ).update(
+                status=self.Status.ACCEPTED,
+                host_message=self.host_message,
+                updated_at=now,
+            )
+            bed_reserved = accepted and EventHosting.objects.filter(
+                pk=self.hosting_id, beds_taken__lt=F("available_beds")
+            ).update(beds_taken=F("beds_taken") + 1, version=F("version") + 1)
+            if not bed_reserved:
+                transaction.set_rollback(True)
+                return False
+            self.notify_status(self.Status.ACCEPTED)
+
+        if EventHostingRequest.hosting.is_cached(self):
+            self.hosting.beds_taken += 1
+            self.hosting.version += 1
+        self.status = self.Status.ACCEPTED
+        self.updated_at = now
+        self._saved_status = self.status
+        return True
 
     def reject(self):
         """
-        Refuse la demande d'hébergement.
+        Refuse la demande d'hébergement. Renvoie True si la demande a été
+        refusée.
         """
-        if self.status == self.Status.PENDING:
-            self.status = self.Status.REJECTED
-            self.save()
+        if self.status != self.Status.PENDING:
+            return False
+        return self._transition(self.Status.REJECTED)
 
     def cancel(self):
         """
-        Annule la demande d'hébergement.
+        Annule la demande d'hébergement et libère le lit si elle était
+        acceptée. Renvoie True si la demande a été annulée.
+        """
+        if self.status not in [self.Status.PENDING, self.Status.ACCEPTED]:
+            return False
+        return self._transition(self.Status.CANCELLED)
+
+    def _transition(self, status):
+        """
+        Passe du statut lu à `status` si la demande n'a pas changé entretemps,
+        et ajuste le compteur de lits selon le statut réellement remplacé.
         """
-        if self.status in [self.Status.PENDING, self.Status.ACCEPTED]:
-            self.status = self.Status.CANCELLED
-            self.save()
+        previous_status = self.status
+        now = timezone.now()
+        with transaction.atomic():
+            updated = EventHostingRequest.objects.filter(
+                pk=self.pk, status=previous_status
+            ).update(status=status, host_message=self.host_message, updated_at=now)
+            if not updated:
+                return False
+            if previous_status == self.Status.ACCEPTED:
+                self._shift_beds_taken(-1)
+            self.notify_status(status)
+
+        self.status = status
+        self.updated_at = now
+        self._saved_status = status
+        return True
+
+    def notify_status(self, status):
+        """Enregistre dans l'outbox la notification du nouveau statut."""
+        OutboxMessage.enqueue("hosting_request_status", id=self.pk, status=status)
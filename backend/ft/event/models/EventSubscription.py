@@ -58,6 +58,18 @@ class EventSubscription(models.Model):
         verbose_name_plural = "Inscriptions"
         ordering = ["event", "user"]
         unique_together = ["event", "user"]
+        indexes = [
+            models.Index(
+                fields=["user", "event"],
+                condition=models.Q(is_active=True),
+                name="evsub_user_active_idx",
+            ),
+            models.Index(
+                fields=["event", "answer"],
+                condition=models.Q(is_active=True),
+                name="evsub_event_answer_idx",
+            ),
+        ]
 
     def __str__(self):
         return "{} ({})".format(self.event.name, self.user.email)
@@ -0,0 +1,67 @@
+from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
+
+from ft.user.models import User
+
+
+class IdempotencyKey(models.Model):
+    """
+    Une IdempotencyKey garde le résultat de la première exécution d'une
+    requête POST envoyée avec l'en-tête `Idempotency-Key`, pour le rejouer
+    tel quel aux nouvelles tentatives du même utilisateur jusqu'à
+    `expires_at`.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        db_index=False,
+        verbose_name="Utilisateur",
+        help_text="Utilisateur qui a envoyé la requête",
+        related_name="+",
+    )
+    key = models.CharField(
+        max_length=255,
+        verbose_name="Clé",
+        help_text="Valeur de l'en-tête Idempotency-Key",
+    )
+    fingerprint = models.CharField(
+        max_length=64,
+        verbose_name="Empreinte",
+        help_text="Empreinte SHA-256 de la méthode, du chemin et du corps",
+    )
+    status_code = models.PositiveSmallIntegerField(
+        null=True,
+        verbose_name="Code de statut",
+        help_text="Code HTTP de la réponse enregistrée",
+    )
+    response = models.JSONField(
+        null=True,
+        encoder=JSONEncoder,
+        verbose_name="Réponse",
+        help_text="Corps de la réponse enregistrée",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Date de création",
+        help_text="Date de la première exécution",
+    )
+    expires_at = models.DateTimeField(
+        verbose_name="Date d'expiration",
+        help_text="Date après laquelle la clé est oubliée",
+    )
+
+    class Meta:
+        verbose_name = "Clé d'idempotence"
+        verbose_name_plural = "Clés d'idempotence"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="idempotency_user_key_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"], name="idempotency_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.key} ({self.user})"
@@ -0,0 +1,93 @@
+from django.db import models
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OutboxMessage(models.Model):
+    """
+    Un OutboxMessage est un effet de bord (e-mail, webhook...) d'un
+    changement, enregistré dans la même transaction que ce changement puis
+    exécuté hors requête par la commande `process_outbox`. Un changement
+    annulé n'envoie donc rien, et un changement validé finit toujours par
+    être notifié.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "En attente"
+        SENT = "SENT", "Envoyé"
+        FAILED = "FAILED", "Abandonné"
+
+    kind = models.CharField(
+        max_length=50,
+        verbose_name="Type",
+        help_text="Type de message, qui détermine son traitement",
+    )
+    payload = models.JSONField(
+        encoder=JSONEncoder,
+        verbose_name="Contenu",
+        help_text="Données nécessaires au traitement du message",
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Statut",
+        help_text="Statut du message",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Tentatives",
+        help_text="Nombre de tentatives de traitement",
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Disponible le",
+        help_text="Date à partir de laquelle le message peut être traité",
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="Dernière erreur",
+        help_text="Erreur de la dernière tentative échouée",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Date de création",
+        help_text="Date d'enregistrement du message",
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Date de traitement",
+        help_text="Date d'envoi ou d'abandon du message",
+    )
+
+    class Meta:
+        verbose_name = "Message sortant"
+        verbose_name_plural = "Messages sortants"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["available_at"],
+                condition=models.Q(status="PENDING"),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} ({self.get_status_display()})"
+
+    @classmethod
+    def enqueue(cls, kind, **payload):
+        """
+        Enregistre un message. À appeler dans la transaction du changement
+        qu'il notifie.
+        """
+        return cls.objects.create(kind=kind, payload=payload)
+
+    @classmethod
+    def bulk_enqueue(cls, kind, payloads):
+        """Enregistre en une requête un message par contenu de `payloads`."""
+        return cls.objects.bulk_create(
+            cls(kind=kind, payload=payload) for payload in payloads
+        )
@@ -1,4 +1,5 @@
 # Models
+from .OutboxMessage import OutboxMessage
 from .Event import Event
 from .EventSubscription import EventSubscription
 from .EventHosting import EventHosting
@@ -6,8 +7,10 @@ from .EventHostingRequest import EventHostingRequest
 from .CarpoolTrip import CarpoolTrip
 from .CarpoolRequest import CarpoolRequest
 from .CarpoolPayment import CarpoolPayment
+from .IdempotencyKey import IdempotencyKey
 
 __all__ = [
+    "OutboxMessage",
     "Event",
     "EventSubscription",
     "EventHosting",
@@ -15,4 +18,5 @@ __all__ = [
     "CarpoolTrip",
     "CarpoolRequest",
     "CarpoolPayment",
+    "IdempotencyKey",
 ]
@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from ft.common.permissions import AnnotatedPermission
+
 
 class IsStaffOrReadOnly(permissions.BasePermission):
     """
@@ -15,41 +17,67 @@ class IsStaffOrReadOnly(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class IsEventSubscriptionOwnerOrReadOnly(permissions.BasePermission):
+class IsEventSubscriptionOwnerOrReadOnly(AnnotatedPermission):
     """
     Permission personnalisée pour permettre uniquement au propriétaire
     d'une inscription de la modifier.
     """
 
+    annotations = {"is_owner": "user"}
+
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        return obj.user == request.user
+        return self.resolve(obj, "is_owner", request.user)
 
 
-class IsHostingOwnerOrReadOnly(permissions.BasePermission):
+class IsHostingOwnerOrReadOnly(AnnotatedPermission):
     """
     Permission personnalisée pour permettre uniquement à l'hôte
     de modifier son offre d'hébergement.
     """
 
+    annotations = {"is_host": "host"}
+
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        return obj.host == request.user
+        return self.resolve(obj, "is_host", request.user)
 
 
-class IsHostingRequestRequesterOrHost(permissions.BasePermission):
+class IsHostingRequestRequesterOrHost(AnnotatedPermission):
     """
     Permission personnalisée pour les demandes d'hébergement.
     - Le demandeur peut créer et voir ses propres demandes
     - L'hôte peut voir et répondre aux demandes pour son hébergement
     """
 
+    annotations = {"is_requester": "requester", "is_host": "hosting__host"}
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated
+
+    def has_object_permission(self, request, view, obj):
+        return self.resolve(obj, "is_requester", request.user) or self.resolve(
+            obj, "is_host", request.user
+        )
+
+
+class IsCarpoolRequestPassengerOrDriver(AnnotatedPermission):
+    """
+    Permission personnalisée pour les demandes de covoiturage.
+    - Le passager peut voir et annuler sa demande
+    - Le conducteur peut voir, accepter ou refuser les demandes de son trajet
+    """
+
+    annotations = {"is_passenger": "passenger", "is_driver": "trip__driver"}
+
     def has_permission(self, request, view):
         return request.user.is_authenticated
 
     def has_object_permission(self, request, view, obj):
-        return obj.requester == request.user or obj.hosting.host == request.user
+        return self.resolve(obj, "is_passenger", request.user) or self.resolve(
+            obj, "is_driver", request.user
+        )
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+
+class AllocationActionSerializer(serializers.Serializer):
+    """
+    Serializer for the automatic allocation actions of an event.
+    """
+
+    dry_run = serializers.BooleanField(default=False, required=False)
+
+
+class HostingAllocationActionSerializer(AllocationActionSerializer):
+    """
+    Serializer for the automatic hosting allocation of an event.
+    """
+
+    reject_unassigned = serializers.BooleanField(default=False, required=False)
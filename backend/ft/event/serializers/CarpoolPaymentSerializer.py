@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from ft.common.query import QueryPlan
 from ft.event.models import CarpoolPayment, CarpoolRequest
+from ft.event.permissions import IsCarpoolRequestPassengerOrDriver
 
 
 class CarpoolPaymentSerializer(serializers.ModelSerializer):
@@ -43,6 +45,9 @@ class CarpoolPaymentSerializer(serializers.ModelSerializer):
             "payment_method_display",
             "payment_status_display",
         ]
+        query_plans = {
+            "payment_status_display": QueryPlan(fields=["is_completed"]),
+        }
 
     def validate(self, data):
         request = self.context.get("request")
@@ -55,7 +60,9 @@ class CarpoolPaymentSerializer(serializers.ModelSerializer):
                 }
             )
 
-        if carpool_request and request.user != carpool_request.trip.driver:
+        if carpool_request and not IsCarpoolRequestPassengerOrDriver.resolve(
+            carpool_request, "is_driver", request.user
+        ):
             raise serializers.ValidationError(
                 {"request": "Seul le conducteur peut enregistrer des paiements."}
             )
@@ -1,7 +1,17 @@
+from django.db import transaction
+from django.db.models import DecimalField, Exists, OuterRef, Subquery, Sum
 from rest_framework import serializers
+from ft.common.query import QueryPlan
 from ft.user.serializers import UserSerializer
-from ft.event.models import CarpoolRequest, CarpoolTrip
-from .CarpoolTripSerializer import CarpoolTripSerializer
+from ft.event.serializers import EventSerializer
+from ft.event.models import (
+    CarpoolPayment,
+    CarpoolRequest,
+    CarpoolTrip,
+    OutboxMessage,
+)
+from ft.event.permissions import IsCarpoolRequestPassengerOrDriver
+from .CarpoolTripSerializer import CarpoolTripSerializer, CarpoolTripFlatSerializer
 
 
 class CarpoolRequestSerializer(serializers.ModelSerializer):
@@ -35,6 +45,7 @@ class CarpoolRequestSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
+            "version",
             "is_paid",
             "total_paid",
             "expected_amount",
@@ -43,18 +54,49 @@ class CarpoolRequestSerializer(serializers.ModelSerializer):
             "id",
             "created_at",
             "updated_at",
+            "version",
         ]
+        query_plans = {
+            "is_paid": QueryPlan(
+                annotate={
+                    "paid": Exists(
+                        CarpoolPayment.objects.filter(
+                            request=OuterRef("pk"), is_completed=True
+                        )
+                    )
+                }
+            ),
+            "total_paid": QueryPlan(
+                annotate={
+                    "paid_total": Subquery(
+                        CarpoolPayment.objects.filter(request=OuterRef("pk"))
+                        .order_by()
+                        .values("request")
+                        .annotate(total=Sum("amount"))
+                        .values("total"),
+                        output_field=DecimalField(max_digits=10, decimal_places=2),
+                    )
+                }
+            ),
+            "expected_amount": QueryPlan(
+                fields=["seats_requested", "trip__price_per_seat"]
+            ),
+        }
 
     def get_is_paid(self, obj):
         """
         Retourne si la demande est entièrement payée.
         """
+        if hasattr(obj, "paid"):
+            return obj.paid
         return obj.is_paid
 
     def get_total_paid(self, obj):
         """
         Retourne le montant total payé pour cette demande.
         """
+        if hasattr(obj, "paid_total"):
+            return obj.paid_total or 0
         return obj.total_paid
 
     def get_expected_amount(self, obj):
@@ -120,7 +162,62 @@ class CarpoolRequestSerializer(serializers.ModelSerializer):
                         {"status": f"{trip.seats_available} places restantes."}
                     )
 
-        return super().update(instance, validated_data)
+        previous_status = instance.status
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if instance.status != previous_status:
+                OutboxMessage.enqueue(
+                    "carpool_request_status", id=instance.pk, status=instance.status
+                )
+        return instance
+
+
+class CarpoolRequestFlatSerializer(CarpoolRequestSerializer):
+    """
+    Serializer for the CarpoolRequest model in the normalized (sideloaded)
+    response shape: the passenger and the trip are referenced by ID, the
+    related objects are serialized once in the `included` maps.
+    """
+
+    passenger = serializers.PrimaryKeyRelatedField(read_only=True)
+    trip = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    class Meta(CarpoolRequestSerializer.Meta):
+        query_plans = {
+            **CarpoolRequestSerializer.Meta.query_plans,
+            # Objets lus par get_included.
+            "passenger": QueryPlan(fields=["passenger"]),
+            "trip": QueryPlan(fields=["trip__driver", "trip__event"]),
+        }
+
+    def get_included(self, requests, include):
+        """
+        Serialize once each trip, user and event referenced by `requests`,
+        for the requested `include` types.
+        """
+        trips = {request.trip_id: request.trip for request in requests}
+        users = {request.passenger_id: request.passenger for request in requests}
+        users.update({trip.driver_id: trip.driver for trip in trips.values()})
+        events = {
+            trip.event_id: trip.event
+            for trip in trips.values()
+            if trip.event_id is not None
+        }
+
+        included = {}
+        if "trips" in include:
+            included["trips"] = self._serialize_map(CarpoolTripFlatSerializer, trips)
+        if "users" in include:
+            included["users"] = self._serialize_map(UserSerializer, users)
+        if "events" in include:
+            included["events"] = self._serialize_map(EventSerializer, events)
+        return included
+
+    def _serialize_map(self, serializer_class, objects):
+        data = serializer_class(
+            list(objects.values()), many=True, context=self.context
+        ).data
+        return {item["id"]: item for item in data}
 
 
 class CarpoolRequestActionSerializer(serializers.Serializer):
@@ -140,7 +237,9 @@ class CarpoolRequestActionSerializer(serializers.Serializer):
         user = request.user
 
         if data["action"] == "accept" or data["action"] == "reject":
-            if user != carpool_request.trip.driver:
+            if not IsCarpoolRequestPassengerOrDriver.resolve(
+                carpool_request, "is_driver", user
+            ):
                 raise serializers.ValidationError(
                     {
                         "action": "Seul le conducteur peut accepter ou refuser une demande."
@@ -164,7 +263,9 @@ class CarpoolRequestActionSerializer(serializers.Serializer):
                     )
 
         elif data["action"] == "cancel":
-            if user != carpool_request.passenger:
+            if not IsCarpoolRequestPassengerOrDriver.resolve(
+                carpool_request, "is_passenger", user
+            ):
                 raise serializers.ValidationError(
                     {"action": "Seul le passager peut annuler sa demande."}
                 )
@@ -177,3 +278,23 @@ class CarpoolRequestActionSerializer(serializers.Serializer):
                 )
 
         return data
+
+
+class CarpoolRequestBulkActionItemSerializer(serializers.Serializer):
+    """
+    Sérialiseur pour une action d'une requête groupée sur les demandes.
+    """
+
+    id = serializers.IntegerField()
+    action = serializers.ChoiceField(choices=["accept", "reject", "cancel"])
+    response_message = serializers.CharField(required=False, allow_blank=True)
+
+
+class CarpoolRequestBulkActionSerializer(serializers.Serializer):
+    """
+    Sérialiseur pour les actions groupées sur des demandes de covoiturage.
+    """
+
+    actions = CarpoolRequestBulkActionItemSerializer(
+        many=True, allow_empty=False, max_length=500
+    )
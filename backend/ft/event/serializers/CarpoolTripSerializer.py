@@ -1,9 +1,29 @@
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
+from ft.common.query import QueryPlan
 from ft.user.serializers import UserSerializer
-from ft.event.models import CarpoolTrip, Event
+from ft.event.models import CarpoolRequest, CarpoolTrip, Event
 from ft.event.serializers import EventSerializer
 from ft.user.models import User
 
+ACCEPTED_REQUESTS = QueryPlan(
+    fields=["seats_total"],
+    annotate={
+        "accepted_requests_count": Coalesce(
+            Subquery(
+                CarpoolRequest.objects.filter(trip=OuterRef("pk"), status="ACCEPTED")
+                .order_by()
+                .values("trip")
+                .annotate(count=Count("pk"))
+                .values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+    },
+)
+
 
 class CarpoolTripSerializer(serializers.ModelSerializer):
     """
@@ -49,16 +69,32 @@ class CarpoolTripSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
+            "version",
         ]
         read_only_fields = [
             "id",
             "created_at",
             "updated_at",
+            "version",
             "seats_available",
             "is_full",
         ]
+        query_plans = {
+            "seats_available": ACCEPTED_REQUESTS,
+            "is_full": ACCEPTED_REQUESTS,
+        }
 
     def create(self, validated_data):
         if "driver" not in validated_data:
             validated_data["driver"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class CarpoolTripFlatSerializer(CarpoolTripSerializer):
+    """
+    Serializer for the CarpoolTrip model in the normalized (sideloaded)
+    response shape: the driver and the event are referenced by ID.
+    """
+
+    driver = serializers.PrimaryKeyRelatedField(read_only=True)
+    event = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -109,3 +109,23 @@ class EventHostingRequestActionSerializer(serializers.Serializer):
 
     def validate(self, data):
         return data
+
+
+class EventHostingRequestBulkActionItemSerializer(serializers.Serializer):
+    """
+    Serializer for one action of a bulk request on hosting requests.
+    """
+
+    id = serializers.IntegerField()
+    action = serializers.ChoiceField(choices=["accept", "reject", "cancel"])
+    host_message = serializers.CharField(required=False, allow_blank=True)
+
+
+class EventHostingRequestBulkActionSerializer(serializers.Serializer):
+    """
+    Serializer for the bulk actions on the hosting requests.
+    """
+
+    actions = EventHostingRequestBulkActionItemSerializer(
+        many=True, allow_empty=False, max_length=500
+    )
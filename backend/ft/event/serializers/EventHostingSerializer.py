@@ -17,6 +17,7 @@ class EventHostingSerializer(serializers.ModelSerializer):
             "event",
             "host",
             "available_beds",
+            "beds_taken",
             "custom_rules",
             "address_override",
             "city_override",
@@ -25,8 +26,16 @@ class EventHostingSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
+            "version",
+        ]
+        read_only_fields = [
+            "id",
+            "host",
+            "beds_taken",
+            "created_at",
+            "updated_at",
+            "version",
         ]
-        read_only_fields = ["id", "host", "created_at", "updated_at"]
 
     def create(self, validated_data):
         """
@@ -1,6 +1,37 @@
 from rest_framework import serializers
-from ft.event.models import Event
-from django.db.models import Count
+from ft.common.query import QueryPlan
+from ft.event.models import Event, EventSubscription
+from django.db.models import Count, F, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce, RowNumber
+from django.db.models.expressions import Window
+
+
+def count_subscriptions(answer):
+    """Nombre d'inscriptions actives de l'événement avec la réponse donnée."""
+    counts = (
+        EventSubscription.objects.filter(
+            event=OuterRef("pk"), is_active=True, answer=answer
+        )
+        .order_by()
+        .values("event")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+FIRST_SUBSCRIBERS = Prefetch(
+    "eventsubscription_set",
+    queryset=EventSubscription.objects.annotate(
+        rank=Window(
+            RowNumber(), partition_by=F("event_id"), order_by=F("created_at").asc()
+        )
+    )
+    .filter(is_active=True, answer="YES", rank__lte=3)
+    .select_related("user")
+    .order_by("created_at"),
+    to_attr="first_yes_subscriptions",
+)
 
 
 class EventSerializer(serializers.ModelSerializer):
@@ -35,8 +66,25 @@ class EventSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        query_plans = {
+            "subscriptions_count": QueryPlan(
+                annotate={
+                    "subscriptions_yes": count_subscriptions("YES"),
+                    "subscriptions_no": count_subscriptions("NO"),
+                    "subscriptions_maybe": count_subscriptions("MAYBE"),
+                }
+            ),
+            "first_subscribers": QueryPlan(prefetch=[FIRST_SUBSCRIBERS]),
+        }
 
     def get_subscriptions_count(self, obj):
+        if hasattr(obj, "subscriptions_yes"):
+            return {
+                "YES": obj.subscriptions_yes,
+                "NO": obj.subscriptions_no,
+                "MAYBE": obj.subscriptions_maybe,
+            }
+
         counts = (
             obj.eventsubscription_set.filter(is_active=True)
             .values("answer")
@@ -51,11 +99,13 @@ class EventSerializer(serializers.ModelSerializer):
         return result
 
     def get_first_subscribers(self, obj):
-        subs = (
-            obj.eventsubscription_set.filter(is_active=True, answer="YES")
-            .select_related("user")
-            .order_by("created_at")[:3]
-        )
+        subs = getattr(obj, "first_yes_subscriptions", None)
+        if subs is None:
+            subs = (
+                obj.eventsubscription_set.filter(is_active=True, answer="YES")
+                .select_related("user")
+                .order_by("created_at")[:3]
+            )
         initials = []
         for sub in subs:
             first_initial = (sub.user.first_name or "").strip()[:1]
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from ft.event.models import EventSubscription
+from ft.event.models import Event, EventSubscription
 
 
 class EventSubscribeActionSerializer(serializers.ModelSerializer):
@@ -13,3 +13,37 @@ class EventSubscribeActionSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "id",
         ]
+
+
+class EventSubscribeBatchItemSerializer(serializers.Serializer):
+    event = serializers.IntegerField()
+    answer = serializers.ChoiceField(
+        choices=EventSubscription._meta.get_field("answer").choices,
+        default="YES",
+    )
+    can_invite = serializers.BooleanField(default=True)
+
+
+class EventSubscribeBatchSerializer(serializers.Serializer):
+    subscriptions = EventSubscribeBatchItemSerializer(
+        many=True, allow_empty=False, max_length=200
+    )
+
+    def validate_subscriptions(self, subscriptions):
+        """
+        Vérifie en une requête que tous les événements existent et sont
+        actifs. Si un événement apparaît plusieurs fois, la dernière réponse
+        l'emporte.
+        """
+        by_event = {item["event"]: item for item in subscriptions}
+        active_events = set(
+            Event.objects.filter(pk__in=by_event, is_active=True).values_list(
+                "pk", flat=True
+            )
+        )
+        unknown = sorted(set(by_event) - active_events)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Événement(s) introuvable(s) : {', '.join(map(str, unknown))}."
+            )
+        return list(by_event.values())
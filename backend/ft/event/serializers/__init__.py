@@ -1,28 +1,45 @@
 # Models
 from .EventSerializer import EventSerializer
 from .EventSubscriptionSerializer import EventSubscriptionSerializer
-from .EventSubscribeActionSerializer import EventSubscribeActionSerializer
+from .EventSubscribeActionSerializer import (
+    EventSubscribeActionSerializer,
+    EventSubscribeBatchSerializer,
+)
 from .EventHostingSerializer import EventHostingSerializer
 from .EventHostingRequestSerializer import (
     EventHostingRequestSerializer,
     EventHostingRequestActionSerializer,
+    EventHostingRequestBulkActionSerializer,
 )
-from .CarpoolTripSerializer import CarpoolTripSerializer
+from .CarpoolTripSerializer import CarpoolTripSerializer, CarpoolTripFlatSerializer
 from .CarpoolRequestSerializer import (
     CarpoolRequestSerializer,
+    CarpoolRequestFlatSerializer,
     CarpoolRequestActionSerializer,
+    CarpoolRequestBulkActionSerializer,
 )
 from .CarpoolPaymentSerializer import CarpoolPaymentSerializer
+from .AllocationActionSerializer import (
+    AllocationActionSerializer,
+    HostingAllocationActionSerializer,
+)
 
 __all__ = [
     "EventSerializer",
     "EventSubscriptionSerializer",
     "EventSubscribeActionSerializer",
+    "EventSubscribeBatchSerializer",
     "EventHostingSerializer",
     "EventHostingRequestSerializer",
     "EventHostingRequestActionSerializer",
+    "EventHostingRequestBulkActionSerializer",
     "CarpoolTripSerializer",
+    "CarpoolTripFlatSerializer",
     "CarpoolRequestSerializer",
+    "CarpoolRequestFlatSerializer",
     "CarpoolRequestActionSerializer",
+    "CarpoolRequestBulkActionSerializer",
     "CarpoolPaymentSerializer",
+    "AllocationActionSerializer",
+    "HostingAllocationActionSerializer",
 ]
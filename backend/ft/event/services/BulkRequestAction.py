@@ -0,0 +1,222 @@
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ft.event.models import (
+    CarpoolRequest,
+    CarpoolTrip,
+    EventHosting,
+    EventHostingRequest,
+    OutboxMessage,
+)
+
+
+class BulkRequestAction:
+    """
+    Base des actions groupées sur des demandes (covoiturage ou hébergement).
+
+    Toutes les demandes visées et les offres concernées sont verrouillées en
+    une requête chacune, les règles sont vérifiées en mémoire, puis les
+    changements sont écrits avec un seul `bulk_update` par table, avec les
+    notifications correspondantes dans l'outbox. Une action refusée
+    n'empêche pas les autres : chaque demande reçoit son propre résultat.
+
+    Les sous-classes fournissent `lock_requests(ids)` (demandes visibles par
+    l'utilisateur, verrouillées, indexées par ID), `lock_offers(requests)`
+    (verrou et état des offres concernées), `perform(request, action)`
+    (applique l'action en mémoire et renvoie un message d'erreur ou None) et
+    `save(requests)` (écriture groupée des demandes modifiées).
+    """
+
+    message_field = None
+    notification_kind = None
+
+    def __init__(self, user):
+        self.user = user
+
+    def run(self, actions):
+        """
+        Applique la liste `actions` (dictionnaires avec `id`, `action` et un
+        message optionnel) et renvoie la table des résultats par ID.
+        """
+        results = {}
+        with transaction.atomic():
+            requests = self.lock_requests([item["id"] for item in actions])
+            self.lock_offers(requests.values())
+            now = timezone.now()
+            changed = {}
+
+            for item in actions:
+                request = requests.get(item["id"])
+                if request is None:
+                    results[item["id"]] = {"error": "Demande introuvable."}
+                    continue
+
+                error = self.perform(request, item["action"])
+                if error:
+                    results[item["id"]] = {"error": error}
+                    continue
+
+                message = item.get(self.message_field)
+                if message:
+                    setattr(request, self.message_field, message)
+                request.updated_at = now
+                changed[request.pk] = request
+                results[item["id"]] = {"status": request.status}
+
+            self.save(list(changed.values()))
+            OutboxMessage.bulk_enqueue(
+                self.notification_kind,
+                [
+                    {"id": request.pk, "status": request.status}
+                    for request in changed.values()
+                ],
+            )
+
+        return results
+
+
+class CarpoolRequestBulkAction(BulkRequestAction):
+    """
+    Actions groupées accept / reject / cancel sur des demandes de covoiturage.
+    Les places restantes d'un trajet suivent la règle de
+    `CarpoolTrip.seats_available` (places moins demandes acceptées) et sont
+    calculées une fois, sous verrou : chaque action a le même résultat que
+    la même action faite seule.
+    """
+
+    message_field = "response_message"
+    notification_kind = "carpool_request_status"
+
+    def lock_requests(self, ids):
+        return {
+            request.pk: request
+            for request in CarpoolRequest.objects.filter(pk__in=ids)
+            .filter(Q(passenger=self.user) | Q(trip__driver=self.user))
+            .select_for_update(of=("self",))
+        }
+
+    def lock_offers(self, requests):
+        trip_ids = {request.trip_id for request in requests}
+        self.trips = (
+            CarpoolTrip.objects.order_by().select_for_update().in_bulk(trip_ids)
+        )
+        accepted = (
+            CarpoolRequest.objects.filter(trip__in=trip_ids, status="ACCEPTED")
+            .order_by()
+            .values("trip")
+            .annotate(count=Count("pk"))
+        )
+        self.seats_left = {trip.pk: trip.seats_total for trip in self.trips.values()}
+        for row in accepted:
+            self.seats_left[row["trip"]] -= row["count"]
+
+    def perform(self, request, action):
+        trip = self.trips[request.trip_id]
+
+        if action in ("accept", "reject"):
+            if trip.driver_id != self.user.pk:
+                return "Seul le conducteur peut accepter ou refuser une demande."
+            if request.status != "PENDING":
+                return (
+                    f"Cette demande a déjà été "
+                    f"{request.get_status_display().lower()}."
+                )
+            if action == "accept":
+                if self.seats_left[trip.pk] < request.seats_requested:
+                    return (
+                        f"Il ne reste que {self.seats_left[trip.pk]} "
+                        f"place(s) disponible(s)."
+                    )
+                self.seats_left[trip.pk] -= 1
+                request.status = "ACCEPTED"
+            else:
+                request.status = "REJECTED"
+
+        elif action == "cancel":
+            if request.passenger_id != self.user.pk:
+                return "Seul le passager peut annuler sa demande."
+            if request.status in ["CANCELLED", "REJECTED"]:
+                return (
+                    f"Cette demande a déjà été "
+                    f"{request.get_status_display().lower()}."
+                )
+            if request.status == "ACCEPTED":
+                self.seats_left[trip.pk] += 1
+            request.status = "CANCELLED"
+
+        return None
+
+    def save(self, requests):
+        for request in requests:
+            request.version += 1
+        CarpoolRequest.objects.bulk_update(
+            requests, ["status", "response_message", "updated_at", "version"]
+        )
+
+
+class HostingRequestBulkAction(BulkRequestAction):
+    """
+    Actions groupées accept / reject / cancel sur des demandes d'hébergement.
+    Le compteur `beds_taken` des hébergements est vérifié et mis à jour sous
+    verrou, avec une seule écriture groupée.
+    """
+
+    message_field = "host_message"
+    notification_kind = "hosting_request_status"
+
+    def lock_requests(self, ids):
+        return {
+            request.pk: request
+            for request in EventHostingRequest.objects.filter(pk__in=ids)
+            .filter(Q(requester=self.user) | Q(hosting__host=self.user))
+            .select_for_update(of=("self",))
+        }
+
+    def lock_offers(self, requests):
+        hosting_ids = {request.hosting_id for request in requests}
+        self.hostings = (
+            EventHosting.objects.order_by().select_for_update().in_bulk(hosting_ids)
+        )
+        self.changed_hostings = {}
+
+    def perform(self, request, action):
+        hosting = self.hostings[request.hosting_id]
+        Status = EventHostingRequest.Status
+
+        if action in ("accept", "reject"):
+            if hosting.host_id != self.user.pk:
+                return "Vous n'êtes pas autorisé à répondre à cette demande."
+            if request.status != Status.PENDING:
+                return "Cette demande ne peut plus être modifiée."
+            if action == "accept":
+                if hosting.places_available <= 0:
+                    return "Vous n'avez plus de places disponibles."
+                self.shift_beds_taken(hosting, 1)
+                request.status = Status.ACCEPTED
+            else:
+                request.status = Status.REJECTED
+
+        elif action == "cancel":
+            if request.requester_id != self.user.pk:
+                return "Vous n'êtes pas autorisé à annuler cette demande."
+            if request.status not in [Status.PENDING, Status.ACCEPTED]:
+                return "Cette demande ne peut plus être annulée."
+            if request.status == Status.ACCEPTED:
+                self.shift_beds_taken(hosting, -1)
+            request.status = Status.CANCELLED
+
+        return None
+
+    def shift_beds_taken(self, hosting, delta):
+        hosting.beds_taken = max(hosting.beds_taken + delta, 0)
+        self.changed_hostings[hosting.pk] = hosting
+
+    def save(self, requests):
+        EventHostingRequest.objects.bulk_update(
+            requests, ["status", "host_message", "updated_at"]
+        )
+        hostings = list(self.changed_hostings.values())
+        for hosting in hostings:
+            hosting.version += 1
+        EventHosting.objects.bulk_update(hostings, ["beds_taken", "version"])
@@ -0,0 +1,247 @@
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ft.event.models import CarpoolRequest, CarpoolTrip, OutboxMessage
+from .MinCostFlow import MinCostFlow
+from .utils import normalize_city
+
+
+class CarpoolAssignment:
+    """
+    Répartit en une passe toutes les demandes de covoiturage en attente d'un
+    événement sur ses trajets actifs.
+
+    Le problème est résolu comme un flot de coût minimal : chaque passager
+    apporte `seats_requested` places, chaque trajet en absorbe au plus ses
+    places restantes (`CarpoolTrip.seats_available`, la règle de l'API). Le
+    coût favorise les trajets déjà demandés par le passager, puis ceux qui
+    partent de la même ville. Une demande n'est jamais répartie sur
+    plusieurs voitures : les rares demandes que le flot découpe sont
+    replacées ensuite, de façon gloutonne, dans la capacité restante. Un
+    passager placé sur un trajet qu'il avait demandé voit cette demande-là
+    acceptée ; ses autres demandes sont remplacées.
+    """
+
+    REQUESTED_TRIP_COST = 0
+    SAME_CITY_COST = 1
+    HOME_CITY_COST = 2
+    OTHER_CITY_COST = 5
+
+    def __init__(self, event):
+        self.event = event
+
+    def run(self, dry_run=False):
+        """
+        Calcule l'affectation et, sauf en mode `dry_run`, l'applique dans une
+        seule transaction en verrouillant les trajets de l'événement.
+        """
+        with transaction.atomic():
+            trips = list(self.get_trips())
+            requests = list(self.get_pending_requests())
+            placed_passengers = set(
+                CarpoolRequest.objects.filter(
+                    trip__event=self.event, status="ACCEPTED"
+                ).values_list("passenger_id", flat=True)
+            )
+
+            assignments, unassigned, superseded = self.plan(
+                trips, requests, placed_passengers
+            )
+
+            if not dry_run:
+                self.apply(assignments, superseded)
+
+        return {
+            "event": self.event.pk,
+            "dry_run": dry_run,
+            "assigned": [
+                {
+                    "request": request.pk,
+                    "trip": trip.pk,
+                    "seats": request.seats_requested,
+                }
+                for request, trip in assignments
+            ],
+            "unassigned": [request.pk for request in unassigned],
+            "superseded": [request.pk for request in superseded],
+        }
+
+    def get_trips(self):
+        """
+        Trajets actifs de l'événement, verrouillés, annotés avec le nombre de
+        demandes acceptées utilisé par `seats_available`.
+        """
+        accepted_requests = (
+            CarpoolRequest.objects.filter(trip=OuterRef("pk"), status="ACCEPTED")
+            .order_by()
+            .values("trip")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return (
+            CarpoolTrip.objects.filter(event=self.event, is_active=True)
+            .select_for_update(of=("self",))
+            .annotate(
+                accepted_requests_count=Coalesce(
+                    Subquery(accepted_requests, output_field=IntegerField()), 0
+                )
+            )
+            .order_by("departure_datetime", "pk")
+        )
+
+    def get_pending_requests(self):
+        """Demandes en attente de l'événement, verrouillées."""
+        return (
+            CarpoolRequest.objects.filter(
+                trip__event=self.event, status="PENDING", is_active=True
+            )
+            .select_related("passenger", "trip")
+            .select_for_update(of=("self",))
+            .order_by("created_at", "pk")
+        )
+
+    def trip_cost(self, trip, preferred_trips, origins, home_city):
+        """Coût de placement d'un passager sur un trajet."""
+        if trip.pk in preferred_trips:
+            return self.REQUESTED_TRIP_COST
+        city = normalize_city(trip.departure_city)
+        if city in origins:
+            return self.SAME_CITY_COST
+        if city and city == home_city:
+            return self.HOME_CITY_COST
+        return self.OTHER_CITY_COST
+
+    @staticmethod
+    def own_requests(group):
+        """Première demande du passager pour chacun des trajets demandés."""
+        requests = {}
+        for request in group:
+            requests.setdefault(request.trip_id, request)
+        return requests
+
+    def plan(self, trips, requests, placed_passengers=()):
+        """
+        Calcule l'affectation sans toucher à la base.
+
+        `trips` doivent porter l'annotation `accepted_requests_count`. Chaque
+        demande placée consomme ses `seats_requested` places : une affectation
+        calculée ici est donc toujours acceptable par l'API. Renvoie le triplet
+        (affectations, demandes non placées, demandes remplacées) où les
+        affectations sont des couples (demande, trajet) et les demandes
+        remplacées sont les autres demandes en attente d'un passager placé.
+        """
+        groups = {}
+        for request in requests:
+            if request.passenger_id in placed_passengers:
+                continue
+            groups.setdefault(request.passenger_id, []).append(request)
+
+        capacity = {trip.pk: max(trip.seats_available, 0) for trip in trips}
+        passengers = list(groups.values())
+
+        source, sink = 0, 1
+        trip_offset = 2 + len(passengers)
+        solver = MinCostFlow(trip_offset + len(trips))
+        candidates = []
+
+        for index, group in enumerate(passengers):
+            primary = group[0]
+            seats = primary.seats_requested
+            preferred_trips = {request.trip_id for request in group}
+            own = self.own_requests(group)
+            origins = {normalize_city(request.trip.departure_city) for request in group}
+            home_city = normalize_city(primary.passenger.city)
+
+            solver.add_edge(source, 2 + index, seats, 0)
+            options = []
+            for position, trip in enumerate(trips):
+                if trip.driver_id == primary.passenger_id:
+                    continue
+                if capacity[trip.pk] < seats:
+                    continue
+                # La demande déjà faite pour ce trajet sera celle acceptée :
+                # elle doit tenir dans les places prévues pour le passager.
+                if own.get(trip.pk, primary).seats_requested > seats:
+                    continue
+                cost = self.trip_cost(trip, preferred_trips, origins, home_city)
+                edge = solver.add_edge(2 + index, trip_offset + position, seats, cost)
+                options.append((cost, position, trip, edge))
+            candidates.append(options)
+
+        for position, trip in enumerate(trips):
+            solver.add_edge(trip_offset + position, sink, capacity[trip.pk], 0)
+
+        solver.solve(source, sink)
+
+        assignments = []
+        leftovers = []
+        remaining = dict(capacity)
+        for group, options in zip(passengers, candidates):
+            primary = group[0]
+            chosen = next(
+                (
+                    trip
+                    for _, _, trip, edge in options
+                    if solver.flow_on(edge) == primary.seats_requested
+                ),
+                None,
+            )
+            if chosen is None:
+                leftovers.append((group, options))
+            else:
+                remaining[chosen.pk] -= primary.seats_requested
+                assignments.append((group, chosen))
+
+        unassigned = []
+        leftovers.sort(key=lambda item: -item[0][0].seats_requested)
+        for group, options in leftovers:
+            seats = group[0].seats_requested
+            chosen = next(
+                (
+                    trip
+                    for _, _, trip, _ in sorted(options, key=lambda o: o[:2])
+                    if remaining[trip.pk] >= seats
+                ),
+                None,
+            )
+            if chosen is None:
+                unassigned.append(group[0])
+            else:
+                remaining[chosen.pk] -= seats
+                assignments.append((group, chosen))
+
+        placed = []
+        superseded = []
+        for group, trip in assignments:
+            request = self.own_requests(group).get(trip.pk, group[0])
+            placed.append((request, trip))
+            superseded.extend(other for other in group if other is not request)
+        return placed, unassigned, superseded
+
+    def apply(self, assignments, superseded):
+        """
+        Enregistre l'affectation avec des mises à jour groupées, et met dans
+        l'outbox la notification de chaque demande acceptée ou annulée.
+        """
+        now = timezone.now()
+        accepted = []
+        for request, trip in assignments:
+            request.trip = trip
+            request.status = "ACCEPTED"
+            request.updated_at = now
+            request.version += 1
+            accepted.append(request)
+
+        CarpoolRequest.objects.bulk_update(
+            accepted, ["trip", "status", "updated_at", "version"]
+        )
+        CarpoolRequest.objects.filter(
+            pk__in=[request.pk for request in superseded]
+        ).update(status="CANCELLED", updated_at=now, version=F("version") + 1)
+        OutboxMessage.bulk_enqueue(
+            "carpool_request_status",
+            [{"id": request.pk, "status": "ACCEPTED"} for request in accepted]
+            + [{"id": request.pk, "status": "CANCELLED"} for request in superseded],
+        )
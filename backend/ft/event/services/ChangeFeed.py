@@ -0,0 +1,173 @@
+import asyncio
+import json
+import logging
+import time
+
+import psycopg
+from django.conf import settings
+from django.db import connections
+from psycopg.conninfo import make_conninfo
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeed:
+    """
+    Notifications de changement poussées par Postgres (`LISTEN/NOTIFY`).
+
+    Des triggers (migration `0021_change_notifications`) publient sur le
+    canal `ft_changes` un message JSON compact à chaque changement d'une
+    demande de covoiturage, d'une demande d'hébergement, d'un paiement ou
+    d'une inscription à un événement. La clé `u` liste les utilisateurs
+    concernés ; un message sans `u` (compteurs d'un événement) concerne tout
+    le monde.
+
+    Sous ASGI, chaque processus n'ouvre qu'une connexion d'écoute, partagée
+    par tous ses abonnés : les messages sont répartis dans une file par
+    abonné. Une file pleine est vidée et remplacée par un message `resync`,
+    qui invite le client à recharger ses données. Sous WSGI, `listen()` ouvre
+    une connexion par flux et le ferme après `CHANGE_FEED_WSGI_DURATION`
+    secondes ; le navigateur se reconnecte de lui-même.
+    """
+
+    CHANNEL = "ft_changes"
+    RESYNC = {"t": "resync"}
+
+    _queues = {}
+    _listener = None
+    _ready = None
+
+    @staticmethod
+    def conninfo():
+        database = connections["default"].settings_dict
+        return make_conninfo(
+            **{
+                name: value
+                for name, value in (
+                    ("dbname", database["NAME"]),
+                    ("user", database["USER"]),
+                    ("password", database["PASSWORD"]),
+                    ("host", database["HOST"]),
+                    ("port", database["PORT"]),
+                )
+                if value
+            }
+        )
+
+    @classmethod
+    def decode(cls, payload, user_id):
+        """Message destiné à `user_id`, sans la liste des destinataires."""
+        message = json.loads(payload)
+        users = message.pop("u", None)
+        if users is not None and user_id not in users:
+            return None
+        return message
+
+    @classmethod
+    def dispatch(cls, payload):
+        message = json.loads(payload)
+        users = message.pop("u", None)
+        if users is None:
+            targets = [queue for queues in cls._queues.values() for queue in queues]
+        else:
+            targets = [
+                queue for user in set(users) for queue in cls._queues.get(user, ())
+            ]
+        for queue in targets:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(cls.RESYNC)
+
+    @classmethod
+    async def subscribe(cls, user_id):
+        """
+        Générateur asynchrone des messages de `user_id`. Renvoie None une
+        fois l'écoute active, puis toutes les `CHANGE_FEED_HEARTBEAT`
+        secondes sans message, pour que la vue entretienne la connexion.
+        """
+        queue = asyncio.Queue(maxsize=settings.CHANGE_FEED_QUEUE_SIZE)
+        cls._queues.setdefault(user_id, set()).add(queue)
+        try:
+            await cls.start()
+            yield None
+            while True:
+                try:
+                    yield await asyncio.wait_for(
+                        queue.get(), settings.CHANGE_FEED_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            queues = cls._queues.get(user_id, set())
+            queues.discard(queue)
+            if not queues:
+                cls._queues.pop(user_id, None)
+
+    @classmethod
+    async def start(cls):
+        """Démarre l'écoute du processus et attend que LISTEN soit actif."""
+        loop = asyncio.get_running_loop()
+        if (
+            cls._listener is None
+            or cls._listener.done()
+            or cls._listener.get_loop() is not loop
+        ):
+            cls._ready = asyncio.Event()
+            cls._listener = loop.create_task(cls._listen())
+        await asyncio.wait_for(cls._ready.wait(), settings.CHANGE_FEED_HEARTBEAT)
+
+    @classmethod
+    async def stop(cls):
+        if cls._listener is not None and not cls._listener.done():
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+        cls._listener = None
+
+    @classmethod
+    async def _listen(cls):
+        while cls._queues:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    cls.conninfo(), autocommit=True
+                ) as connection:
+                    await connection.execute(f"LISTEN {cls.CHANNEL}")
+                    cls._ready.set()
+                    while cls._queues:
+                        async for notify in connection.notifies(
+                            timeout=settings.CHANGE_FEED_HEARTBEAT
+                        ):
+                            cls.dispatch(notify.payload)
+            except psycopg.OperationalError:
+                logger.warning("Connexion d'écoute perdue, reconnexion", exc_info=True)
+                await asyncio.sleep(1)
+        cls._listener = None
+
+    @classmethod
+    def listen(cls, user_id, duration=None):
+        """
+        Générateur bloquant des messages de `user_id`, sur sa propre
+        connexion, pendant `duration` secondes. Renvoie None à l'ouverture
+        puis à chaque battement sans message.
+        """
+        duration = duration or settings.CHANGE_FEED_WSGI_DURATION
+        deadline = time.monotonic() + duration
+        with psycopg.connect(cls.conninfo(), autocommit=True) as connection:
+            connection.execute(f"LISTEN {cls.CHANNEL}")
+            yield None
+            while (remaining := deadline - time.monotonic()) > 0:
+                received = False
+                for notify in connection.notifies(
+                    timeout=min(remaining, settings.CHANGE_FEED_HEARTBEAT)
+                ):
+                    message = cls.decode(notify.payload, user_id)
+                    if message is not None:
+                        received = True
+                        yield message
+                if not received:
+                    yield None
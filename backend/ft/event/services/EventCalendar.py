@@ -0,0 +1,228 @@
+import datetime
+import hashlib
+import secrets
+
+from django.core import signing
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from ft.event.models import Event
+from ft.user.models import User
+
+
+class EventCalendar:
+    """
+    Flux iCalendar (RFC 5545) d'une liste d'événements.
+
+    Le flux est généré en une seule requête lue par morceaux. Son ETag est
+    calculé par une requête d'agrégat (nombre d'événements et dates de
+    dernière modification) : il change dès qu'un événement ou une réponse
+    du flux change, et sert aussi de clé de version pour le cache du corps.
+    Les applications de calendrier qui interrogent le flux toutes les
+    quelques minutes reçoivent donc un 304, ou au pire le corps en cache.
+    """
+
+    PRODID = "-//France Tocarde//Evenements//FR"
+    CACHE_TIMEOUT = 60 * 60
+    CHUNK_SIZE = 500
+    TOKEN_SALT = "ft.event.calendar"
+
+    def __init__(self, scope, name, events, version_fields=("updated_at",)):
+        self.scope = scope
+        self.name = name
+        self.events = events
+        self.version_fields = version_fields
+
+    @classmethod
+    def public(cls):
+        """Calendrier des événements publics et actifs."""
+        return cls(
+            "public",
+            "France Tocarde",
+            Event.objects.filter(is_active=True, is_public=True),
+        )
+
+    @classmethod
+    def for_user(cls, user):
+        """Calendrier des événements auxquels l'utilisateur a répondu oui."""
+        return cls(
+            f"user:{user.pk}",
+            "France Tocarde - Mes événements",
+            Event.objects.filter(
+                is_active=True,
+                eventsubscription__user=user,
+                eventsubscription__answer="YES",
+                eventsubscription__is_active=True,
+            ),
+            version_fields=("updated_at", "eventsubscription__updated_at"),
+        )
+
+    @classmethod
+    def signer(cls, user):
+        """
+        Signeur propre à l'utilisateur : son `calendar_secret` entre dans le
+        sel, si bien que le changer invalide tous ses anciens jetons.
+        """
+        return signing.Signer(salt=f"{cls.TOKEN_SALT}:{user.calendar_secret}")
+
+    @classmethod
+    def user_token(cls, user):
+        """Jeton signé qui identifie l'utilisateur dans l'URL de son flux."""
+        return cls.signer(user).sign(str(user.pk))
+
+    @classmethod
+    def user_from_token(cls, token):
+        """
+        Utilisateur actif du jeton, ou None si le jeton est faux ou révoqué.
+        """
+        user_id, _, _ = token.partition(":")
+        if not user_id.isdigit():
+            return None
+        user = User.objects.filter(pk=user_id, is_active=True).first()
+        if user is None:
+            return None
+        try:
+            cls.signer(user).unsign(token)
+        except signing.BadSignature:
+            return None
+        return user
+
+    @classmethod
+    def rotate_user_token(cls, user):
+        """
+        Révoque l'URL actuelle du flux de l'utilisateur et renvoie le nouveau
+        jeton.
+        """
+        user.calendar_secret = secrets.token_hex(16)
+        user.save(update_fields=["calendar_secret"])
+        return cls.user_token(user)
+
+    def etag(self):
+        aggregates = self.events.order_by().aggregate(
+            count=Count("pk"),
+            **{
+                f"version_{index}": Max(field)
+                for index, field in enumerate(self.version_fields)
+            },
+        )
+        key = "|".join(
+            [self.scope]
+            + [
+                str(value.timestamp()) if value else "-"
+                for name, value in sorted(aggregates.items())
+                if name != "count"
+            ]
+            + [str(aggregates["count"])]
+        )
+        return '"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def content(self, etag):
+        """
+        Renvoie le corps du flux : depuis le cache s'il existe pour cette
+        version, sinon un générateur qui le met en cache une fois terminé.
+        """
+        cache_key = f"ft:event:calendar:{etag}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return [cached]
+        return self.stream(cache_key)
+
+    def stream(self, cache_key=None):
+        chunks = []
+        for chunk in self.generate():
+            chunks.append(chunk)
+            yield chunk
+        if cache_key:
+            cache.set(cache_key, "".join(chunks), self.CACHE_TIMEOUT)
+
+    def generate(self):
+        now = self.format_datetime(datetime.datetime.now(datetime.timezone.utc))
+        yield self.lines(
+            ("BEGIN", "VCALENDAR"),
+            ("VERSION", "2.0"),
+            ("PRODID", self.PRODID),
+            ("CALSCALE", "GREGORIAN"),
+            ("METHOD", "PUBLISH"),
+            ("X-WR-CALNAME", self.escape(self.name)),
+            ("X-WR-TIMEZONE", "Europe/Paris"),
+        )
+
+        rows = (
+            self.events.distinct()
+            .order_by("start_date", "pk")
+            .values_list(
+                "pk",
+                "name",
+                "description",
+                "location",
+                "start_date",
+                "end_date",
+                "url_website",
+                "updated_at",
+            )
+        )
+        for (
+            pk,
+            name,
+            description,
+            location,
+            start_date,
+            end_date,
+            url,
+            updated_at,
+        ) in rows.iterator(chunk_size=self.CHUNK_SIZE):
+            properties = [
+                ("BEGIN", "VEVENT"),
+                ("UID", f"event-{pk}@france-tocarde"),
+                ("DTSTAMP", now),
+                ("LAST-MODIFIED", self.format_datetime(updated_at)),
+                ("DTSTART", self.format_datetime(start_date)),
+                ("DTEND", self.format_datetime(end_date)),
+                ("SUMMARY", self.escape(name)),
+                ("LOCATION", self.escape(location)),
+            ]
+            if description:
+                properties.append(("DESCRIPTION", self.escape(description)))
+            if url:
+                properties.append(("URL", url))
+            properties.append(("END", "VEVENT"))
+            yield self.lines(*properties)
+
+        yield self.lines(("END", "VCALENDAR"))
+
+    def lines(self, *properties):
+        return "".join(self.fold(f"{name}:{value}") for name, value in properties)
+
+    @staticmethod
+    def fold(line):
+        """Coupe une ligne à 75 octets, les suites commencent par un espace."""
+        encoded = line.encode()
+        if len(encoded) <= 75:
+            return line + "\r\n"
+
+        parts = []
+        current = ""
+        limit = 75
+        for char in line:
+            if len((current + char).encode()) > limit:
+                parts.append(current)
+                current = ""
+                limit = 74
+            current += char
+        parts.append(current)
+        return "\r\n ".join(parts) + "\r\n"
+
+    @staticmethod
+    def escape(value):
+        return (
+            (value or "")
+            .replace("\\", "\\\\")
+            .replace(";", "\\;")
+            .replace(",", "\\,")
+            .replace("\r\n", "\\n")
+            .replace("\n", "\\n")
+        )
+
+    @staticmethod
+    def format_datetime(value):
+        return value.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
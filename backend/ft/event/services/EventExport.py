@@ -0,0 +1,148 @@
+import csv
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from ft.event.models import CarpoolRequest, EventHostingRequest, EventSubscription
+
+
+class Echo:
+    """Pseudo-fichier dont `write` renvoie la ligne au lieu de la stocker."""
+
+    def write(self, value):
+        return value
+
+
+class EventExport:
+    """
+    Exports CSV des participants, hébergements et covoiturages d'un ou
+    plusieurs événements.
+
+    Chaque export est une seule requête avec jointures (`values_list`), lue
+    par un curseur serveur (`iterator`) et écrite ligne à ligne dans une
+    `StreamingHttpResponse` : la mémoire reste constante quelle que soit la
+    taille de l'événement. Le fichier commence par un BOM UTF-8 et utilise
+    le point-virgule pour s'ouvrir correctement dans Excel. Les textes qui
+    commencent comme une formule sont préfixés d'une apostrophe, pour que le
+    tableur les affiche au lieu de les exécuter.
+    """
+
+    CHUNK_SIZE = 2000
+    FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+    KINDS = ("participants", "hostings", "carpools")
+
+    def __init__(self, events):
+        self.events = events
+
+    def participants(self):
+        answers = dict(EventSubscription._meta.get_field("answer").choices)
+        columns = [
+            ("Événement", "event__name", None),
+            ("Nom", "user__last_name", None),
+            ("Prénom", "user__first_name", None),
+            ("Surnom", "user__faluche_nickname", None),
+            ("Email", "user__email", None),
+            ("Téléphone", "user__phone_number", None),
+            ("Ville", "user__city", None),
+            ("Réponse", "answer", answers.get),
+            ("Peut inviter", "can_invite", self.format_bool),
+            ("Inscrit le", "created_at", self.format_datetime),
+        ]
+        queryset = EventSubscription.objects.filter(
+            event__in=self.events, is_active=True
+        ).order_by("event__start_date", "event", "user__last_name", "user__first_name")
+        return columns, queryset
+
+    def hostings(self):
+        statuses = dict(EventHostingRequest.Status.choices)
+        columns = [
+            ("Événement", "hosting__event__name", None),
+            ("Hôte nom", "hosting__host__last_name", None),
+            ("Hôte prénom", "hosting__host__first_name", None),
+            ("Hôte email", "hosting__host__email", None),
+            ("Hôte téléphone", "hosting__host__phone_number", None),
+            ("Ville", "hosting__host__city", None),
+            ("Ville (hébergement)", "hosting__city_override", None),
+            ("Adresse (hébergement)", "hosting__address_override", None),
+            ("Lits", "hosting__available_beds", None),
+            ("Invité nom", "requester__last_name", None),
+            ("Invité prénom", "requester__first_name", None),
+            ("Invité email", "requester__email", None),
+            ("Invité téléphone", "requester__phone_number", None),
+            ("Statut", "status", statuses.get),
+            ("Demandé le", "created_at", self.format_datetime),
+        ]
+        queryset = EventHostingRequest.objects.filter(
+            hosting__event__in=self.events
+        ).order_by(
+            "hosting__event__start_date",
+            "hosting__event",
+            "hosting__host__last_name",
+            "hosting",
+            "requester__last_name",
+        )
+        return columns, queryset
+
+    def carpools(self):
+        statuses = dict(CarpoolRequest.STATUS_CHOICES)
+        columns = [
+            ("Événement", "trip__event__name", None),
+            ("Conducteur nom", "trip__driver__last_name", None),
+            ("Conducteur prénom", "trip__driver__first_name", None),
+            ("Conducteur téléphone", "trip__driver__phone_number", None),
+            ("Départ", "trip__departure_city", None),
+            ("Arrivée", "trip__arrival_city", None),
+            ("Date de départ", "trip__departure_datetime", self.format_datetime),
+            ("Places", "trip__seats_total", None),
+            ("Passager nom", "passenger__last_name", None),
+            ("Passager prénom", "passenger__first_name", None),
+            ("Passager téléphone", "passenger__phone_number", None),
+            ("Places demandées", "seats_requested", None),
+            ("Statut", "status", statuses.get),
+        ]
+        queryset = CarpoolRequest.objects.filter(
+            trip__event__in=self.events, is_active=True
+        ).order_by("trip__departure_datetime", "trip", "passenger__last_name")
+        return columns, queryset
+
+    def rows(self, kind):
+        """En-tête puis lignes de l'export `kind`, lues par morceaux."""
+        columns, queryset = getattr(self, kind)()
+        yield [header for header, _, _ in columns]
+
+        formatters = [formatter for _, _, formatter in columns]
+        fields = [field for _, field, _ in columns]
+        for values in queryset.values_list(*fields).iterator(
+            chunk_size=self.CHUNK_SIZE
+        ):
+            yield [
+                "" if value is None else (formatter(value) if formatter else value)
+                for formatter, value in zip(formatters, values)
+            ]
+
+    def stream_csv(self, kind):
+        writer = csv.writer(Echo(), delimiter=";")
+        yield "\ufeff"
+        for row in self.rows(kind):
+            yield writer.writerow([self.escape_formula(value) for value in row])
+
+    def response(self, kind, filename):
+        response = StreamingHttpResponse(
+            self.stream_csv(kind), content_type="text/csv; charset=utf-8"
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+        return response
+
+    @classmethod
+    def escape_formula(cls, value):
+        if isinstance(value, str) and value.startswith(cls.FORMULA_PREFIXES):
+            return "'" + value
+        return value
+
+    @staticmethod
+    def format_bool(value):
+        return "Oui" if value else "Non"
+
+    @staticmethod
+    def format_datetime(value):
+        return timezone.localtime(value).strftime("%d/%m/%Y %H:%M")
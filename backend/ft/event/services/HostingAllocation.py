@@ -0,0 +1,188 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from ft.event.models import EventHosting, EventHostingRequest, OutboxMessage
+from .MinCostFlow import MinCostFlow
+from .utils import is_in_location
+
+
+class HostingAllocation:
+    """
+    Attribue en une passe les lits des hébergements actifs d'un événement aux
+    demandeurs qui ont des demandes en attente.
+
+    Chaque demandeur occupe un lit et ne peut être placé que chez un hôte
+    qu'il a sollicité : ses demandes, dans l'ordre où il les a faites, sont
+    ses préférences. Le coût croît avec le rang de la préférence et pénalise
+    les hébergements situés hors de la ville de l'événement. Le problème est
+    un flot de coût minimal, exact et rapide même pour des milliers de
+    demandeurs.
+    """
+
+    PREFERENCE_STEP_COST = 2
+    OUT_OF_TOWN_COST = 1
+
+    def __init__(self, event):
+        self.event = event
+
+    def run(self, dry_run=False, reject_unassigned=False):
+        """
+        Calcule l'attribution et, sauf en mode `dry_run`, l'applique dans une
+        seule transaction : la demande retenue de chaque demandeur placé est
+        acceptée, ses autres demandes en attente sont refusées. Avec
+        `reject_unassigned`, les demandes des demandeurs sans lit sont aussi
+        refusées.
+        """
+        with transaction.atomic():
+            hostings = list(self.get_hostings())
+            requests = list(self.get_pending_requests())
+            placed_requesters = set(
+                EventHostingRequest.objects.filter(
+                    hosting__event=self.event,
+                    status=EventHostingRequest.Status.ACCEPTED,
+                ).values_list("requester_id", flat=True)
+            )
+
+            accepted, rejected, unassigned = self.plan(
+                hostings, requests, placed_requesters
+            )
+            if reject_unassigned:
+                rejected = rejected + unassigned
+
+            if not dry_run:
+                self.apply(hostings, accepted, rejected)
+
+        return {
+            "event": self.event.pk,
+            "dry_run": dry_run,
+            "accepted": [
+                {"request": request.pk, "hosting": request.hosting_id}
+                for request in accepted
+            ],
+            "rejected": [request.pk for request in rejected],
+            "unassigned": [request.pk for request in unassigned],
+        }
+
+    def get_hostings(self):
+        """Hébergements actifs de l'événement, verrouillés."""
+        return (
+            EventHosting.objects.filter(event=self.event, is_active=True)
+            .select_related("host")
+            .select_for_update(of=("self",))
+            .order_by("pk")
+        )
+
+    def get_pending_requests(self):
+        """Demandes en attente de l'événement, verrouillées."""
+        return (
+            EventHostingRequest.objects.filter(
+                hosting__event=self.event,
+                status=EventHostingRequest.Status.PENDING,
+            )
+            .select_for_update(of=("self",))
+            .order_by("created_at", "pk")
+        )
+
+    def hosting_cost(self, hosting, rank, event_location):
+        """Coût d'attribution d'un lit pour la préférence de rang `rank`."""
+        cost = rank * self.PREFERENCE_STEP_COST
+        city = hosting.city_override or hosting.host.city
+        if not is_in_location(city, event_location):
+            cost += self.OUT_OF_TOWN_COST
+        return cost
+
+    def plan(self, hostings, requests, placed_requesters=()):
+        """
+        Calcule l'attribution sans toucher à la base.
+
+        Renvoie le triplet (demandes acceptées, demandes refusées, demandes
+        sans lit).
+        """
+        capacity = {
+            hosting.pk: max(hosting.places_available, 0) for hosting in hostings
+        }
+        position = {hosting.pk: index for index, hosting in enumerate(hostings)}
+        event_location = self.event.location
+
+        groups = {}
+        for request in requests:
+            if request.requester_id in placed_requesters:
+                continue
+            if request.hosting_id not in position:
+                continue
+            groups.setdefault(request.requester_id, []).append(request)
+        guests = list(groups.values())
+
+        source, sink = 0, 1
+        hosting_offset = 2 + len(guests)
+        solver = MinCostFlow(hosting_offset + len(hostings))
+
+        edges = []
+        for index, group in enumerate(guests):
+            solver.add_edge(source, 2 + index, 1, 0)
+            for rank, request in enumerate(group):
+                hosting = hostings[position[request.hosting_id]]
+                if not capacity[hosting.pk]:
+                    continue
+                cost = self.hosting_cost(hosting, rank, event_location)
+                edge = solver.add_edge(
+                    2 + index, hosting_offset + position[hosting.pk], 1, cost
+                )
+                edges.append((request, edge))
+
+        for hosting in hostings:
+            solver.add_edge(
+                hosting_offset + position[hosting.pk], sink, capacity[hosting.pk], 0
+            )
+
+        solver.solve(source, sink)
+
+        accepted = [request for request, edge in edges if solver.flow_on(edge)]
+        placed = {request.requester_id for request in accepted}
+        accepted_ids = {request.pk for request in accepted}
+
+        rejected = []
+        unassigned = []
+        for group in guests:
+            if group[0].requester_id in placed:
+                rejected.extend(r for r in group if r.pk not in accepted_ids)
+            else:
+                unassigned.extend(group)
+
+        return accepted, rejected, unassigned
+
+    def apply(self, hostings, accepted, rejected):
+        """
+        Enregistre l'attribution avec une mise à jour groupée par statut et
+        une mise à jour groupée des lits occupés, et met dans l'outbox la
+        notification de chaque demande acceptée ou refusée.
+        """
+        now = timezone.now()
+        guests = Counter(request.hosting_id for request in accepted)
+        updated_hostings = []
+        for hosting in hostings:
+            if guests[hosting.pk]:
+                hosting.beds_taken += guests[hosting.pk]
+                hosting.version += 1
+                updated_hostings.append(hosting)
+        EventHosting.objects.bulk_update(updated_hostings, ["beds_taken", "version"])
+
+        EventHostingRequest.objects.filter(
+            pk__in=[request.pk for request in accepted]
+        ).update(status=EventHostingRequest.Status.ACCEPTED, updated_at=now)
+        EventHostingRequest.objects.filter(
+            pk__in=[request.pk for request in rejected]
+        ).update(status=EventHostingRequest.Status.REJECTED, updated_at=now)
+        OutboxMessage.bulk_enqueue(
+            "hosting_request_status",
+            [
+                {"id": request.pk, "status": status}
+                for requests, status in (
+                    (accepted, EventHostingRequest.Status.ACCEPTED),
+                    (rejected, EventHostingRequest.Status.REJECTED),
+                )
+                for request in requests
+            ],
+        )
@@ -0,0 +1,142 @@
+import heapq
+
+INFINITY = float("inf")
+
+
+class MinCostFlow:
+    """
+    Min-cost max-flow solver (primal-dual).
+
+    Each phase computes shortest distances with Dijkstra on reduced costs,
+    then pushes a blocking flow along every zero reduced-cost arc at once.
+    The number of phases is bounded by the number of distinct path costs,
+    which stays tiny for the integer cost scales used by the allocation
+    engines. Costs must be non-negative integers.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        # Edge layout: [target, residual_capacity, cost, reverse_index]
+        self.graph = [[] for _ in range(size)]
+
+    def add_edge(self, source, target, capacity, cost):
+        """
+        Ajoute un arc et retourne son descripteur, qui permet de lire le flux
+        qui le traverse après résolution via `flow_on`.
+        """
+        forward = [target, capacity, cost, len(self.graph[target])]
+        backward = [source, 0, -cost, len(self.graph[source])]
+        self.graph[source].append(forward)
+        self.graph[target].append(backward)
+        return (source, len(self.graph[source]) - 1, capacity)
+
+    def flow_on(self, edge):
+        """Renvoie le flux qui traverse un arc retourné par `add_edge`."""
+        source, index, capacity = edge
+        return capacity - self.graph[source][index][1]
+
+    def solve(self, source, sink):
+        """
+        Pousse le flux maximal de `source` vers `sink` au coût minimal.
+        Renvoie le couple (flux, coût).
+        """
+        potential = [0] * self.size
+        total_flow = 0
+        total_cost = 0
+
+        while True:
+            distance = self._shortest_distances(source, potential)
+            if distance[sink] == INFINITY:
+                break
+
+            for node in range(self.size):
+                if distance[node] != INFINITY:
+                    potential[node] += distance[node]
+
+            pushed = self._blocking_flow(source, sink, potential)
+            if not pushed:
+                break
+
+            total_flow += pushed
+            total_cost += pushed * (potential[sink] - potential[source])
+
+        return total_flow, total_cost
+
+    def _shortest_distances(self, source, potential):
+        distance = [INFINITY] * self.size
+        distance[source] = 0
+        heap = [(0, source)]
+
+        while heap:
+            current, node = heapq.heappop(heap)
+            if current > distance[node]:
+                continue
+            for target, capacity, cost, _ in self.graph[node]:
+                if capacity <= 0:
+                    continue
+                candidate = current + cost + potential[node] - potential[target]
+                if candidate < distance[target]:
+                    distance[target] = candidate
+                    heapq.heappush(heap, (candidate, target))
+
+        return distance
+
+    def _is_admissible(self, node, edge, potential):
+        return edge[1] > 0 and edge[2] + potential[node] - potential[edge[0]] == 0
+
+    def _blocking_flow(self, source, sink, potential):
+        level = [-1] * self.size
+        level[source] = 0
+        queue = [source]
+        for node in queue:
+            for edge in self.graph[node]:
+                if level[edge[0]] < 0 and self._is_admissible(node, edge, potential):
+                    level[edge[0]] = level[node] + 1
+                    queue.append(edge[0])
+
+        if level[sink] < 0:
+            return 0
+
+        cursor = [0] * self.size
+        total = 0
+        while True:
+            pushed = self._augment(source, sink, level, cursor, potential)
+            if not pushed:
+                return total
+            total += pushed
+
+    def _augment(self, source, sink, level, cursor, potential):
+        """Trouve un chemin augmentant dans le graphe de niveaux (DFS itératif)."""
+        stack = [source]
+        path = []
+
+        while stack:
+            node = stack[-1]
+            if node == sink:
+                pushed = min(edge[1] for edge in path)
+                for edge in path:
+                    edge[1] -= pushed
+                    self.graph[edge[0]][edge[3]][1] += pushed
+                return pushed
+
+            edges = self.graph[node]
+            while cursor[node] < len(edges):
+                edge = edges[cursor[node]]
+                if level[edge[0]] == level[node] + 1 and self._is_admissible(
+                    node, edge, potential
+                ):
+                    break
+                cursor[node] += 1
+
+            if cursor[node] < len(edges):
+                edge = edges[cursor[node]]
+                stack.append(edge[0])
+                path.append(edge)
+            else:
+                level[node] = -1
+                stack.pop()
+                if path:
+                    path.pop()
+                    cursor[stack[-1]] += 1
+
+        return 0
@@ -0,0 +1,119 @@
+import datetime
+import logging
+import random
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ft.event.models import OutboxMessage
+from .RequestNotification import RequestNotification
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    Traite les messages de l'outbox par lots.
+
+    Chaque lot est réservé par `SELECT ... FOR UPDATE SKIP LOCKED` : plusieurs
+    workers se partagent la table sans traiter deux fois le même message ni
+    s'attendre. Un message en échec est reprogrammé avec un délai
+    exponentiel (`OUTBOX_RETRY_BASE` × 2^(tentatives - 1), plafonné à
+    `OUTBOX_RETRY_MAX`, plus 10 % d'aléa), puis abandonné (FAILED) après
+    `OUTBOX_MAX_ATTEMPTS` tentatives ou si son type est inconnu.
+
+    Les statuts d'un lot sont écrits à la fin de sa transaction : si le
+    worker s'arrête en cours de lot, ses messages seront traités à nouveau.
+    La livraison est donc « au moins une fois ».
+    """
+
+    handlers = {
+        "hosting_request_status": RequestNotification.hosting_request,
+        "carpool_request_status": RequestNotification.carpool_request,
+    }
+
+    def __init__(self, batch_size=None):
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+
+    def run_batch(self):
+        """
+        Traite un lot de messages disponibles et renvoie le nombre de
+        messages envoyés (`sent`), reprogrammés (`retried`) et abandonnés
+        (`failed`).
+        """
+        stats = Counter()
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.filter(
+                    status=OutboxMessage.Status.PENDING,
+                    available_at__lte=timezone.now(),
+                )
+                .order_by("available_at")
+                .select_for_update(skip_locked=True)[: self.batch_size]
+            )
+            for message in messages:
+                stats[self.process(message)] += 1
+            OutboxMessage.objects.bulk_update(
+                messages,
+                ["status", "attempts", "available_at", "last_error", "processed_at"],
+            )
+        return stats
+
+    def process(self, message):
+        message.attempts += 1
+        handler = self.handlers.get(message.kind)
+        try:
+            if handler is None:
+                raise LookupError(f"Type de message inconnu : {message.kind}")
+            with transaction.atomic():
+                handler(message.payload)
+        except Exception as exc:
+            message.last_error = f"{type(exc).__name__}: {exc}"
+            if handler is None or message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                logger.error("Message %s abandonné : %s", message.pk, exc)
+                message.status = OutboxMessage.Status.FAILED
+                message.processed_at = timezone.now()
+                return "failed"
+            logger.warning("Message %s reprogrammé : %s", message.pk, exc)
+            message.available_at = timezone.now() + self.backoff(message.attempts)
+            return "retried"
+
+        message.status = OutboxMessage.Status.SENT
+        message.processed_at = timezone.now()
+        message.last_error = ""
+        return "sent"
+
+    @staticmethod
+    def backoff(attempts):
+        delay = min(
+            settings.OUTBOX_RETRY_BASE * 2 ** (attempts - 1), settings.OUTBOX_RETRY_MAX
+        )
+        return datetime.timedelta(seconds=delay * random.uniform(1, 1.1))
+
+    @staticmethod
+    def purge():
+        """Supprime les messages envoyés depuis plus de `OUTBOX_RETENTION`."""
+        deleted, _ = OutboxMessage.objects.filter(
+            status=OutboxMessage.Status.SENT,
+            processed_at__lt=timezone.now()
+            - datetime.timedelta(seconds=settings.OUTBOX_RETENTION),
+        ).delete()
+        return deleted
+
+    @staticmethod
+    def metrics():
+        """État de la file : messages en attente, en retard et abandonnés."""
+        now = timezone.now()
+        pending = OutboxMessage.objects.filter(status=OutboxMessage.Status.PENDING)
+        oldest = pending.filter(available_at__lte=now).order_by("available_at").first()
+        return {
+            "pending": pending.count(),
+            "failed": OutboxMessage.objects.filter(
+                status=OutboxMessage.Status.FAILED
+            ).count(),
+            "lag_seconds": (
+                round((now - oldest.available_at).total_seconds(), 3) if oldest else 0
+            ),
+        }
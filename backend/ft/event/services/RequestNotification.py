@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+
+from ft.event.models import CarpoolRequest, EventHostingRequest
+
+
+class RequestNotification:
+    """
+    E-mails de changement de statut des demandes, envoyés par le worker de
+    l'outbox. Une acceptation ou un refus est adressé au demandeur, une
+    annulation à l'hôte ou au conducteur. Les données sont relues au moment
+    de l'envoi ; une demande supprimée entretemps n'envoie rien.
+    """
+
+    @classmethod
+    def hosting_request(cls, payload):
+        request = (
+            EventHostingRequest.objects.select_related(
+                "requester", "hosting__host", "hosting__event"
+            )
+            .filter(pk=payload["id"])
+            .first()
+        )
+        if request is None:
+            return
+        recipient = (
+            request.hosting.host
+            if payload["status"] == EventHostingRequest.Status.CANCELLED
+            else request.requester
+        )
+        cls.send(
+            "hosting_request_status",
+            recipient,
+            {
+                "request": request,
+                "hosting": request.hosting,
+                "event": request.hosting.event,
+                "status": payload["status"],
+            },
+        )
+
+    @classmethod
+    def carpool_request(cls, payload):
+        request = (
+            CarpoolRequest.objects.select_related(
+                "passenger", "trip__driver", "trip__event"
+            )
+            .filter(pk=payload["id"])
+            .first()
+        )
+        if request is None:
+            return
+        recipient = (
+            request.trip.driver
+            if payload["status"] == "CANCELLED"
+            else request.passenger
+        )
+        cls.send(
+            "carpool_request_status",
+            recipient,
+            {"request": request, "trip": request.trip, "status": payload["status"]},
+        )
+
+    @staticmethod
+    def send(template, recipient, context):
+        if not recipient.email:
+            return
+        context = {**context, "recipient": recipient, "base_url": settings.BASE_URL}
+        subject = render_to_string(f"event/email/{template}_subject.txt", context)
+        message = render_to_string(f"event/email/{template}_message.txt", context)
+        send_mail(
+            " ".join(subject.split()),
+            message.strip() + "\n",
+            None,
+            [recipient.email],
+        )
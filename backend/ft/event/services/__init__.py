@@ -0,0 +1,23 @@
+# Services
+from .MinCostFlow import MinCostFlow
+from .CarpoolAssignment import CarpoolAssignment
+from .HostingAllocation import HostingAllocation
+from .BulkRequestAction import CarpoolRequestBulkAction, HostingRequestBulkAction
+from .EventExport import EventExport
+from .EventCalendar import EventCalendar
+from .ChangeFeed import ChangeFeed
+from .RequestNotification import RequestNotification
+from .OutboxWorker import OutboxWorker
+
+__all__ = [
+    "MinCostFlow",
+    "CarpoolAssignment",
+    "HostingAllocation",
+    "CarpoolRequestBulkAction",
+    "HostingRequestBulkAction",
+    "EventExport",
+    "EventCalendar",
+    "ChangeFeed",
+    "RequestNotification",
+    "OutboxWorker",
+]
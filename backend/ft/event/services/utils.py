@@ -0,0 +1,25 @@
+import re
+
+
+def normalize_city(city):
+    """Normalise un nom de ville pour les comparaisons."""
+    return " ".join((city or "").split()).casefold()
+
+
+def city_words(text):
+    """Mots d'un nom de ville ou d'une adresse, sans casse ni ponctuation."""
+    return tuple(re.findall(r"\w+", (text or "").casefold()))
+
+
+def is_in_location(city, location):
+    """
+    Indique si la ville figure dans le lieu, mot pour mot : « Pau » n'est pas
+    dans « Salle Paul Bert, Lyon », « Saint-Étienne » est dans « Stade
+    Geoffroy-Guichard, Saint-Étienne ».
+    """
+    words = city_words(city)
+    location_words = city_words(location)
+    return bool(words) and any(
+        location_words[start : start + len(words)] == words
+        for start in range(len(location_words) - len(words) + 1)
+    )
@@ -0,0 +1,54 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, EventHosting, EventHostingRequest
+
+
+@pytest.mark.django_db
+class TestAllocateHostingsCommand:
+    """Tests pour la commande allocate_hostings."""
+
+    @pytest.fixture
+    def pending_request(self):
+        """Fixture pour créer une demande d'hébergement en attente."""
+        event = Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+        host = User.objects.create_user(
+            username="host", email="host@example.com", password="password123"
+        )
+        requester = User.objects.create_user(
+            username="requester", email="requester@example.com", password="password123"
+        )
+        hosting = EventHosting.objects.create(event=event, host=host, available_beds=1)
+        return EventHostingRequest.objects.create(hosting=hosting, requester=requester)
+
+    def test_command_accepts_requests(self, pending_request):
+        """Test que la commande accepte les demandes attribuées."""
+        out = StringIO()
+        call_command("allocate_hostings", pending_request.hosting.event_id, stdout=out)
+
+        pending_request.refresh_from_db()
+        assert pending_request.status == EventHostingRequest.Status.ACCEPTED
+        assert "1 demande(s) acceptée(s)" in out.getvalue()
+
+    def test_command_dry_run(self, pending_request):
+        """Test que l'option --dry-run n'enregistre rien."""
+        out = StringIO()
+        call_command(
+            "allocate_hostings",
+            pending_request.hosting.event_id,
+            "--dry-run",
+            stdout=out,
+        )
+
+        pending_request.refresh_from_db()
+        assert pending_request.status == EventHostingRequest.Status.PENDING
+        assert "(simulation)" in out.getvalue()
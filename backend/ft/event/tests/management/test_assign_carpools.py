@@ -0,0 +1,64 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, CarpoolTrip, CarpoolRequest
+
+
+@pytest.mark.django_db
+class TestAssignCarpoolsCommand:
+    """Tests pour la commande assign_carpools."""
+
+    @pytest.fixture
+    def pending_request(self):
+        """Fixture pour créer une demande en attente sur un trajet."""
+        event = Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+        driver = User.objects.create_user(
+            username="driver", email="driver@example.com", password="password123"
+        )
+        passenger = User.objects.create_user(
+            username="passenger", email="passenger@example.com", password="password123"
+        )
+        trip = CarpoolTrip.objects.create(
+            event=event,
+            driver=driver,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=3,
+        )
+        return CarpoolRequest.objects.create(passenger=passenger, trip=trip)
+
+    def test_command_assigns_requests(self, pending_request):
+        """Test que la commande accepte les demandes affectées."""
+        out = StringIO()
+        call_command("assign_carpools", pending_request.trip.event_id, stdout=out)
+
+        pending_request.refresh_from_db()
+        assert pending_request.status == "ACCEPTED"
+        assert "1 demande(s) affectée(s)" in out.getvalue()
+
+    def test_command_dry_run(self, pending_request):
+        """Test que l'option --dry-run n'enregistre rien."""
+        out = StringIO()
+        call_command(
+            "assign_carpools", pending_request.trip.event_id, "--dry-run", stdout=out
+        )
+
+        pending_request.refresh_from_db()
+        assert pending_request.status == "PENDING"
+        assert "(simulation)" in out.getvalue()
+
+    def test_command_unknown_event(self, db):
+        """Test qu'un événement inconnu lève une erreur."""
+        with pytest.raises(CommandError):
+            call_command("assign_carpools", 999999)
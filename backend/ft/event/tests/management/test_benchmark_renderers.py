@@ -0,0 +1,24 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from ft.event.models import CarpoolRequest
+
+
+@pytest.mark.django_db
+class TestBenchmarkRenderersCommand:
+    """Tests pour la commande benchmark_renderers."""
+
+    def test_benchmark_reports_each_renderer(self):
+        """Test que chaque renderer est mesuré sans laisser de données."""
+        out = StringIO()
+
+        call_command(
+            "benchmark_renderers", "--rows", "5", "--iterations", "2", stdout=out
+        )
+
+        output = out.getvalue()
+        assert "Page de 5 demande(s)" in output
+        assert "json" in output
+        assert "orjson" in output
+        assert "msgpack" in output
+        assert not CarpoolRequest.objects.exists()
@@ -0,0 +1,33 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from ft.event.models import CarpoolRequest, EventHostingRequest
+
+
+@pytest.mark.django_db
+class TestBenchmarkVisibilityCommand:
+    """Tests pour la commande benchmark_visibility."""
+
+    def test_benchmark_reports_each_strategy(self):
+        """Test que chaque stratégie est mesurée sans laisser de données."""
+        out = StringIO()
+
+        call_command(
+            "benchmark_visibility",
+            "--users",
+            "10",
+            "--per-offer",
+            "2",
+            "--iterations",
+            "1",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        for name in ("CarpoolRequest", "CarpoolPayment", "EventHostingRequest"):
+            assert name in output
+        for strategy in ("or", "union", "exists"):
+            assert output.count(f"  {strategy} ") == 3
+        assert output.count("4 ligne(s)") == 9
+        assert not CarpoolRequest.objects.exists()
+        assert not EventHostingRequest.objects.exists()
@@ -0,0 +1,45 @@
+import datetime
+
+import pytest
+from io import StringIO
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+from ft.event.models import Event, EventHosting, EventHostingRequest, OutboxMessage
+from ft.user.models import User
+
+
+@pytest.mark.django_db
+class TestProcessOutboxCommand:
+    """Tests pour la commande process_outbox."""
+
+    def test_once_drains_available_messages(self):
+        """Test que --once traite tous les messages disponibles puis s'arrête."""
+        event = Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+        host = User.objects.create_user(
+            username="host", email="host@example.com", password="password123"
+        )
+        hosting = EventHosting.objects.create(event=event, host=host, available_beds=3)
+        for index in range(3):
+            requester = User.objects.create_user(
+                username=f"requester{index}",
+                email=f"requester{index}@example.com",
+                password="password123",
+            )
+            EventHostingRequest.objects.create(
+                hosting=hosting, requester=requester
+            ).accept()
+        out = StringIO()
+
+        call_command("process_outbox", "--once", "--batch-size", "2", stdout=out)
+
+        assert len(mail.outbox) == 3
+        assert "2 envoyé(s)" in out.getvalue()
+        assert "1 envoyé(s)" in out.getvalue()
+        assert not OutboxMessage.objects.filter(status="PENDING").exists()
@@ -0,0 +1,33 @@
+import datetime
+
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from ft.event.models import IdempotencyKey
+from ft.user.models import User
+
+
+@pytest.mark.django_db
+class TestPurgeIdempotencyKeysCommand:
+    """Tests pour la commande purge_idempotency_keys."""
+
+    def test_purge_removes_only_expired_keys(self):
+        """Test que seules les clés expirées sont supprimées."""
+        user = User.objects.create_user(
+            username="user", email="user@example.com", password="password123"
+        )
+        now = timezone.now()
+        for key, delta in (("old", -1), ("fresh", 1)):
+            IdempotencyKey.objects.create(
+                user=user,
+                key=key,
+                fingerprint="0" * 64,
+                expires_at=now + datetime.timedelta(hours=delta),
+            )
+        out = StringIO()
+
+        call_command("purge_idempotency_keys", stdout=out)
+
+        assert "1 clé(s) d'idempotence supprimée(s)" in out.getvalue()
+        assert list(IdempotencyKey.objects.values_list("key", flat=True)) == ["fresh"]
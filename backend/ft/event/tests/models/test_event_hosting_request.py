@@ -1,4 +1,5 @@
 import pytest
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from ft.user.models import User
 from ft.event.models import Event, EventHosting, EventHostingRequest
@@ -114,3 +115,141 @@ class TestEventHostingRequestModel:
         hosting_request.cancel()
         # Le statut ne devrait pas changer
         assert hosting_request.status == EventHostingRequest.Status.REJECTED
+
+    def test_accept_reserves_a_bed(self, hosting, hosting_request):
+        """Test que l'acceptation incrémente le compteur de lits occupés."""
+        assert hosting_request.accept() is True
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+        assert hosting.places_available == 1
+
+    def test_accept_fails_when_hosting_is_full(self, hosting, hosting_request):
+        """Test qu'une demande ne peut pas être acceptée sans lit libre."""
+        EventHosting.objects.filter(pk=hosting.pk).update(beds_taken=2)
+
+        assert hosting_request.accept() is False
+
+        hosting_request.refresh_from_db()
+        hosting.refresh_from_db()
+        assert hosting_request.status == EventHostingRequest.Status.PENDING
+        assert hosting.beds_taken == 2
+
+    def test_stale_accept_does_not_count_twice(self, hosting, hosting_request):
+        """Test qu'une acceptation sur une copie périmée ne réserve pas de lit."""
+        stale_copy = EventHostingRequest.objects.get(pk=hosting_request.pk)
+        assert hosting_request.accept() is True
+
+        assert stale_copy.accept() is False
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+
+    def test_cancel_accepted_request_frees_the_bed(self, hosting, hosting_request):
+        """Test que l'annulation d'une demande acceptée libère le lit."""
+        hosting_request.accept()
+        hosting_request.cancel()
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 0
+
+    def test_counter_follows_saves_and_deletes(self, hosting, requester):
+        """Test que le compteur suit les créations et suppressions."""
+        accepted = EventHostingRequest.objects.create(
+            hosting=hosting,
+            requester=requester,
+            status=EventHostingRequest.Status.ACCEPTED,
+        )
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+
+        EventHostingRequest.objects.get(pk=accepted.pk).delete()
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 0
+
+    def test_stale_reject_does_not_overwrite_accept(self, hosting, hosting_request):
+        """Test qu'un refus concurrent d'une acceptation n'écrase pas le statut."""
+        stale_copy = EventHostingRequest.objects.get(pk=hosting_request.pk)
+        assert hosting_request.accept() is True
+
+        assert stale_copy.reject() is False
+
+        hosting_request.refresh_from_db()
+        hosting.refresh_from_db()
+        assert hosting_request.status == EventHostingRequest.Status.ACCEPTED
+        assert hosting.beds_taken == 1
+
+    def test_concurrent_cancels_free_one_bed(self, hosting, hosting_request):
+        """Test que deux annulations concurrentes ne libèrent qu'un lit."""
+        hosting_request.accept()
+        first = EventHostingRequest.objects.get(pk=hosting_request.pk)
+        second = EventHostingRequest.objects.get(pk=hosting_request.pk)
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password123"
+        )
+        EventHostingRequest.objects.create(
+            hosting=hosting, requester=other, status=EventHostingRequest.Status.ACCEPTED
+        )
+
+        assert first.cancel() is True
+        assert second.cancel() is False
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+
+    def test_cascade_delete_frees_the_bed(self, hosting, hosting_request, requester):
+        """Test que la suppression en cascade d'une demande acceptée libère le lit."""
+        hosting_request.accept()
+
+        requester.delete()
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 0
+
+    def test_queryset_delete_frees_the_beds(self, hosting, hosting_request):
+        """Test que la suppression par queryset décompte les demandes acceptées."""
+        hosting_request.accept()
+
+        EventHostingRequest.objects.filter(hosting=hosting).delete()
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 0
+
+    def test_save_as_accepted_does_not_overbook(self, hosting, requester):
+        """Test qu'une demande enregistrée acceptée ne dépasse pas les lits."""
+        EventHosting.objects.filter(pk=hosting.pk).update(beds_taken=2)
+
+        with pytest.raises(ValidationError):
+            EventHostingRequest.objects.create(
+                hosting=hosting,
+                requester=requester,
+                status=EventHostingRequest.Status.ACCEPTED,
+            )
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 2
+        assert not EventHostingRequest.objects.exists()
+
+    def test_clean_rejects_accepting_into_full_hosting(self, hosting, hosting_request):
+        """Test que la validation (formulaire d'admin) refuse un hébergement complet."""
+        EventHosting.objects.filter(pk=hosting.pk).update(beds_taken=2)
+        instance = EventHostingRequest.objects.get(pk=hosting_request.pk)
+        instance.status = EventHostingRequest.Status.ACCEPTED
+
+        with pytest.raises(ValidationError) as error:
+            instance.full_clean()
+
+        assert "status" in error.value.message_dict
+
+    def test_deferred_status_is_not_counted_twice(self, hosting, hosting_request):
+        """Test qu'un statut différé est relu au lieu d'être supposé non accepté."""
+        hosting_request.accept()
+        deferred = EventHostingRequest.objects.defer("status").get(
+            pk=hosting_request.pk
+        )
+
+        deferred.message = "Arrivée vers 20 h"
+        deferred.save()
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
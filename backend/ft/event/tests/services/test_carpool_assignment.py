@@ -0,0 +1,186 @@
+import pytest
+from django.utils import timezone
+from decimal import Decimal
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, CarpoolTrip, CarpoolRequest
+from ft.event.services import CarpoolAssignment
+
+
+@pytest.mark.django_db
+class TestCarpoolAssignment:
+    """Tests pour le moteur d'affectation des covoiturages."""
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement."""
+        return Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    def make_user(self, name, city=None):
+        return User.objects.create_user(
+            username=name,
+            email=f"{name}@example.com",
+            password="password123",
+            city=city,
+        )
+
+    def make_trip(self, event, driver, city, seats):
+        return CarpoolTrip.objects.create(
+            event=event,
+            driver=driver,
+            departure_city=city,
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=seats,
+            price_per_seat=Decimal("10.00"),
+        )
+
+    @pytest.fixture
+    def paris_trip(self, event):
+        """Fixture pour créer un trajet au départ de Paris (3 places)."""
+        return self.make_trip(event, self.make_user("driver_paris"), "Paris", 3)
+
+    @pytest.fixture
+    def lyon_trip(self, event):
+        """Fixture pour créer un trajet au départ de Lyon (1 place)."""
+        return self.make_trip(event, self.make_user("driver_lyon"), "Lyon", 1)
+
+    def test_respects_capacity_and_city(self, event, paris_trip, lyon_trip):
+        """Test que la capacité est respectée et que la ville de départ compte."""
+        first = CarpoolRequest.objects.create(
+            passenger=self.make_user("p1", "Paris"), trip=paris_trip
+        )
+        group = CarpoolRequest.objects.create(
+            passenger=self.make_user("p2", "Paris"), trip=paris_trip, seats_requested=2
+        )
+        lyonnais = CarpoolRequest.objects.create(
+            passenger=self.make_user("p3", " lyon "), trip=paris_trip
+        )
+
+        result = CarpoolAssignment(event).run()
+
+        assert len(result["assigned"]) == 3
+        assert result["unassigned"] == []
+        for request in (first, group, lyonnais):
+            request.refresh_from_db()
+            assert request.status == "ACCEPTED"
+        assert first.trip == paris_trip
+        assert group.trip == paris_trip
+        assert lyonnais.trip == lyon_trip
+
+    def test_never_splits_a_request(self, event, paris_trip, lyon_trip):
+        """Test qu'une demande n'est jamais répartie sur deux trajets."""
+        CarpoolRequest.objects.create(
+            passenger=self.make_user("p1"), trip=paris_trip, seats_requested=2
+        )
+        too_big = CarpoolRequest.objects.create(
+            passenger=self.make_user("p2"), trip=paris_trip, seats_requested=2
+        )
+
+        result = CarpoolAssignment(event).run()
+
+        assert len(result["assigned"]) == 1
+        assert result["unassigned"] == [too_big.id]
+        too_big.refresh_from_db()
+        assert too_big.status == "PENDING"
+
+    def test_accepted_seats_are_taken_into_account(self, event, lyon_trip):
+        """Test que les places déjà acceptées sont déduites."""
+        CarpoolRequest.objects.create(
+            passenger=self.make_user("p1"), trip=lyon_trip, status="ACCEPTED"
+        )
+        pending = CarpoolRequest.objects.create(
+            passenger=self.make_user("p2"), trip=lyon_trip
+        )
+
+        result = CarpoolAssignment(event).run()
+
+        assert result["assigned"] == []
+        assert result["unassigned"] == [pending.id]
+
+    def test_capacity_follows_seats_available(self, event, paris_trip):
+        """Test que la capacité suit `seats_available`, comme l'API."""
+        CarpoolRequest.objects.create(
+            passenger=self.make_user("p1"),
+            trip=paris_trip,
+            status="ACCEPTED",
+            seats_requested=2,
+        )
+        pending = CarpoolRequest.objects.create(
+            passenger=self.make_user("p2"), trip=paris_trip, seats_requested=2
+        )
+        assert paris_trip.seats_available == 2
+
+        result = CarpoolAssignment(event).run()
+
+        assert result["assigned"] == [
+            {"request": pending.id, "trip": paris_trip.id, "seats": 2}
+        ]
+
+    def test_supersedes_other_requests_of_passenger(self, event, paris_trip, lyon_trip):
+        """Test que les autres demandes d'un passager placé sont annulées."""
+        passenger = self.make_user("p1")
+        first = CarpoolRequest.objects.create(passenger=passenger, trip=paris_trip)
+        second = CarpoolRequest.objects.create(passenger=passenger, trip=lyon_trip)
+
+        result = CarpoolAssignment(event).run()
+
+        assert result["assigned"] == [
+            {"request": first.id, "trip": paris_trip.id, "seats": 1}
+        ]
+        assert result["superseded"] == [second.id]
+        second.refresh_from_db()
+        assert second.status == "CANCELLED"
+
+    def test_accepts_existing_request_on_chosen_trip(
+        self, event, paris_trip, lyon_trip
+    ):
+        """Test que la demande déjà faite pour le trajet choisi est acceptée."""
+        CarpoolRequest.objects.create(
+            passenger=self.make_user("p0"), trip=lyon_trip, status="ACCEPTED"
+        )
+        passenger = self.make_user("p1")
+        first = CarpoolRequest.objects.create(passenger=passenger, trip=lyon_trip)
+        second = CarpoolRequest.objects.create(passenger=passenger, trip=paris_trip)
+
+        result = CarpoolAssignment(event).run()
+
+        assert result["assigned"] == [
+            {"request": second.id, "trip": paris_trip.id, "seats": 1}
+        ]
+        assert result["superseded"] == [first.id]
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.trip_id, first.status) == (lyon_trip.id, "CANCELLED")
+        assert (second.trip_id, second.status) == (paris_trip.id, "ACCEPTED")
+
+    def test_driver_is_not_assigned_to_own_trip(self, event, paris_trip, lyon_trip):
+        """Test qu'un conducteur n'est pas placé dans sa propre voiture."""
+        request = CarpoolRequest.objects.create(
+            passenger=paris_trip.driver, trip=lyon_trip
+        )
+
+        result = CarpoolAssignment(event).run()
+
+        assert result["assigned"] == [
+            {"request": request.id, "trip": lyon_trip.id, "seats": 1}
+        ]
+
+    def test_dry_run_does_not_write(self, event, paris_trip):
+        """Test que le mode simulation n'enregistre rien."""
+        request = CarpoolRequest.objects.create(
+            passenger=self.make_user("p1"), trip=paris_trip
+        )
+
+        result = CarpoolAssignment(event).run(dry_run=True)
+
+        assert result["dry_run"] is True
+        assert len(result["assigned"]) == 1
+        request.refresh_from_db()
+        assert request.status == "PENDING"
@@ -0,0 +1,166 @@
+import asyncio
+import datetime
+import json
+from decimal import Decimal
+
+import psycopg
+import pytest
+from django.utils import timezone
+
+from ft.event.models import (
+    CarpoolPayment,
+    CarpoolRequest,
+    CarpoolTrip,
+    Event,
+    EventSubscription,
+)
+from ft.event.services import ChangeFeed
+from ft.user.models import User
+
+
+@pytest.fixture
+def listener(transactional_db):
+    with psycopg.connect(ChangeFeed.conninfo(), autocommit=True) as connection:
+        connection.execute(f"LISTEN {ChangeFeed.CHANNEL}")
+
+        def received():
+            return [
+                json.loads(notify.payload)
+                for notify in connection.notifies(timeout=0.5)
+            ]
+
+        yield received
+
+
+@pytest.fixture
+def trip(transactional_db):
+    driver = User.objects.create_user(
+        username="driver", email="driver@example.com", password="password123"
+    )
+    event = Event.objects.create(
+        name="Congrès",
+        location="Compiègne",
+        start_date=timezone.now() + datetime.timedelta(days=10),
+        end_date=timezone.now() + datetime.timedelta(days=12),
+        type="CONGRESS",
+    )
+    return CarpoolTrip.objects.create(
+        event=event,
+        driver=driver,
+        departure_city="Paris",
+        arrival_city="Compiègne",
+        departure_datetime=timezone.now() + datetime.timedelta(days=9),
+        seats_total=3,
+        price_per_seat=Decimal("10.00"),
+    )
+
+
+@pytest.fixture
+def passenger(transactional_db):
+    return User.objects.create_user(
+        username="passenger", email="passenger@example.com", password="password123"
+    )
+
+
+class TestChangeNotifications:
+    """Tests pour les triggers qui publient les changements."""
+
+    def test_carpool_request_notifies_passenger_and_driver(
+        self, listener, trip, passenger
+    ):
+        """Test qu'une demande de covoiturage notifie passager et conducteur."""
+        request = CarpoolRequest.objects.create(trip=trip, passenger=passenger)
+
+        assert listener() == [
+            {
+                "u": [passenger.pk, trip.driver_id],
+                "t": "carpool_request",
+                "id": request.pk,
+                "op": "insert",
+                "s": "PENDING",
+                "trip": trip.pk,
+            }
+        ]
+
+    def test_unchanged_update_is_silent(self, listener, trip, passenger):
+        """Test qu'une mise à jour sans changement ne publie rien."""
+        request = CarpoolRequest.objects.create(trip=trip, passenger=passenger)
+        listener()
+
+        CarpoolRequest.objects.filter(pk=request.pk).update(status="PENDING")
+
+        assert listener() == []
+
+    def test_payment_notifies_request_parties(self, listener, trip, passenger):
+        """Test qu'un paiement notifie le passager et le conducteur."""
+        request = CarpoolRequest.objects.create(trip=trip, passenger=passenger)
+        listener()
+
+        payment = CarpoolPayment.objects.create(
+            request=request, amount=Decimal("10.00")
+        )
+
+        assert listener() == [
+            {
+                "u": [passenger.pk, trip.driver_id],
+                "t": "carpool_payment",
+                "id": payment.pk,
+                "op": "insert",
+                "request": request.pk,
+            }
+        ]
+
+    def test_subscription_notifies_everyone(self, listener, trip, passenger):
+        """Test qu'une inscription publie les compteurs de l'événement."""
+        EventSubscription.objects.create(event=trip.event, user=passenger, answer="YES")
+
+        assert listener() == [{"t": "event", "id": trip.event_id}]
+
+
+class TestChangeFeed:
+    """Tests pour la répartition des messages entre abonnés."""
+
+    def test_dispatch_routes_messages(self, settings):
+        """Test que chaque message n'atteint que ses destinataires."""
+        settings.CHANGE_FEED_QUEUE_SIZE = 2
+
+        async def scenario():
+            alice, bob = asyncio.Queue(maxsize=2), asyncio.Queue(maxsize=2)
+            ChangeFeed._queues = {1: {alice}, 2: {bob}}
+            try:
+                ChangeFeed.dispatch('{"u": [1, 3], "t": "carpool_request", "id": 7}')
+                ChangeFeed.dispatch('{"t": "event", "id": 4}')
+                return alice.get_nowait(), alice.get_nowait(), bob.get_nowait()
+            finally:
+                ChangeFeed._queues = {}
+
+        first, second, other = asyncio.run(scenario())
+
+        assert first == {"t": "carpool_request", "id": 7}
+        assert second == other == {"t": "event", "id": 4}
+
+    def test_full_queue_asks_for_resync(self):
+        """Test qu'une file pleine est remplacée par un message resync."""
+
+        async def scenario():
+            queue = asyncio.Queue(maxsize=1)
+            ChangeFeed._queues = {1: {queue}}
+            try:
+                ChangeFeed.dispatch('{"u": [1], "t": "hosting_request", "id": 1}')
+                ChangeFeed.dispatch('{"u": [1], "t": "hosting_request", "id": 2}')
+                return [queue.get_nowait() for _ in range(queue.qsize())]
+            finally:
+                ChangeFeed._queues = {}
+
+        assert asyncio.run(scenario()) == [ChangeFeed.RESYNC]
+
+    def test_decode_filters_other_users(self):
+        """Test que le flux WSGI ignore les messages des autres utilisateurs."""
+        payload = '{"u": [1], "t": "carpool_request", "id": 7}'
+
+        assert ChangeFeed.decode(payload, 1) == {"t": "carpool_request", "id": 7}
+        assert ChangeFeed.decode(payload, 2) is None
+        assert ChangeFeed.decode('{"t": "event", "id": 4}', 2) == {
+            "t": "event",
+            "id": 4,
+        }
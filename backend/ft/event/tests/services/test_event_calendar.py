@@ -0,0 +1,130 @@
+import pytest
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, EventSubscription
+from ft.event.services import EventCalendar
+
+
+@pytest.mark.django_db
+class TestEventCalendar:
+    """Tests pour la génération des flux iCalendar."""
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement public."""
+        return Event.objects.create(
+            name="Congrès, édition 2025",
+            description="Week-end; soirées\nnavettes",
+            location="Compiègne",
+            start_date=datetime.datetime(
+                2025, 7, 14, 8, 0, tzinfo=datetime.timezone.utc
+            ),
+            end_date=datetime.datetime(
+                2025, 7, 16, 18, 0, tzinfo=datetime.timezone.utc
+            ),
+            url_website="https://example.com/congres",
+            type="CONGRESS",
+        )
+
+    def test_public_feed(self, event):
+        """Test du contenu du flux public."""
+        Event.objects.create(
+            name="Privé",
+            location="Paris",
+            start_date=timezone.now(),
+            end_date=timezone.now(),
+            is_public=False,
+            type="OTHER",
+        )
+
+        content = "".join(EventCalendar.public().stream())
+
+        assert content.startswith("BEGIN:VCALENDAR\r\n")
+        assert content.endswith("END:VCALENDAR\r\n")
+        assert content.count("BEGIN:VEVENT") == 1
+        assert f"UID:event-{event.pk}@france-tocarde\r\n" in content
+        assert "DTSTART:20250714T080000Z\r\n" in content
+        assert "SUMMARY:Congrès\\, édition 2025\r\n" in content
+        assert "DESCRIPTION:Week-end\\; soirées\\nnavettes\r\n" in content
+
+    def test_user_feed_only_yes(self, event):
+        """Test que le flux personnel ne contient que les réponses oui."""
+        user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        other = Event.objects.create(
+            name="Apéral",
+            location="Compiègne",
+            start_date=timezone.now(),
+            end_date=timezone.now(),
+            type="DRINK",
+        )
+        EventSubscription.objects.create(event=event, user=user, answer="YES")
+        EventSubscription.objects.create(event=other, user=user, answer="NO")
+
+        content = "".join(EventCalendar.for_user(user).stream())
+
+        assert content.count("BEGIN:VEVENT") == 1
+        assert f"event-{event.pk}@" in content
+
+    def test_etag_follows_changes(self, event):
+        """Test que l'ETag change avec les événements et les réponses."""
+        user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        calendar = EventCalendar.for_user(user)
+        empty = calendar.etag()
+
+        subscription = EventSubscription.objects.create(
+            event=event, user=user, answer="YES"
+        )
+        subscribed = calendar.etag()
+        assert subscribed != empty
+        assert calendar.etag() == subscribed
+
+        event.name = "Congrès renommé"
+        event.save()
+        renamed = calendar.etag()
+        assert renamed != subscribed
+
+        subscription.answer = "NO"
+        subscription.save()
+        assert calendar.etag() == empty
+
+    def test_fold_long_lines(self):
+        """Test que les lignes longues sont coupées à 75 octets."""
+        folded = EventCalendar.fold("DESCRIPTION:" + "é" * 100)
+
+        lines = folded.rstrip("\r\n").split("\r\n")
+        assert len(lines) > 1
+        assert all(len(line.encode()) <= 75 for line in lines)
+        assert all(line.startswith(" ") for line in lines[1:])
+        assert "".join(line[1:] if i else line for i, line in enumerate(lines)) == (
+            "DESCRIPTION:" + "é" * 100
+        )
+
+    def test_user_token(self):
+        """Test de l'aller-retour du jeton signé."""
+        user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        token = EventCalendar.user_token(user)
+
+        assert EventCalendar.user_from_token(token) == user
+        assert EventCalendar.user_from_token(token + "x") is None
+        assert EventCalendar.user_from_token(str(user.pk)) is None
+        assert EventCalendar.user_from_token("abc:def") is None
+
+    def test_rotated_token_is_revoked(self):
+        """Test que la rotation du secret invalide l'ancien jeton."""
+        user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        old_token = EventCalendar.user_token(user)
+
+        new_token = EventCalendar.rotate_user_token(user)
+
+        assert new_token != old_token
+        assert EventCalendar.user_from_token(old_token) is None
+        assert EventCalendar.user_from_token(new_token) == user
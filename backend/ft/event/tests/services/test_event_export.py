@@ -0,0 +1,126 @@
+import csv
+import io
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import (
+    Event,
+    EventSubscription,
+    EventHosting,
+    EventHostingRequest,
+    CarpoolTrip,
+    CarpoolRequest,
+)
+from ft.event.services import EventExport
+
+
+@pytest.mark.django_db
+class TestEventExport:
+    """Tests pour les exports CSV d'un événement."""
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement."""
+        return Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    def make_user(self, name):
+        return User.objects.create_user(
+            username=name,
+            email=f"{name}@example.com",
+            password="password123",
+            first_name=name.capitalize(),
+            last_name="Dupont",
+            city="Compiègne",
+        )
+
+    def read(self, export, kind):
+        content = "".join(export.stream_csv(kind))
+        assert content.startswith("\ufeff")
+        return list(csv.reader(io.StringIO(content[1:]), delimiter=";"))
+
+    def test_participants(self, event):
+        """Test de l'export des participants actifs."""
+        alice, bob = self.make_user("alice"), self.make_user("bob")
+        EventSubscription.objects.create(
+            event=event, user=alice, answer="YES", can_invite=True
+        )
+        EventSubscription.objects.create(
+            event=event, user=bob, answer="NO", is_active=False
+        )
+
+        rows = self.read(EventExport([event.pk]), "participants")
+
+        assert rows[0][:3] == ["Événement", "Nom", "Prénom"]
+        assert len(rows) == 2
+        assert rows[1][0] == "Congrès"
+        assert rows[1][2] == "Alice"
+        assert rows[1][7] == "Participe"
+        assert rows[1][8] == "Oui"
+
+    def test_formulas_are_escaped(self, event):
+        """Test que les textes qui ressemblent à une formule sont neutralisés."""
+        user = self.make_user("mallory")
+        user.last_name = '=HYPERLINK("http://evil.example","x")'
+        user.first_name = "@SUM(A1)"
+        user.city = "-Compiègne"
+        user.save()
+        EventSubscription.objects.create(event=event, user=user, answer="YES")
+
+        rows = self.read(EventExport([event.pk]), "participants")
+
+        assert rows[1][1] == '\'=HYPERLINK("http://evil.example","x")'
+        assert rows[1][2] == "'@SUM(A1)"
+        assert rows[1][6] == "'-Compiègne"
+        assert rows[1][4] == "mallory@example.com"
+
+    def test_hostings_and_carpools(self, event):
+        """Test des exports des hébergements et des covoiturages."""
+        host, guest = self.make_user("host"), self.make_user("guest")
+        hosting = EventHosting.objects.create(event=event, host=host, available_beds=2)
+        EventHostingRequest.objects.create(
+            hosting=hosting, requester=guest, status=EventHostingRequest.Status.ACCEPTED
+        )
+        trip = CarpoolTrip.objects.create(
+            event=event,
+            driver=host,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            price_per_seat=Decimal("5.00"),
+        )
+        CarpoolRequest.objects.create(trip=trip, passenger=guest, seats_requested=2)
+
+        hostings = self.read(EventExport([event.pk]), "hostings")
+        carpools = self.read(EventExport([event.pk]), "carpools")
+
+        assert len(hostings) == 2
+        assert hostings[1][2] == "Host"
+        assert hostings[1][10] == "Guest"
+        assert hostings[1][13] == "Acceptée"
+        assert len(carpools) == 2
+        assert carpools[1][4] == "Paris"
+        assert carpools[1][11] == "2"
+        assert carpools[1][12] == "En attente"
+
+    def test_single_query_regardless_of_size(self, event):
+        """Test que l'export fait une seule requête, sans requête par ligne."""
+        users = [self.make_user(f"user{index}") for index in range(20)]
+        EventSubscription.objects.bulk_create(
+            EventSubscription(event=event, user=user) for user in users
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.read(EventExport([event.pk]), "participants")
+
+        assert len(rows) == 21
+        assert len(queries) <= 2
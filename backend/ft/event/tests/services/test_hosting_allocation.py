@@ -0,0 +1,159 @@
+import pytest
+import time
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, EventHosting, EventHostingRequest
+from ft.event.services import HostingAllocation
+
+
+@pytest.mark.django_db
+class TestHostingAllocation:
+    """Tests pour le moteur d'attribution des hébergements."""
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement à Compiègne."""
+        return Event.objects.create(
+            name="Congrès",
+            location="Place de l'Hôtel de Ville, Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    def make_user(self, name, city=None):
+        return User.objects.create_user(
+            username=name,
+            email=f"{name}@example.com",
+            password="password123",
+            city=city,
+        )
+
+    def make_hosting(self, event, name, beds, city="Compiègne"):
+        return EventHosting.objects.create(
+            event=event, host=self.make_user(name, city), available_beds=beds
+        )
+
+    def test_honours_preferences_and_capacity(self, event):
+        """Test que les préférences sont suivies dans la limite des lits."""
+        popular = self.make_hosting(event, "popular", 1)
+        other = self.make_hosting(event, "other", 1)
+        alice, bob = self.make_user("alice"), self.make_user("bob")
+
+        # Alice préfère `popular` puis `other`, Bob n'a demandé que `popular`.
+        alice_first = EventHostingRequest.objects.create(
+            hosting=popular, requester=alice
+        )
+        alice_second = EventHostingRequest.objects.create(
+            hosting=other, requester=alice
+        )
+        bob_only = EventHostingRequest.objects.create(hosting=popular, requester=bob)
+
+        result = HostingAllocation(event).run()
+
+        assert sorted(item["request"] for item in result["accepted"]) == sorted(
+            [alice_second.id, bob_only.id]
+        )
+        assert result["rejected"] == [alice_first.id]
+        assert result["unassigned"] == []
+        alice_first.refresh_from_db()
+        bob_only.refresh_from_db()
+        assert alice_first.status == EventHostingRequest.Status.REJECTED
+        assert bob_only.status == EventHostingRequest.Status.ACCEPTED
+
+    def test_prefers_hostings_in_event_city(self, event):
+        """Test qu'à préférence égale, l'hébergement en ville est privilégié."""
+        remote = self.make_hosting(event, "remote", 1, city="Paris")
+        local = self.make_hosting(event, "local", 1)
+        guest = self.make_user("guest")
+        EventHostingRequest.objects.create(hosting=remote, requester=guest)
+        local_request = EventHostingRequest.objects.create(
+            hosting=local, requester=guest
+        )
+        hosting_allocation = HostingAllocation(event)
+        hosting_allocation.PREFERENCE_STEP_COST = 0
+
+        result = hosting_allocation.run()
+
+        assert result["accepted"] == [
+            {"request": local_request.id, "hosting": local.id}
+        ]
+
+    @pytest.mark.parametrize(
+        "city, location, in_town",
+        [
+            ("Compiègne", "Compiègne", True),
+            ("compiègne ", "Salle des fêtes, Compiègne", True),
+            ("Saint-Étienne", "Stade Geoffroy-Guichard, Saint-Étienne", True),
+            ("Pau", "Salle Paul Bert, Lyon", False),
+            ("Paris", "Parisot", False),
+            ("", "Compiègne", False),
+        ],
+    )
+    def test_out_of_town_cost(self, event, city, location, in_town):
+        """Test que la ville est cherchée mot pour mot dans le lieu."""
+        event.location = location
+        hosting = self.make_hosting(event, "host", 1, city=city)
+
+        cost = HostingAllocation(event).hosting_cost(hosting, 0, event.location)
+
+        assert cost == (0 if in_town else HostingAllocation.OUT_OF_TOWN_COST)
+
+    def test_accepted_guests_use_beds(self, event):
+        """Test que les lits déjà attribués ne sont pas réattribués."""
+        hosting = self.make_hosting(event, "host", 1)
+        EventHostingRequest.objects.create(
+            hosting=hosting,
+            requester=self.make_user("first"),
+            status=EventHostingRequest.Status.ACCEPTED,
+        )
+        pending = EventHostingRequest.objects.create(
+            hosting=hosting, requester=self.make_user("second")
+        )
+
+        result = HostingAllocation(event).run(reject_unassigned=True)
+
+        assert result["accepted"] == []
+        assert result["unassigned"] == [pending.id]
+        assert result["rejected"] == [pending.id]
+        pending.refresh_from_db()
+        assert pending.status == EventHostingRequest.Status.REJECTED
+
+    def test_dry_run_does_not_write(self, event):
+        """Test que le mode simulation n'enregistre rien."""
+        hosting = self.make_hosting(event, "host", 2)
+        request = EventHostingRequest.objects.create(
+            hosting=hosting, requester=self.make_user("guest")
+        )
+
+        result = HostingAllocation(event).run(dry_run=True)
+
+        assert len(result["accepted"]) == 1
+        request.refresh_from_db()
+        assert request.status == EventHostingRequest.Status.PENDING
+
+    def test_plan_scales_to_thousands_of_guests(self, event):
+        """Test que le calcul reste rapide pour des milliers de demandeurs."""
+        hosts = [User(pk=index, city="Compiègne") for index in range(500)]
+        hostings = []
+        for index, host in enumerate(hosts):
+            hostings.append(
+                EventHosting(pk=index, event=event, host=host, available_beds=4)
+            )
+        requests = [
+            EventHostingRequest(
+                pk=guest * 3 + rank,
+                requester_id=10000 + guest,
+                hosting_id=(guest + rank * 11) % len(hostings),
+            )
+            for guest in range(3000)
+            for rank in range(3)
+        ]
+
+        start = time.monotonic()
+        accepted, _, unassigned = HostingAllocation(event).plan(hostings, requests)
+
+        assert time.monotonic() - start < 10
+        assert len(accepted) == 2000
+        assert len(unassigned) == 3000 * 3 - 2000 * 3
@@ -0,0 +1,64 @@
+from ft.event.services import MinCostFlow
+
+
+class TestMinCostFlow:
+    """Tests pour le solveur de flot de coût minimal."""
+
+    def test_prefers_cheapest_path(self):
+        """Test que le flot emprunte le chemin le moins coûteux."""
+        solver = MinCostFlow(4)
+        cheap = solver.add_edge(0, 1, 1, 1)
+        expensive = solver.add_edge(0, 2, 1, 5)
+        solver.add_edge(1, 3, 1, 0)
+        solver.add_edge(2, 3, 1, 0)
+
+        flow, cost = solver.solve(0, 3)
+
+        assert flow == 2
+        assert cost == 6
+        assert solver.flow_on(cheap) == 1
+        assert solver.flow_on(expensive) == 1
+
+    def test_reroutes_to_maximize_flow(self):
+        """Test que le solveur réaffecte un flux pour saturer le puits."""
+        # Source 0, gauche 1-2, droite 3-4, puits 5.
+        # Le nœud 1 peut aller en 3 ou 4 ; le nœud 2 seulement en 3.
+        solver = MinCostFlow(6)
+        solver.add_edge(0, 1, 1, 0)
+        solver.add_edge(0, 2, 1, 0)
+        first_to_shared = solver.add_edge(1, 3, 1, 0)
+        first_to_other = solver.add_edge(1, 4, 1, 3)
+        second_to_shared = solver.add_edge(2, 3, 1, 0)
+        solver.add_edge(3, 5, 1, 0)
+        solver.add_edge(4, 5, 1, 0)
+
+        flow, cost = solver.solve(0, 5)
+
+        assert flow == 2
+        assert cost == 3
+        assert solver.flow_on(first_to_shared) == 0
+        assert solver.flow_on(first_to_other) == 1
+        assert solver.flow_on(second_to_shared) == 1
+
+    def test_no_path(self):
+        """Test qu'aucun flux ne passe sans chemin vers le puits."""
+        solver = MinCostFlow(3)
+        solver.add_edge(0, 1, 4, 1)
+
+        assert solver.solve(0, 2) == (0, 0)
+
+    def test_large_assignment(self):
+        """Test d'une affectation de grande taille (capacités respectées)."""
+        guests, hosts = 2000, 400
+        solver = MinCostFlow(2 + guests + hosts)
+        for guest in range(guests):
+            solver.add_edge(0, 2 + guest, 1, 0)
+            for offset in range(3):
+                host = (guest + offset * 7) % hosts
+                solver.add_edge(2 + guest, 2 + guests + host, 1, offset)
+        for host in range(hosts):
+            solver.add_edge(2 + guests + host, 1, 4, 0)
+
+        flow, _ = solver.solve(0, 1)
+
+        assert flow == 1600
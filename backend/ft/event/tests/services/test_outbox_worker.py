@@ -0,0 +1,313 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.core import mail
+from django.urls import reverse
+from django.utils import timezone
+
+from ft.event.models import (
+    CarpoolRequest,
+    CarpoolTrip,
+    Event,
+    EventHosting,
+    EventHostingRequest,
+    OutboxMessage,
+)
+from ft.event.services import (
+    CarpoolAssignment,
+    HostingAllocation,
+    HostingRequestBulkAction,
+    OutboxWorker,
+)
+from ft.user.models import User
+
+
+@pytest.mark.django_db
+class TestOutboxWorker:
+    """Tests pour l'outbox et son worker."""
+
+    @pytest.fixture
+    def event(self):
+        return Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    @pytest.fixture
+    def host(self):
+        return User.objects.create_user(
+            username="host",
+            email="host@example.com",
+            password="password123",
+            first_name="Hélène",
+        )
+
+    @pytest.fixture
+    def requester(self):
+        return User.objects.create_user(
+            username="requester",
+            email="requester@example.com",
+            password="password123",
+            first_name="Rémi",
+        )
+
+    @pytest.fixture
+    def hosting(self, event, host):
+        return EventHosting.objects.create(event=event, host=host, available_beds=1)
+
+    @pytest.fixture
+    def hosting_request(self, hosting, requester):
+        return EventHostingRequest.objects.create(hosting=hosting, requester=requester)
+
+    @pytest.fixture
+    def trip(self, event, host):
+        return CarpoolTrip.objects.create(
+            event=event,
+            driver=host,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=3,
+            price_per_seat=Decimal("10.00"),
+        )
+
+    def test_status_change_is_only_enqueued(self, hosting_request):
+        """Test que le changement de statut n'envoie rien dans la requête."""
+        hosting_request.accept()
+
+        message = OutboxMessage.objects.get()
+        assert message.kind == "hosting_request_status"
+        assert message.payload == {"id": hosting_request.pk, "status": "ACCEPTED"}
+        assert mail.outbox == []
+
+    def test_accept_sends_email_to_requester(self, hosting_request):
+        """Test qu'une acceptation est notifiée au demandeur par le worker."""
+        hosting_request.host_message = "Bienvenue !"
+        hosting_request.accept()
+
+        stats = OutboxWorker().run_batch()
+
+        assert stats == {"sent": 1}
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["requester@example.com"]
+        assert "acceptée" in mail.outbox[0].subject
+        assert "Bienvenue !" in mail.outbox[0].body
+        message = OutboxMessage.objects.get()
+        assert message.status == OutboxMessage.Status.SENT
+        assert message.processed_at is not None
+
+    def test_cancel_sends_email_to_host(self, hosting_request):
+        """Test qu'une annulation est notifiée à l'hôte."""
+        hosting_request.cancel()
+
+        OutboxWorker().run_batch()
+
+        assert mail.outbox[0].to == ["host@example.com"]
+        assert "annulée" in mail.outbox[0].subject
+
+    def test_failed_accept_enqueues_nothing(self, hosting, hosting_request):
+        """Test qu'une acceptation refusée (hébergement complet) n'enregistre rien."""
+        EventHosting.objects.filter(pk=hosting.pk).update(beds_taken=1)
+
+        assert hosting_request.accept() is False
+        assert not OutboxMessage.objects.exists()
+
+    def test_bulk_action_enqueues_each_change(self, host, hosting_request):
+        """Test que les actions groupées enregistrent une notification par demande."""
+        results = HostingRequestBulkAction(host).run(
+            [{"id": hosting_request.pk, "action": "reject"}]
+        )
+
+        assert results == {hosting_request.pk: {"status": "REJECTED"}}
+        assert list(OutboxMessage.objects.values_list("payload", flat=True)) == [
+            {"id": hosting_request.pk, "status": "REJECTED"}
+        ]
+
+    def test_hosting_allocation_enqueues_each_change(
+        self, event, hosting, hosting_request
+    ):
+        """Test que l'attribution automatique notifie chaque demande traitée."""
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password123"
+        )
+        left_out = EventHostingRequest.objects.create(hosting=hosting, requester=other)
+
+        HostingAllocation(event).run(reject_unassigned=True)
+
+        payloads = OutboxMessage.objects.filter(
+            kind="hosting_request_status"
+        ).values_list("payload", flat=True)
+        assert sorted(payloads, key=lambda payload: payload["id"]) == [
+            {"id": hosting_request.pk, "status": "ACCEPTED"},
+            {"id": left_out.pk, "status": "REJECTED"},
+        ]
+
+    def test_carpool_assignment_enqueues_each_change(
+        self, event, trip, requester, host
+    ):
+        """Test que l'affectation automatique notifie acceptations et remplacements."""
+        other_trip = CarpoolTrip.objects.create(
+            event=event,
+            driver=User.objects.create_user(
+                username="driver2", email="driver2@example.com", password="x"
+            ),
+            departure_city="Lyon",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=3,
+            price_per_seat=Decimal("10.00"),
+        )
+        first = CarpoolRequest.objects.create(passenger=requester, trip=trip)
+        second = CarpoolRequest.objects.create(passenger=requester, trip=other_trip)
+
+        CarpoolAssignment(event).run()
+
+        assert list(
+            OutboxMessage.objects.filter(kind="carpool_request_status")
+            .order_by("pk")
+            .values_list("payload", flat=True)
+        ) == [
+            {"id": first.pk, "status": "ACCEPTED"},
+            {"id": second.pk, "status": "CANCELLED"},
+        ]
+
+    def test_carpool_request_patch_enqueues_status_change(
+        self, api_client, host, trip, requester
+    ):
+        """Test qu'un changement de statut par PATCH est aussi notifié."""
+        request = CarpoolRequest.objects.create(passenger=requester, trip=trip)
+        api_client.force_authenticate(user=host)
+        url = reverse("carpool-request-detail", kwargs={"pk": request.pk})
+
+        api_client.patch(url, {"message": "Rendez-vous gare"}, format="json")
+        assert not OutboxMessage.objects.exists()
+        response = api_client.patch(url, {"status": "REJECTED"}, format="json")
+
+        assert response.status_code == 200
+        assert list(OutboxMessage.objects.values_list("payload", flat=True)) == [
+            {"id": request.pk, "status": "REJECTED"}
+        ]
+
+    def test_carpool_request_action_sends_email(
+        self, api_client, host, trip, requester
+    ):
+        """Test que la réponse d'un conducteur est envoyée au passager."""
+        request = CarpoolRequest.objects.create(
+            passenger=requester, trip=trip, seats_requested=2
+        )
+        api_client.force_authenticate(user=host)
+
+        response = api_client.post(
+            reverse("carpool-request-request-action", kwargs={"pk": request.pk}),
+            {"action": "reject"},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert mail.outbox == []
+        OutboxWorker().run_batch()
+        assert mail.outbox[0].to == ["requester@example.com"]
+        assert "refusé" in mail.outbox[0].subject
+
+    def test_failure_is_retried_with_backoff(self, settings, monkeypatch):
+        """Test qu'un échec reprogramme le message avec un délai croissant."""
+        settings.OUTBOX_RETRY_BASE = 30
+
+        def fail(payload):
+            raise ConnectionError("SMTP indisponible")
+
+        monkeypatch.setitem(OutboxWorker.handlers, "hosting_request_status", fail)
+        message = OutboxMessage.enqueue("hosting_request_status", id=0, status="X")
+        before = timezone.now()
+
+        assert OutboxWorker().run_batch() == {"retried": 1}
+
+        message.refresh_from_db()
+        assert message.status == OutboxMessage.Status.PENDING
+        assert message.attempts == 1
+        assert message.last_error == "ConnectionError: SMTP indisponible"
+        delay = (message.available_at - before).total_seconds()
+        assert 30 <= delay <= 34
+        # Pas encore disponible : le lot suivant ne le reprend pas.
+        assert OutboxWorker().run_batch() == {}
+
+    def test_backoff_is_capped(self, settings):
+        """Test que le délai double à chaque tentative, dans la limite du plafond."""
+        settings.OUTBOX_RETRY_BASE = 30
+        settings.OUTBOX_RETRY_MAX = 100
+
+        assert 60 <= OutboxWorker.backoff(2).total_seconds() <= 66
+        assert 100 <= OutboxWorker.backoff(10).total_seconds() <= 110
+
+    def test_message_fails_after_max_attempts(self, settings, monkeypatch):
+        """Test qu'un message est abandonné après le nombre maximal de tentatives."""
+        settings.OUTBOX_MAX_ATTEMPTS = 2
+
+        def fail(payload):
+            raise ConnectionError("SMTP indisponible")
+
+        monkeypatch.setitem(OutboxWorker.handlers, "hosting_request_status", fail)
+        message = OutboxMessage.enqueue("hosting_request_status", id=0, status="X")
+        OutboxMessage.objects.filter(pk=message.pk).update(attempts=1)
+
+        assert OutboxWorker().run_batch() == {"failed": 1}
+
+        message.refresh_from_db()
+        assert message.status == OutboxMessage.Status.FAILED
+        assert message.attempts == 2
+
+    def test_unknown_kind_fails_immediately(self):
+        """Test qu'un type de message inconnu est abandonné sans nouvelle tentative."""
+        message = OutboxMessage.enqueue("webhook", url="https://example.com")
+
+        assert OutboxWorker().run_batch() == {"failed": 1}
+
+        message.refresh_from_db()
+        assert message.status == OutboxMessage.Status.FAILED
+        assert "webhook" in message.last_error
+
+    def test_deleted_request_is_skipped(self, hosting_request):
+        """Test qu'une demande supprimée avant l'envoi ne notifie personne."""
+        hosting_request.reject()
+        hosting_request.delete()
+
+        assert OutboxWorker().run_batch() == {"sent": 1}
+        assert mail.outbox == []
+
+    def test_batch_size_limits_claimed_messages(self):
+        """Test qu'un lot ne réserve pas plus de messages que sa taille."""
+        for _ in range(3):
+            OutboxMessage.enqueue("hosting_request_status", id=0, status="REJECTED")
+
+        assert OutboxWorker(batch_size=2).run_batch() == {"sent": 2}
+        assert OutboxMessage.objects.filter(status="PENDING").count() == 1
+
+    def test_metrics_and_purge(self, settings):
+        """Test des métriques de la file et de la purge des messages envoyés."""
+        now = timezone.now()
+        OutboxMessage.objects.create(
+            kind="hosting_request_status",
+            payload={},
+            available_at=now - datetime.timedelta(seconds=90),
+        )
+        OutboxMessage.objects.create(
+            kind="hosting_request_status",
+            payload={},
+            status=OutboxMessage.Status.SENT,
+            processed_at=now - datetime.timedelta(days=30),
+        )
+        OutboxMessage.objects.create(
+            kind="webhook", payload={}, status=OutboxMessage.Status.FAILED
+        )
+
+        metrics = OutboxWorker.metrics()
+
+        assert metrics["pending"] == 1
+        assert metrics["failed"] == 1
+        assert 90 <= metrics["lag_seconds"] < 100
+        assert OutboxWorker.purge() == 1
+        assert OutboxMessage.objects.count() == 2
@@ -0,0 +1,199 @@
+import pytest
+from decimal import Decimal
+from django.urls import reverse
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import (
+    Event,
+    EventSubscription,
+    EventHosting,
+    EventHostingRequest,
+    CarpoolTrip,
+    CarpoolRequest,
+    CarpoolPayment,
+)
+
+
+@pytest.mark.django_db
+class TestEventAdminChangelists:
+    """Tests du nombre de requêtes des listes de l'admin."""
+
+    ROWS = 8
+
+    @pytest.fixture
+    def superuser_client(self, client, admin_user):
+        client.force_login(admin_user)
+        return client
+
+    @pytest.fixture
+    def data(self):
+        """Fixture pour créer plusieurs lignes dans chaque table."""
+        event = Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+        users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="password123",
+            )
+            for index in range(self.ROWS + 1)
+        ]
+        driver, passengers = users[0], users[1:]
+        trip = CarpoolTrip.objects.create(
+            event=event,
+            driver=driver,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=self.ROWS,
+        )
+        hosting = EventHosting.objects.create(
+            event=event, host=driver, available_beds=self.ROWS
+        )
+        for index, passenger in enumerate(passengers):
+            EventSubscription.objects.create(event=event, user=passenger, answer="YES")
+            request = CarpoolRequest.objects.create(
+                trip=trip, passenger=passenger, status="ACCEPTED"
+            )
+            CarpoolPayment.objects.create(
+                request=request, amount=Decimal("5.00"), is_completed=index % 2 == 0
+            )
+            EventHostingRequest.objects.create(hosting=hosting, requester=passenger)
+        return event, trip
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            "event",
+            "eventsubscription",
+            "eventhosting",
+            "eventhostingrequest",
+            "carpooltrip",
+            "carpoolrequest",
+        ],
+    )
+    def test_changelist_queries_do_not_grow(
+        self, superuser_client, data, model, django_assert_max_num_queries
+    ):
+        """Test que la liste ne fait pas de requête par ligne."""
+        url = reverse(f"admin:event_{model}_changelist")
+
+        with django_assert_max_num_queries(6):
+            response = superuser_client.get(url)
+
+        assert response.status_code == 200
+
+    def test_annotated_columns(self, superuser_client, data):
+        """Test des colonnes annotées et triables."""
+        event, trip = data
+
+        response = superuser_client.get(
+            reverse("admin:event_carpooltrip_changelist"), {"o": "7"}
+        )
+        assert response.status_code == 200
+        assert response.context["cl"].result_list[0].seats_left == 0
+
+        response = superuser_client.get(
+            reverse("admin:event_event_changelist"), {"o": "7"}
+        )
+        assert response.context["cl"].result_list[0].participants_count == self.ROWS
+
+        response = superuser_client.get(
+            reverse("admin:event_carpoolrequest_changelist"), {"o": "5"}
+        )
+        paid = [row.paid for row in response.context["cl"].result_list]
+        assert paid.count(True) == self.ROWS // 2
+
+
+@pytest.mark.django_db
+class TestEventAdminForeignKeys:
+    """Tests des champs à autocomplétion et des recherches de l'admin."""
+
+    @pytest.fixture
+    def superuser_client(self, client, admin_user):
+        client.force_login(admin_user)
+        return client
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            "eventsubscription",
+            "eventhosting",
+            "eventhostingrequest",
+            "carpooltrip",
+            "carpoolrequest",
+            "carpoolpayment",
+        ],
+    )
+    def test_add_form_does_not_list_users(self, superuser_client, model):
+        """Test que le formulaire n'affiche pas la liste des utilisateurs."""
+        User.objects.create_user(
+            username="listed", email="listed@example.com", password="password123"
+        )
+
+        response = superuser_client.get(reverse(f"admin:event_{model}_add"))
+
+        assert response.status_code == 200
+        assert b"admin-autocomplete" in response.content
+        assert b"listed@example.com" not in response.content
+
+    def test_subscription_search_on_related_fields(self, superuser_client):
+        """Test que la recherche des inscriptions porte sur l'utilisateur."""
+        event = Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+        alice = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        bob = User.objects.create_user(
+            username="bob", email="bob@example.com", password="password123"
+        )
+        EventSubscription.objects.create(event=event, user=alice)
+        EventSubscription.objects.create(event=event, user=bob)
+
+        response = superuser_client.get(
+            reverse("admin:event_eventsubscription_changelist"), {"q": "ALI"}
+        )
+
+        assert response.status_code == 200
+        assert [row.user for row in response.context["cl"].result_list] == [alice]
+
+    def test_user_autocomplete(self, superuser_client):
+        """Test de l'autocomplétion des utilisateurs par préfixe."""
+        User.objects.create_user(
+            username="jean",
+            email="jean@example.com",
+            password="password123",
+            first_name="Jean",
+            last_name="Dupont",
+        )
+        User.objects.create_user(
+            username="marie",
+            email="marie@example.com",
+            password="password123",
+            first_name="Marie",
+            last_name="Durand",
+        )
+
+        response = superuser_client.get(
+            reverse("admin:autocomplete"),
+            {
+                "term": "jean dup",
+                "app_label": "event",
+                "model_name": "carpooltrip",
+                "field_name": "driver",
+            },
+        )
+
+        assert response.status_code == 200
+        assert [item["text"] for item in response.json()["results"]] == ["Jean Dupont"]
@@ -0,0 +1,199 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ft.event.models import (
+    CarpoolRequest,
+    CarpoolTrip,
+    Event,
+    EventHosting,
+    EventHostingRequest,
+    IdempotencyKey,
+)
+from ft.user.models import User
+
+
+@pytest.mark.django_db
+class TestIdempotencyKey:
+    """Tests pour l'en-tête Idempotency-Key des actions POST."""
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement."""
+        return Event.objects.create(
+            name="Test Event",
+            location="Test Location",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    @pytest.fixture
+    def driver(self):
+        """Fixture pour créer un conducteur."""
+        return User.objects.create_user(
+            username="driver", email="driver@example.com", password="password123"
+        )
+
+    @pytest.fixture
+    def passenger(self):
+        """Fixture pour créer un passager."""
+        return User.objects.create_user(
+            username="passenger", email="passenger@example.com", password="password123"
+        )
+
+    @pytest.fixture
+    def trip(self, event, driver):
+        """Fixture pour créer un trajet de covoiturage."""
+        return CarpoolTrip.objects.create(
+            event=event,
+            driver=driver,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=timezone.now() + datetime.timedelta(days=9),
+            seats_total=3,
+            price_per_seat=Decimal("15.00"),
+        )
+
+    def create_request(self, api_client, trip, key, seats=2):
+        return api_client.post(
+            reverse("carpool-request-list"),
+            {"trip_id": trip.id, "seats_requested": seats},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_first_response(self, api_client, passenger, trip):
+        """Test qu'une nouvelle tentative rejoue la réponse sans recréer."""
+        api_client.force_authenticate(user=passenger)
+
+        first = self.create_request(api_client, trip, "retry-1")
+        with CaptureQueriesContext(connection) as queries:
+            second = self.create_request(api_client, trip, "retry-1")
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_201_CREATED
+        assert second.data == first.data
+        assert second["Idempotent-Replayed"] == "true"
+        assert CarpoolRequest.objects.count() == 1
+        assert not any("carpoolrequest" in query["sql"] for query in queries)
+
+    def subscribe(self, api_client, event, key=None):
+        headers = {"HTTP_IDEMPOTENCY_KEY": key} if key else {}
+        return api_client.post(
+            reverse("event-subscribe", kwargs={"pk": event.id}),
+            {"answer": "YES"},
+            format="json",
+            **headers,
+        )
+
+    def test_without_header_runs_every_time(self, api_client, passenger, event):
+        """Test que sans en-tête chaque requête est exécutée."""
+        api_client.force_authenticate(user=passenger)
+
+        first = self.subscribe(api_client, event)
+        second = self.subscribe(api_client, event)
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert "Idempotent-Replayed" not in second
+        assert not IdempotencyKey.objects.exists()
+
+    def test_key_reused_with_other_payload(self, api_client, passenger, trip):
+        """Test qu'une clé réutilisée pour une autre requête est refusée."""
+        api_client.force_authenticate(user=passenger)
+
+        self.create_request(api_client, trip, "reused", seats=1)
+        response = self.create_request(api_client, trip, "reused", seats=2)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert CarpoolRequest.objects.count() == 1
+
+    def test_keys_are_scoped_per_user(self, api_client, passenger, trip):
+        """Test qu'une même clé envoyée par deux utilisateurs reste distincte."""
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password123"
+        )
+        api_client.force_authenticate(user=passenger)
+        self.create_request(api_client, trip, "shared", seats=1)
+        api_client.force_authenticate(user=other)
+        response = self.create_request(api_client, trip, "shared", seats=1)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert "Idempotent-Replayed" not in response
+        assert CarpoolRequest.objects.count() == 2
+
+    def test_expired_key_runs_again(self, api_client, passenger, event):
+        """Test qu'une clé expirée est oubliée et la requête exécutée."""
+        api_client.force_authenticate(user=passenger)
+        self.subscribe(api_client, event, "expired")
+        IdempotencyKey.objects.update(expires_at=timezone.now())
+
+        response = self.subscribe(api_client, event, "expired")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "Idempotent-Replayed" not in response
+        assert IdempotencyKey.objects.count() == 1
+
+    def test_client_error_is_replayed(self, api_client, passenger, trip):
+        """Test qu'une erreur de validation est rejouée sans revalidation."""
+        api_client.force_authenticate(user=passenger)
+        url = reverse("carpool-request-list")
+
+        first = api_client.post(
+            url, {"seats_requested": 1}, format="json", HTTP_IDEMPOTENCY_KEY="bad"
+        )
+        second = api_client.post(
+            url, {"seats_requested": 1}, format="json", HTTP_IDEMPOTENCY_KEY="bad"
+        )
+
+        assert first.status_code == status.HTTP_400_BAD_REQUEST
+        assert second.status_code == status.HTTP_400_BAD_REQUEST
+        assert second.data == first.data
+        assert second["Idempotent-Replayed"] == "true"
+
+    def test_key_too_long(self, api_client, passenger, trip):
+        """Test qu'une clé de plus de 255 caractères est refusée."""
+        api_client.force_authenticate(user=passenger)
+
+        response = self.create_request(api_client, trip, "k" * 256)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not CarpoolRequest.objects.exists()
+
+    def test_hosting_accept_is_not_applied_twice(self, api_client, event, passenger):
+        """Test qu'une acceptation rejouée ne prend pas un deuxième lit."""
+        host = User.objects.create_user(
+            username="host", email="host@example.com", password="password123"
+        )
+        hosting = EventHosting.objects.create(event=event, host=host, available_beds=2)
+        hosting_request = EventHostingRequest.objects.create(
+            hosting=hosting, requester=passenger
+        )
+        api_client.force_authenticate(user=host)
+        url = reverse("event-hosting-request-accept", kwargs={"pk": hosting_request.id})
+
+        first = api_client.post(url, {}, format="json", HTTP_IDEMPOTENCY_KEY="accept")
+        second = api_client.post(url, {}, format="json", HTTP_IDEMPOTENCY_KEY="accept")
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+
+    def test_subscribe_replay(self, api_client, event, passenger):
+        """Test que l'inscription à un événement est rejouée."""
+        api_client.force_authenticate(user=passenger)
+
+        first = self.subscribe(api_client, event, "sub")
+        second = self.subscribe(api_client, event, "sub")
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert second["Idempotent-Replayed"] == "true"
@@ -5,9 +5,17 @@ from ft.event.permissions import (
     IsEventSubscriptionOwnerOrReadOnly,
     IsHostingOwnerOrReadOnly,
     IsHostingRequestRequesterOrHost,
+    IsCarpoolRequestPassengerOrDriver,
 )
 from ft.user.models import User
-from ft.event.models import EventSubscription, Event, EventHosting
+from ft.event.models import (
+    CarpoolRequest,
+    CarpoolTrip,
+    EventSubscription,
+    Event,
+    EventHosting,
+    EventHostingRequest,
+)
 from django.utils import timezone
 import datetime
 
@@ -146,3 +154,75 @@ class TestIsEventSubscriptionOwnerOrReadOnly:
             assert (
                 permission.has_object_permission(request, None, subscription) is False
             )
+
+
+@pytest.mark.django_db
+class TestAnnotatedPermissions:
+    """Tests pour les permissions calculées par le queryset."""
+
+    @pytest.fixture
+    def event(self):
+        return Event.objects.create(
+            name="Test Event",
+            location="Paris",
+            start_date=timezone.now() + datetime.timedelta(days=30),
+            end_date=timezone.now() + datetime.timedelta(days=32),
+            type="CONGRESS",
+        )
+
+    @pytest.fixture
+    def users(self):
+        return [
+            User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="password123",
+            )
+            for index in range(3)
+        ]
+
+    def test_hosting_request_rules_cost_no_query(
+        self, event, users, django_assert_num_queries
+    ):
+        """Test que les annotations évitent tout chargement de relation."""
+        host, requester, other = users
+        hosting = EventHosting.objects.create(event=event, host=host, available_beds=2)
+        EventHostingRequest.objects.create(hosting=hosting, requester=requester)
+        permission = IsHostingRequestRequesterOrHost()
+        request = APIRequestFactory().post("/")
+
+        for user, allowed in [(host, True), (requester, True), (other, False)]:
+            request.user = user
+            obj = EventHostingRequest.objects.annotate(
+                **permission.get_annotations(request)
+            ).get()
+
+            with django_assert_num_queries(0):
+                assert permission.has_object_permission(request, None, obj) is allowed
+
+    def test_carpool_request_rules(self, event, users):
+        """Test des règles conducteur / passager, annotées ou non."""
+        driver, passenger, other = users
+        trip = CarpoolTrip.objects.create(
+            driver=driver,
+            event=event,
+            departure_city="Compiègne",
+            arrival_city="Paris",
+            departure_datetime=timezone.now() + datetime.timedelta(days=29),
+            seats_total=3,
+        )
+        carpool_request = CarpoolRequest.objects.create(passenger=passenger, trip=trip)
+        permission = IsCarpoolRequestPassengerOrDriver()
+        request = APIRequestFactory().post("/")
+        request.user = driver
+
+        annotated = CarpoolRequest.objects.annotate(
+            **permission.get_annotations(request)
+        ).get()
+
+        assert annotated.is_driver is True
+        assert annotated.is_passenger is False
+        assert permission.resolve(carpool_request, "is_driver", driver) is True
+        assert permission.resolve(carpool_request, "is_passenger", other) is False
+        request.user = other
+        assert permission.has_object_permission(request, None, carpool_request) is False
@@ -218,3 +218,152 @@ class TestCarpoolRequestViewSetExtended:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "amount" in response.data
+
+    def test_bulk_action_accepts_within_capacity(
+        self, api_client, driver, trip, pending_request, accepted_request
+    ):
+        """Test que les actions groupées respectent les places restantes."""
+        third = User.objects.create_user(
+            username="third", email="third@example.com", password="password123"
+        )
+        extra_request = CarpoolRequest.objects.create(
+            passenger=third, trip=trip, seats_requested=2
+        )
+        api_client.force_authenticate(user=driver)
+
+        url = reverse("carpool-request-bulk-action")
+        data = {
+            "actions": [
+                {"id": pending_request.id, "action": "accept"},
+                {"id": extra_request.id, "action": "accept"},
+                {"id": 999999, "action": "reject"},
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert results[pending_request.id] == {"status": "ACCEPTED"}
+        assert "error" in results[extra_request.id]
+        assert results[999999] == {"error": "Demande introuvable."}
+        pending_request.refresh_from_db()
+        extra_request.refresh_from_db()
+        assert pending_request.status == "ACCEPTED"
+        assert extra_request.status == "PENDING"
+
+    def test_bulk_action_uses_seats_available(
+        self, api_client, driver, trip, pending_request, accepted_request
+    ):
+        """Test qu'une action groupée suit la même règle que request_action."""
+        third = User.objects.create_user(
+            username="third", email="third@example.com", password="password123"
+        )
+        extra_request = CarpoolRequest.objects.create(passenger=third, trip=trip)
+        api_client.force_authenticate(user=driver)
+
+        response = api_client.post(
+            reverse("carpool-request-bulk-action"),
+            {
+                "actions": [
+                    {"id": pending_request.id, "action": "accept"},
+                    {"id": extra_request.id, "action": "accept"},
+                ]
+            },
+            format="json",
+        )
+
+        # 3 places, 2 demandes acceptées : il reste 1 place, comme pour
+        # `trip.seats_available`.
+        assert response.data["results"][extra_request.id] == {"status": "ACCEPTED"}
+        trip.refresh_from_db()
+        assert trip.seats_available == 0
+
+    def test_bulk_action_checks_roles(
+        self, api_client, passenger, pending_request, accepted_request
+    ):
+        """Test qu'un passager ne peut qu'annuler ses propres demandes."""
+        api_client.force_authenticate(user=passenger)
+
+        url = reverse("carpool-request-bulk-action")
+        data = {
+            "actions": [
+                {"id": pending_request.id, "action": "accept"},
+                {"id": accepted_request.id, "action": "cancel"},
+                {
+                    "id": pending_request.id,
+                    "action": "cancel",
+                    "response_message": "Plus besoin",
+                },
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert results[pending_request.id] == {"status": "CANCELLED"}
+        assert results[accepted_request.id] == {"error": "Demande introuvable."}
+        pending_request.refresh_from_db()
+        accepted_request.refresh_from_db()
+        assert pending_request.status == "CANCELLED"
+        assert pending_request.response_message == "Plus besoin"
+        assert accepted_request.status == "ACCEPTED"
+
+    def test_bulk_action_requires_actions(self, api_client, driver):
+        """Test qu'une liste d'actions vide est refusée."""
+        api_client.force_authenticate(user=driver)
+
+        url = reverse("carpool-request-bulk-action")
+        response = api_client.post(url, {"actions": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_normalized_shape(
+        self,
+        api_client,
+        driver,
+        passenger,
+        another_passenger,
+        trip,
+        pending_request,
+        accepted_request,
+    ):
+        """Test que ?include= renvoie chaque objet lié une seule fois."""
+        api_client.force_authenticate(user=driver)
+        url = reverse("carpool-request-list")
+        response = api_client.get(url, {"include": "trips,users,events"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+        assert "results" not in response.data
+        assert {row["trip"] for row in response.data["data"]} == {trip.id}
+        assert {row["passenger"] for row in response.data["data"]} == {
+            passenger.id,
+            another_passenger.id,
+        }
+
+        included = response.data["included"]
+        assert list(included["trips"]) == [trip.id]
+        assert included["trips"][trip.id]["driver"] == driver.id
+        assert included["trips"][trip.id]["event"] == trip.event_id
+        assert set(included["users"]) == {driver.id, passenger.id, another_passenger.id}
+        assert list(included["events"]) == [trip.event_id]
+
+    def test_list_normalized_partial_include(
+        self, api_client, driver, trip, pending_request
+    ):
+        """Test que seuls les types demandés sont inclus."""
+        api_client.force_authenticate(user=driver)
+        url = reverse("carpool-request-list")
+        response = api_client.get(url, {"include": "trips"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["included"]) == {"trips"}
+
+    def test_list_normalized_unknown_include(self, api_client, driver):
+        """Test qu'un type inconnu est refusé."""
+        api_client.force_authenticate(user=driver)
+        url = reverse("carpool-request-list")
+        response = api_client.get(url, {"include": "payments"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "include" in response.data
@@ -0,0 +1,103 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ft.event.models import CarpoolRequest, CarpoolTrip, Event
+from ft.event.services import ChangeFeed
+from ft.user.models import User
+
+
+@pytest.fixture
+def driver(transactional_db):
+    return User.objects.create_user(
+        username="driver", email="driver@example.com", password="password123"
+    )
+
+
+@pytest.fixture
+def trip(driver):
+    event = Event.objects.create(
+        name="Congrès",
+        location="Compiègne",
+        start_date=timezone.now() + datetime.timedelta(days=10),
+        end_date=timezone.now() + datetime.timedelta(days=12),
+        type="CONGRESS",
+    )
+    return CarpoolTrip.objects.create(
+        event=event,
+        driver=driver,
+        departure_city="Paris",
+        arrival_city="Compiègne",
+        departure_datetime=timezone.now() + datetime.timedelta(days=9),
+        seats_total=3,
+        price_per_seat=Decimal("10.00"),
+    )
+
+
+def request_for(trip):
+    passenger = User.objects.create_user(
+        username="passenger", email="passenger@example.com", password="password123"
+    )
+    return CarpoolRequest.objects.create(trip=trip, passenger=passenger)
+
+
+class TestChangeStreamView:
+    """Tests pour le flux Server-Sent Events des changements."""
+
+    def test_anonymous_is_refused(self, client, transactional_db):
+        """Test qu'un utilisateur anonyme ne peut pas ouvrir le flux."""
+        response = client.get(reverse("event-stream"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_wsgi_stream(self, client, settings, driver, trip):
+        """Test que le flux WSGI pousse les demandes faites au conducteur."""
+        settings.CHANGE_FEED_WSGI_DURATION = 2
+        settings.CHANGE_FEED_HEARTBEAT = 0.5
+        client.force_login(driver)
+
+        response = client.get(reverse("event-stream"))
+        assert response["Content-Type"] == "text/event-stream"
+        events = iter(response.streaming_content)
+
+        assert b"event: ready" in next(events)
+        carpool_request = request_for(trip)
+        assert next(events) == (
+            b"event: carpool_request\n"
+            b'data: {"id":%d,"op":"insert","s":"PENDING","trip":%d}\n\n'
+            % (carpool_request.pk, trip.pk)
+        )
+        assert b"".join(events).count(b": ping") >= 1
+
+    def test_asgi_stream(self, settings, driver, trip):
+        """Test que le flux ASGI partage l'écoute et pousse les changements."""
+        settings.CHANGE_FEED_HEARTBEAT = 0.5
+
+        async def scenario():
+            client = AsyncClient()
+            await client.aforce_login(driver)
+            response = await client.get(reverse("event-stream"))
+            events = aiter(response.streaming_content)
+            try:
+                ready = await anext(events)
+                carpool_request = await sync_to_async(request_for)(trip)
+                message = await anext(events)
+                while message == b": ping\n\n":
+                    message = await anext(events)
+                return ready, message, carpool_request
+            finally:
+                await events.aclose()
+                await ChangeFeed.stop()
+
+        ready, message, carpool_request = async_to_sync(scenario)()
+
+        assert b"event: ready" in ready
+        assert message.startswith(b"event: carpool_request\n")
+        assert b'"id":%d' % carpool_request.pk in message
+        assert ChangeFeed._queues == {}
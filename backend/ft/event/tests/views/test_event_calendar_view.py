@@ -0,0 +1,102 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from django.utils import timezone
+import datetime
+from ft.user.models import User
+from ft.event.models import Event, EventSubscription
+from ft.event.services import EventCalendar
+
+
+@pytest.mark.django_db
+class TestEventCalendarView:
+    """Tests pour les flux iCalendar."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    @pytest.fixture
+    def event(self):
+        """Fixture pour créer un événement public."""
+        return Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    def test_public_feed(self, client, event):
+        """Test que le flux public est servi avec un ETag."""
+        response = client.get(reverse("event-calendar"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        assert response["ETag"]
+        assert "max-age=300" in response["Cache-Control"]
+        content = b"".join(response.streaming_content).decode()
+        assert "SUMMARY:Congrès" in content
+
+    def test_not_modified(self, client, event):
+        """Test qu'un client à jour reçoit un 304."""
+        etag = client.get(reverse("event-calendar"))["ETag"]
+
+        response = client.get(reverse("event-calendar"), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_body_served_from_cache(self, client, event, django_assert_num_queries):
+        """Test qu'un flux déjà généré est resservi depuis le cache."""
+        first = client.get(reverse("event-calendar"))
+        content = b"".join(first.streaming_content)
+
+        with django_assert_num_queries(1):
+            response = client.get(reverse("event-calendar"))
+            assert b"".join(response.streaming_content) == content
+
+    def test_user_feed(self, client, event):
+        """Test du flux personnel identifié par son jeton."""
+        user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        EventSubscription.objects.create(event=event, user=user, answer="YES")
+
+        url = reverse(
+            "event-calendar-user", kwargs={"token": EventCalendar.user_token(user)}
+        )
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "private" in response["Cache-Control"]
+        assert b"SUMMARY:Congr" in b"".join(response.streaming_content)
+
+    def test_user_feed_bad_token(self, client):
+        """Test qu'un jeton invalide renvoie 404."""
+        url = reverse("event-calendar-user", kwargs={"token": "1:forged"})
+
+        assert client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_calendar_feed_url(self, api_client, user):
+        """Test que l'utilisateur récupère l'URL de son flux."""
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("event-calendar-feed"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["url"].endswith(EventCalendar.user_token(user) + ".ics")
+
+    def test_rotate_calendar_feed(self, api_client, client, user):
+        """Test que la rotation révoque l'ancienne URL du flux."""
+        old_url = reverse(
+            "event-calendar-user", kwargs={"token": EventCalendar.user_token(user)}
+        )
+        api_client.force_authenticate(user=user)
+
+        response = api_client.post(reverse("event-calendar-feed-rotate"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not response.data["url"].endswith(old_url)
+        assert client.get(old_url).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(response.data["url"]).status_code == status.HTTP_200_OK
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -213,6 +215,20 @@ class TestEventHostingRequestViewSet:
         assert response.data["status"] == "ACCEPTED"
         assert response.data["host_message"] == "Bienvenue chez moi !"
 
+    def test_accept_request_when_hosting_is_full_fails(
+        self, api_client, host, hosting, pending_request
+    ):
+        """Test qu'un hôte ne peut pas accepter au-delà de ses lits."""
+        EventHosting.objects.filter(pk=hosting.pk).update(beds_taken=2)
+        api_client.force_authenticate(user=host)
+
+        url = reverse("event-hosting-request-accept", kwargs={"pk": pending_request.id})
+        response = api_client.post(url, {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        pending_request.refresh_from_db()
+        assert pending_request.status == EventHostingRequest.Status.PENDING
+
     def test_accept_request_as_requester_fails(
         self, api_client, requester, pending_request
     ):
@@ -237,6 +253,38 @@ class TestEventHostingRequestViewSet:
         assert response.data["status"] == "REJECTED"
         assert response.data["host_message"] == "Désolé, je n'ai plus de place."
 
+    @pytest.mark.parametrize(
+        "action, actor, queries",
+        [("accept", "host", 6), ("reject", "host", 5), ("cancel", "requester", 5)],
+    )
+    def test_action_query_count(
+        self,
+        api_client,
+        host,
+        requester,
+        pending_request,
+        django_assert_num_queries,
+        action,
+        actor,
+        queries,
+    ):
+        """
+        Test que les permissions sont lues dans la requête de l'objet : une
+        seule lecture, puis les écritures de l'action (savepoint, UPDATE,
+        message de l'outbox).
+        """
+        api_client.force_authenticate(user=host if actor == "host" else requester)
+        url = reverse(
+            f"event-hosting-request-{action}", kwargs={"pk": pending_request.id}
+        )
+
+        with django_assert_num_queries(queries) as captured:
+            response = api_client.post(url, {}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        lookup = captured.captured_queries[0]["sql"]
+        assert '"is_host"' in lookup and '"is_requester"' in lookup
+
     def test_reject_request_as_requester_fails(
         self, api_client, requester, pending_request
     ):
@@ -275,9 +323,9 @@ class TestEventHostingRequestViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == pending_request.id
-        assert response.data[0]["requester"]["id"] == requester.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == pending_request.id
+        assert response.data["results"][0]["requester"]["id"] == requester.id
 
     def test_for_my_hostings_action(self, api_client, host, pending_request):
         """Test de l'action for_my_hostings."""
@@ -287,6 +335,104 @@ class TestEventHostingRequestViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == pending_request.id
-        assert response.data[0]["hosting"]["host"]["id"] == host.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == pending_request.id
+        assert response.data["results"][0]["hosting"]["host"]["id"] == host.id
+
+    def test_for_my_hostings_stream(self, api_client, host, hosting, pending_request):
+        """Test que `?stream=ndjson` renvoie une demande par ligne."""
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password123"
+        )
+        EventHostingRequest.objects.create(hosting=hosting, requester=other)
+        api_client.force_authenticate(user=host)
+
+        url = reverse("event-hosting-request-for-my-hostings")
+        response = api_client.get(url, {"stream": "ndjson", "ordering": "created_at"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [row["id"] for row in rows][0] == pending_request.id
+        assert len(rows) == 2
+        assert rows[1]["requester"]["id"] == other.id
+        assert rows[1]["hosting"]["host"]["id"] == host.id
+
+    def test_for_my_hostings_query_count(
+        self, api_client, host, hosting, django_assert_max_num_queries
+    ):
+        """Test que le nombre de requêtes SQL ne dépend pas du nombre de lignes."""
+        for index in range(10):
+            guest = User.objects.create_user(
+                username=f"guest{index}",
+                email=f"guest{index}@example.com",
+                password="password123",
+            )
+            EventHostingRequest.objects.create(hosting=hosting, requester=guest)
+        api_client.force_authenticate(user=host)
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("event-hosting-request-for-my-hostings"))
+
+        assert response.data["count"] == 10
+        assert len(response.data["results"]) == 10
+
+    def test_bulk_action_as_host(self, api_client, host, hosting, pending_request):
+        """Test qu'un hôte peut répondre à plusieurs demandes en une requête."""
+        guests = [
+            User.objects.create_user(
+                username=f"guest{index}",
+                email=f"guest{index}@example.com",
+                password="password123",
+            )
+            for index in range(2)
+        ]
+        others = [
+            EventHostingRequest.objects.create(hosting=hosting, requester=guest)
+            for guest in guests
+        ]
+        api_client.force_authenticate(user=host)
+
+        url = reverse("event-hosting-request-bulk-action")
+        data = {
+            "actions": [
+                {"id": pending_request.id, "action": "accept", "host_message": "OK"},
+                {"id": others[0].id, "action": "accept"},
+                {"id": others[1].id, "action": "accept"},
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert results[pending_request.id] == {"status": "ACCEPTED"}
+        assert results[others[0].id] == {"status": "ACCEPTED"}
+        assert results[others[1].id] == {
+            "error": "Vous n'avez plus de places disponibles."
+        }
+        hosting.refresh_from_db()
+        pending_request.refresh_from_db()
+        assert hosting.beds_taken == 2
+        assert pending_request.host_message == "OK"
+
+    def test_bulk_action_cancel_frees_bed(
+        self, api_client, requester, hosting, pending_request
+    ):
+        """Test que l'annulation groupée d'une demande acceptée libère le lit."""
+        assert pending_request.accept()
+        api_client.force_authenticate(user=requester)
+
+        url = reverse("event-hosting-request-bulk-action")
+        data = {
+            "actions": [
+                {"id": pending_request.id, "action": "accept"},
+                {"id": pending_request.id, "action": "cancel"},
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][pending_request.id] == {"status": "CANCELLED"}
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 0
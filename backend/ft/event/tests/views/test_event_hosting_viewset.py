@@ -203,9 +203,9 @@ class TestEventHostingViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == hosting.id
-        assert response.data[0]["host"]["id"] == host.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == hosting.id
+        assert response.data["results"][0]["host"]["id"] == host.id
 
     def test_for_event_action(self, api_client, host, event, hosting):
         """Test de l'action for_event pour récupérer les hébergements d'un événement."""
@@ -215,9 +215,9 @@ class TestEventHostingViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == hosting.id
-        assert response.data[0]["event"] == event.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == hosting.id
+        assert response.data["results"][0]["event"] == event.id
 
     def test_for_event_action_without_event_id(self, api_client, host):
         """Test de l'action for_event sans spécifier d'event_id."""
@@ -128,3 +128,146 @@ class TestEventViewSetExtended:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["answer"] == "YES"  # Valeur par défaut
         assert response.data["can_invite"] is True  # Valeur par défaut
+
+    def test_assign_carpools_requires_staff(self, api_client, event):
+        """Test que seul le staff peut lancer l'affectation des covoiturages."""
+        user = User.objects.create_user(
+            username="regular",
+            email="regular@example.com",
+            password="testpassword",
+            is_staff=False,
+        )
+        api_client.force_authenticate(user=user)
+
+        url = reverse("event-assign-carpools", kwargs={"pk": event.id})
+        response = api_client.post(url, {}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_assign_carpools_dry_run(self, admin_client, event):
+        """Test que le staff peut simuler l'affectation des covoiturages."""
+        url = reverse("event-assign-carpools", kwargs={"pk": event.id})
+        response = admin_client.post(url, {"dry_run": True}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["event"] == event.id
+        assert response.data["dry_run"] is True
+        assert response.data["assigned"] == []
+
+    def test_allocate_hostings_requires_staff(self, api_client, event):
+        """Test que seul le staff peut lancer l'attribution des hébergements."""
+        user = User.objects.create_user(
+            username="regular",
+            email="regular@example.com",
+            password="testpassword",
+            is_staff=False,
+        )
+        api_client.force_authenticate(user=user)
+
+        url = reverse("event-allocate-hostings", kwargs={"pk": event.id})
+        response = api_client.post(url, {}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_allocate_hostings(self, admin_client, event):
+        """Test que le staff peut lancer l'attribution des hébergements."""
+        url = reverse("event-allocate-hostings", kwargs={"pk": event.id})
+        response = admin_client.post(url, {"reject_unassigned": True}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["event"] == event.id
+        assert response.data["dry_run"] is False
+        assert response.data["accepted"] == []
+
+    def test_subscribe_batch_upserts_answers(self, api_client, user, event):
+        """Test que l'inscription groupée crée et met à jour les réponses."""
+        other_event = Event.objects.create(
+            name="Apéral",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=20),
+            end_date=timezone.now() + datetime.timedelta(days=20, hours=4),
+            type="DRINK",
+        )
+        EventSubscription.objects.create(
+            event=event, user=user, answer="MAYBE", can_invite=False
+        )
+        api_client.force_authenticate(user=user)
+
+        url = reverse("event-subscribe-batch")
+        data = {
+            "subscriptions": [
+                {"event": event.id, "answer": "NO"},
+                {"event": other_event.id, "answer": "YES", "can_invite": False},
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert results[event.id]["subscriptions_count"] == {
+            "YES": 0,
+            "NO": 1,
+            "MAYBE": 0,
+        }
+        assert results[other_event.id]["answer"] == "YES"
+        assert results[other_event.id]["subscriptions_count"]["YES"] == 1
+        assert EventSubscription.objects.filter(user=user).count() == 2
+        subscription = EventSubscription.objects.get(event=event, user=user)
+        assert subscription.answer == "NO"
+        assert subscription.can_invite is True
+
+    def test_subscribe_batch_rejects_inactive_events(
+        self, api_client, user, event, inactive_event
+    ):
+        """Test que l'inscription groupée refuse les événements inactifs."""
+        api_client.force_authenticate(user=user)
+
+        url = reverse("event-subscribe-batch")
+        data = {
+            "subscriptions": [
+                {"event": event.id},
+                {"event": inactive_event.id},
+            ]
+        }
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not EventSubscription.objects.filter(user=user).exists()
+
+    def test_subscribe_batch_requires_authentication(self, api_client, event):
+        """Test que l'inscription groupée nécessite d'être connecté."""
+        url = reverse("event-subscribe-batch")
+        response = api_client.post(
+            url, {"subscriptions": [{"event": event.id}]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_participants_staff(self, api_client, user, event):
+        """Test que le staff peut exporter les participants en CSV."""
+        EventSubscription.objects.create(event=event, user=user, answer="YES")
+        api_client.force_authenticate(user=user)
+
+        url = reverse("event-export", kwargs={"pk": event.id, "kind": "participants"})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert "attachment" in response["Content-Disposition"]
+        content = b"".join(response.streaming_content).decode()
+        assert "test@example.com" in content
+
+    def test_export_requires_staff(self, api_client, event):
+        """Test que l'export est réservé au staff."""
+        member = User.objects.create_user(
+            username="member",
+            email="member@example.com",
+            password="password123",
+            is_staff=False,
+        )
+        api_client.force_authenticate(user=member)
+
+        url = reverse("event-export", kwargs={"pk": event.id, "kind": "carpools"})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
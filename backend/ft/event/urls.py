@@ -7,6 +7,9 @@ from ft.event.views import (
     CarpoolTripViewSet,
     CarpoolRequestViewSet,
     CarpoolPaymentViewSet,
+    EventCalendarView,
+    UserEventCalendarView,
+    ChangeStreamView,
 )
 from rest_framework import routers
 
@@ -44,5 +47,12 @@ api_router.register(
 )
 
 urlpatterns = [
+    path("events.ics", EventCalendarView.as_view(), name="event-calendar"),
+    path(
+        "calendars/<str:token>.ics",
+        UserEventCalendarView.as_view(),
+        name="event-calendar-user",
+    ),
+    path("stream/", ChangeStreamView.as_view(), name="event-stream"),
     path("", include(api_router.urls)),
 ]
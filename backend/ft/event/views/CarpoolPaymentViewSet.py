@@ -1,10 +1,12 @@
 from rest_framework import viewsets, permissions, filters
 from django_filters.rest_framework import DjangoFilterBackend
+from ft.common.mixins import QueryOptimizedMixin
+from ft.common.query import VisibilityQuery
 from ft.event.models import CarpoolPayment
 from ft.event.serializers import CarpoolPaymentSerializer
 
 
-class CarpoolPaymentViewSet(viewsets.ModelViewSet):
+class CarpoolPaymentViewSet(QueryOptimizedMixin, viewsets.ModelViewSet):
     """
     API endpoint pour les paiements de covoiturage.
     """
@@ -15,6 +17,7 @@ class CarpoolPaymentViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ["request", "is_completed", "payment_method"]
     search_fields = ["notes"]
+    visibility = VisibilityQuery("passenger", "trip__driver", via="request")
 
     def get_queryset(self):
         """
@@ -22,10 +25,7 @@ class CarpoolPaymentViewSet(viewsets.ModelViewSet):
         - Conducteur: voit tous les paiements pour ses trajets
         - Passager: voit tous ses paiements
         """
-        user = self.request.user
-        return CarpoolPayment.objects.filter(
-            request__trip__driver=user
-        ) | CarpoolPayment.objects.filter(request__passenger=user)
+        return self.visibility.apply(CarpoolPayment.objects.all(), self.request.user)
 
     def perform_create(self, serializer):
         """
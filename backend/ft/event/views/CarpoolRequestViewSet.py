@@ -1,26 +1,48 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
-from ft.event.models import CarpoolRequest, CarpoolPayment
+from ft.common.mixins import (
+    ConditionalUpdateMixin,
+    PermissionAnnotationMixin,
+    QueryOptimizedMixin,
+)
+from ft.common.query import VisibilityQuery
+from ft.event.models import CarpoolRequest, CarpoolPayment, OutboxMessage
 from ft.event.serializers import (
     CarpoolRequestSerializer,
+    CarpoolRequestFlatSerializer,
     CarpoolRequestActionSerializer,
     CarpoolPaymentSerializer,
+    CarpoolRequestBulkActionSerializer,
 )
+from ft.event.services import CarpoolRequestBulkAction
+from ft.event.permissions import IsCarpoolRequestPassengerOrDriver
+from ft.event.idempotency import idempotent
 
 
-class CarpoolRequestViewSet(viewsets.ModelViewSet):
+class CarpoolRequestViewSet(
+    QueryOptimizedMixin,
+    PermissionAnnotationMixin,
+    ConditionalUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint for the carpool requests.
     """
 
     queryset = CarpoolRequest.objects.all()
     serializer_class = CarpoolRequestSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsCarpoolRequestPassengerOrDriver,
+    ]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ["trip", "passenger", "status", "is_active"]
     search_fields = ["message"]
+    visibility = VisibilityQuery("passenger", "trip__driver")
 
     def get_queryset(self):
         """
@@ -28,10 +50,66 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
         - Conducteur: voit toutes les demandes pour ses trajets
         - Passager: voit toutes ses demandes
         """
-        user = self.request.user
-        return CarpoolRequest.objects.filter(
-            trip__driver=user
-        ) | CarpoolRequest.objects.filter(passenger=user)
+        return self.visibility.apply(CarpoolRequest.objects.all(), self.request.user)
+
+    include_types = ("trips", "users", "events")
+
+    def get_include(self):
+        """
+        Parse the `?include=` query parameter. Returns None when absent, the
+        requested types otherwise (all of them for an empty value).
+        """
+        value = self.request.query_params.get("include")
+        if value is None:
+            return None
+
+        include = {item.strip() for item in value.split(",") if item.strip()}
+        unknown = include - set(self.include_types)
+        if unknown:
+            raise ValidationError(
+                {
+                    "include": f"Valeur(s) inconnue(s) : {', '.join(sorted(unknown))}. "
+                    f"Valeurs possibles : {', '.join(self.include_types)}."
+                }
+            )
+        return include or set(self.include_types)
+
+    def get_query_serializer_class(self):
+        if self.action == "list" and self.get_include() is not None:
+            return CarpoolRequestFlatSerializer
+        return super().get_query_serializer_class()
+
+    def list(self, request, *args, **kwargs):
+        """
+        List the requests. With `?include=trips,users,events`, return the
+        normalized shape instead: a flat `data` list where the trip and the
+        passenger are IDs, plus `included` maps where each related trip, user
+        and event is serialized once.
+        """
+        include = self.get_include()
+        if include is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        requests = list(page if page is not None else queryset)
+
+        serializer = CarpoolRequestFlatSerializer(
+            requests, many=True, context=self.get_serializer_context()
+        )
+        included = serializer.child.get_included(requests, include)
+
+        if page is None:
+            return Response({"data": serializer.data, "included": included})
+
+        response = self.get_paginated_response(serializer.data)
+        response.data["data"] = response.data.pop("results")
+        response.data["included"] = included
+        return response
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         """
@@ -40,6 +118,7 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
         serializer.save(passenger=self.request.user)
 
     @action(detail=True, methods=["post"])
+    @idempotent
     def request_action(self, request, pk=None):
         """
         Endpoint to perform an action on a request:
@@ -67,7 +146,13 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
             if response_message:
                 carpool_request.response_message = response_message
 
-            carpool_request.save()
+            with transaction.atomic():
+                carpool_request.save()
+                OutboxMessage.enqueue(
+                    "carpool_request_status",
+                    id=carpool_request.pk,
+                    status=carpool_request.status,
+                )
 
             return Response(
                 CarpoolRequestSerializer(carpool_request).data,
@@ -77,6 +162,7 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=["post"])
+    @idempotent
     def payment(self, request, pk=None):
         """
         Endpoint to create or update a payment for a carpool request.
@@ -84,7 +170,9 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
         """
         carpool_request = self.get_object()
 
-        if request.user != carpool_request.trip.driver:
+        if not IsCarpoolRequestPassengerOrDriver.resolve(
+            carpool_request, "is_driver", request.user
+        ):
             return Response(
                 {"detail": "Seul le conducteur peut enregistrer des paiements."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -123,3 +211,18 @@ class CarpoolRequestViewSet(viewsets.ModelViewSet):
             )
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=["post"], url_path="bulk-action")
+    def bulk_action(self, request):
+        """
+        Endpoint to perform accept / reject / cancel actions on many requests
+        at once. Capacity is checked once under lock and every change is
+        written with a single bulk update. Returns the result per request ID.
+        """
+        serializer = CarpoolRequestBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = CarpoolRequestBulkAction(request.user).run(
+            serializer.validated_data["actions"]
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
@@ -1,11 +1,14 @@
 from django.db.models import Q, Count, F
 from rest_framework import viewsets, permissions, filters
 from django_filters.rest_framework import DjangoFilterBackend
+from ft.common.mixins import ConditionalUpdateMixin, QueryOptimizedMixin
 from ft.event.models import CarpoolTrip
 from ft.event.serializers import CarpoolTripSerializer
 
 
-class CarpoolTripViewSet(viewsets.ModelViewSet):
+class CarpoolTripViewSet(
+    QueryOptimizedMixin, ConditionalUpdateMixin, viewsets.ModelViewSet
+):
     """
     API endpoint for the carpool trips.
     """
@@ -0,0 +1,67 @@
+import json
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from ft.event.services import ChangeFeed
+
+
+class ChangeStreamView(View):
+    """
+    Flux Server-Sent Events des changements qui concernent l'utilisateur
+    connecté (`/api/event/stream/`) : demandes de covoiturage et
+    d'hébergement, paiements et compteurs d'inscriptions des événements.
+
+    Chaque message porte le type de l'objet en `event` et un JSON compact
+    (`id`, `op`, statut...) en `data` ; le client recharge ce qui l'intéresse.
+    Un message `ready` est envoyé une fois l'écoute active, puis un
+    commentaire à chaque battement sans changement.
+    """
+
+    retry_ms = 3000
+
+    async def get(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse(
+                {"detail": "Informations d'authentification non fournies."},
+                status=403,
+            )
+
+        if isinstance(request, ASGIRequest):
+            content = self.async_events(user.pk)
+        else:
+            content = self.sync_events(user.pk)
+        response = StreamingHttpResponse(content, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def format(self, message):
+        if message is None:
+            return b": ping\n\n"
+        message = dict(message)
+        kind = message.pop("t")
+        data = json.dumps(message, separators=(",", ":"))
+        return f"event: {kind}\ndata: {data}\n\n".encode()
+
+    def ready(self):
+        return f"retry: {self.retry_ms}\nevent: ready\ndata: {{}}\n\n".encode()
+
+    async def async_events(self, user_id):
+        feed = ChangeFeed.subscribe(user_id)
+        try:
+            await anext(feed)
+            yield self.ready()
+            async for message in feed:
+                yield self.format(message)
+        finally:
+            await feed.aclose()
+
+    def sync_events(self, user_id):
+        events = ChangeFeed.listen(user_id)
+        next(events)
+        yield self.ready()
+        for message in events:
+            yield self.format(message)
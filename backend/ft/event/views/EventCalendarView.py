@@ -0,0 +1,50 @@
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views import View
+
+from ft.event.services import EventCalendar
+
+
+class EventCalendarView(View):
+    """
+    Flux iCalendar des événements publics (`/api/event/events.ics`).
+
+    Répond 304 quand l'ETag du client est à jour, sinon envoie le flux en
+    continu ou depuis le cache.
+    """
+
+    cache_control = {"public": True, "max_age": 300}
+
+    def get_calendar(self):
+        return EventCalendar.public()
+
+    def get(self, request, *args, **kwargs):
+        calendar = self.get_calendar()
+        etag = calendar.etag()
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = StreamingHttpResponse(
+                calendar.content(etag), content_type="text/calendar; charset=utf-8"
+            )
+            response["Content-Disposition"] = 'inline; filename="events.ics"'
+        response["ETag"] = etag
+        patch_cache_control(response, **self.cache_control)
+        return response
+
+
+class UserEventCalendarView(EventCalendarView):
+    """
+    Flux iCalendar des événements auxquels un utilisateur a répondu oui.
+    L'utilisateur est identifié par le jeton signé de l'URL, que les
+    applications de calendrier peuvent interroger sans session. Un jeton
+    révoqué (voir `calendar-feed/rotate`) renvoie 404.
+    """
+
+    cache_control = {"private": True, "max_age": 300}
+
+    def get_calendar(self):
+        user = EventCalendar.user_from_token(self.kwargs["token"])
+        if user is None:
+            raise Http404
+        return EventCalendar.for_user(user)
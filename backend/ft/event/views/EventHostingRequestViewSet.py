@@ -1,17 +1,30 @@
 from rest_framework import viewsets, permissions, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count
 
-from ft.event.models import EventHostingRequest, EventHosting
+from ft.common.mixins import (
+    PermissionAnnotationMixin,
+    QueryOptimizedMixin,
+    StreamingListMixin,
+)
+from ft.common.query import VisibilityQuery
+from ft.event.models import EventHostingRequest
 from ft.event.serializers import (
     EventHostingRequestSerializer,
     EventHostingRequestActionSerializer,
+    EventHostingRequestBulkActionSerializer,
 )
+from ft.event.services import HostingRequestBulkAction
 from ft.event.permissions import IsHostingRequestRequesterOrHost
+from ft.event.idempotency import idempotent
 
 
-class EventHostingRequestViewSet(viewsets.ModelViewSet):
+class EventHostingRequestViewSet(
+    QueryOptimizedMixin,
+    PermissionAnnotationMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint to manage the hosting requests.
     """
@@ -22,6 +35,7 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
     search_fields = ["requester__first_name", "requester__last_name", "status"]
     ordering_fields = ["created_at", "status"]
     ordering = ["-created_at"]
+    visibility = VisibilityQuery("requester", "hosting__host")
 
     def get_queryset(self):
         """
@@ -31,13 +45,12 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         queryset = EventHostingRequest.objects.all()
+        if self.action in ("accept", "reject", "cancel"):
+            # La réponse sérialise l'hébergement, l'hôte et le demandeur.
+            queryset = queryset.select_related("hosting__host", "requester")
 
         if not user.is_staff:
-            user_requests = queryset.filter(requester=user)
-
-            host_requests = queryset.filter(hosting__host=user)
-
-            queryset = user_requests | host_requests
+            queryset = self.visibility.apply(queryset, user)
 
         status = self.request.query_params.get("status", None)
         if status:
@@ -59,17 +72,8 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
         """
         serializer.save(requester=self.request.user)
 
-    def get_places_available(self, hosting):
-        """
-        Calculate the number of places still available for a hosting.
-        """
-        accepted_requests_count = EventHostingRequest.objects.filter(
-            hosting=hosting, status=EventHostingRequest.Status.ACCEPTED
-        ).count()
-
-        return hosting.available_beds - accepted_requests_count
-
     @action(detail=True, methods=["post"])
+    @idempotent
     def accept(self, request, pk=None):
         """
         Action to accept a hosting request.
@@ -77,7 +81,9 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
         """
         hosting_request = self.get_object()
 
-        if hosting_request.hosting.host != request.user:
+        if not IsHostingRequestRequesterOrHost.resolve(
+            hosting_request, "is_host", request.user
+        ):
             return Response(
                 {"error": "Vous n'êtes pas autorisé à accepter cette demande."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -89,8 +95,7 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        places_available = self.get_places_available(hosting_request.hosting)
-        if places_available <= 0:
+        if hosting_request.hosting.places_available <= 0:
             return Response(
                 {"error": "Vous n'avez plus de places disponibles."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -101,13 +106,18 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
             if "host_message" in serializer.validated_data:
                 hosting_request.host_message = serializer.validated_data["host_message"]
 
-            hosting_request.accept()
+            if not hosting_request.accept():
+                return Response(
+                    {"error": "Vous n'avez plus de places disponibles."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             response_serializer = self.get_serializer(hosting_request)
             return Response(response_serializer.data)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=["post"])
+    @idempotent
     def reject(self, request, pk=None):
         """
         Action to reject a hosting request.
@@ -115,7 +125,9 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
         """
         hosting_request = self.get_object()
 
-        if hosting_request.hosting.host != request.user:
+        if not IsHostingRequestRequesterOrHost.resolve(
+            hosting_request, "is_host", request.user
+        ):
             return Response(
                 {"error": "Vous n'êtes pas autorisé à refuser cette demande."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -132,13 +144,18 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
             if "host_message" in serializer.validated_data:
                 hosting_request.host_message = serializer.validated_data["host_message"]
 
-            hosting_request.reject()
+            if not hosting_request.reject():
+                return Response(
+                    {"error": "Cette demande ne peut plus être refusée."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             response_serializer = self.get_serializer(hosting_request)
             return Response(response_serializer.data)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=["post"])
+    @idempotent
     def cancel(self, request, pk=None):
         """
         Action to cancel a hosting request.
@@ -146,7 +163,9 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
         """
         hosting_request = self.get_object()
 
-        if hosting_request.requester != request.user:
+        if not IsHostingRequestRequesterOrHost.resolve(
+            hosting_request, "is_requester", request.user
+        ):
             return Response(
                 {"error": "Vous n'êtes pas autorisé à annuler cette demande."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -161,24 +180,43 @@ class EventHostingRequestViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        hosting_request.cancel()
+        if not hosting_request.cancel():
+            return Response(
+                {"error": "Cette demande ne peut plus être annulée."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         serializer = self.get_serializer(hosting_request)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def my_requests(self, request):
         """
-        Return only the requests made by the connected user.
+        Return only the requests made by the connected user, paginated like
+        the main list (or streamed with `?stream=ndjson`).
         """
-        requests = EventHostingRequest.objects.filter(requester=request.user)
-        serializer = self.get_serializer(requests, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.get_queryset().filter(requester=request.user))
 
     @action(detail=False, methods=["get"])
     def for_my_hostings(self, request):
         """
-        Return only the requests for the hostings of the connected user.
+        Return only the requests for the hostings of the connected user,
+        paginated like the main list (or streamed with `?stream=ndjson`).
         """
-        requests = EventHostingRequest.objects.filter(hosting__host=request.user)
-        serializer = self.get_serializer(requests, many=True)
-        return Response(serializer.data)
+        return self.list_response(
+            self.get_queryset().filter(hosting__host=request.user)
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-action")
+    def bulk_action(self, request):
+        """
+        Action to accept, reject or cancel many hosting requests at once.
+        Beds are checked once under lock and every change is written with a
+        single bulk update. Returns the result per request ID.
+        """
+        serializer = EventHostingRequestBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = HostingRequestBulkAction(request.user).run(
+            serializer.validated_data["actions"]
+        )
+        return Response({"results": results})
@@ -2,12 +2,24 @@ from rest_framework import viewsets, permissions, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from ft.event.models import EventHosting, Event, EventHostingRequest
+from ft.common.mixins import (
+    ConditionalUpdateMixin,
+    PermissionAnnotationMixin,
+    QueryOptimizedMixin,
+    StreamingListMixin,
+)
+from ft.event.models import EventHosting, Event
 from ft.event.serializers import EventHostingSerializer
 from ft.event.permissions import IsHostingOwnerOrReadOnly
 
 
-class EventHostingViewSet(viewsets.ModelViewSet):
+class EventHostingViewSet(
+    QueryOptimizedMixin,
+    PermissionAnnotationMixin,
+    StreamingListMixin,
+    ConditionalUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint to view or modify the hostings.
     """
@@ -50,29 +62,28 @@ class EventHostingViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def me(self, request):
         """
-        Return only the hostings proposed by the connected user.
+        Return only the hostings proposed by the connected user, paginated
+        like the main list (or streamed with `?stream=ndjson`).
         """
-        hostings = EventHosting.objects.filter(host=request.user)
-        serializer = self.get_serializer(hostings, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.get_queryset().filter(host=request.user))
 
     @action(detail=False, methods=["get"])
     def for_event(self, request):
         """
-        Return only the hostings proposed for a specific event.
+        Return only the active hostings proposed for a specific event,
+        paginated like the main list (or streamed with `?stream=ndjson`).
         """
         event_id = request.query_params.get("event_id", None)
         if not event_id:
             return Response({"error": "Paramètre event_id requis."}, status=400)
 
-        try:
-            event = Event.objects.get(pk=event_id)
-            hostings = EventHosting.objects.filter(event=event, is_active=True)
-            serializer = self.get_serializer(hostings, many=True)
-            return Response(serializer.data)
-        except Event.DoesNotExist:
+        if not Event.objects.filter(pk=event_id).exists():
             return Response({"error": "Événement non trouvé."}, status=404)
 
+        return self.list_response(
+            self.get_queryset().filter(event=event_id, is_active=True)
+        )
+
     @action(detail=True, methods=["get"])
     def available_places(self, request, pk=None):
         """
@@ -80,16 +91,10 @@ class EventHostingViewSet(viewsets.ModelViewSet):
         """
         hosting = self.get_object()
 
-        accepted_requests_count = EventHostingRequest.objects.filter(
-            hosting=hosting, status="ACCEPTED"
-        ).count()
-
-        available_places = hosting.available_beds - accepted_requests_count
-
         return Response(
             {
                 "total_beds": hosting.available_beds,
-                "accepted_guests": accepted_requests_count,
-                "available_places": available_places,
+                "accepted_guests": hosting.beds_taken,
+                "available_places": hosting.places_available,
             }
         )
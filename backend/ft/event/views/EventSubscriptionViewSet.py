@@ -1,10 +1,11 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from ft.common.mixins import QueryOptimizedMixin
 from ft.event.models import EventSubscription
 from ft.event.serializers import EventSubscriptionSerializer
 
 
-class EventSubscriptionViewSet(viewsets.ModelViewSet):
+class EventSubscriptionViewSet(QueryOptimizedMixin, viewsets.ModelViewSet):
     queryset = EventSubscription.objects.all()
     serializer_class = EventSubscriptionSerializer
     permission_classes = [IsAuthenticated]
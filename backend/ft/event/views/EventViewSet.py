@@ -1,17 +1,31 @@
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.text import slugify
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from ft.event.models import Event
+from ft.common.mixins import QueryOptimizedMixin
+from ft.event.models import Event, EventSubscription
 from ft.event.serializers import (
     EventSerializer,
     EventSubscribeActionSerializer,
+    EventSubscribeBatchSerializer,
     EventSubscriptionSerializer,
+    AllocationActionSerializer,
+    HostingAllocationActionSerializer,
 )
 from ft.event.permissions import IsStaffOrReadOnly
-from rest_framework.permissions import IsAuthenticated
+from ft.event.idempotency import idempotent
+from ft.event.services import (
+    CarpoolAssignment,
+    EventCalendar,
+    EventExport,
+    HostingAllocation,
+)
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(QueryOptimizedMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [IsStaffOrReadOnly]
@@ -19,6 +33,12 @@ class EventViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == "subscribe":
             return EventSubscribeActionSerializer
+        if self.action == "subscribe_batch":
+            return EventSubscribeBatchSerializer
+        if self.action == "assign_carpools":
+            return AllocationActionSerializer
+        if self.action == "allocate_hostings":
+            return HostingAllocationActionSerializer
         return EventSerializer
 
     def get_queryset(self):
@@ -30,11 +50,11 @@ class EventViewSet(viewsets.ModelViewSet):
         url_path="subscribe",
         permission_classes=[IsAuthenticated],
     )
+    @idempotent
     def subscribe(self, request, *args, **kwargs):
         event = self.get_object()
-        from ft.event.models import EventSubscription
 
-        subscription = EventSubscription.objects.update_or_create(
+        subscription, _ = EventSubscription.objects.update_or_create(
             event=event,
             user=request.user,
             defaults={
@@ -45,3 +65,148 @@ class EventViewSet(viewsets.ModelViewSet):
         )
         serializer = EventSubscriptionSerializer(subscription)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="subscribe-batch",
+        permission_classes=[IsAuthenticated],
+    )
+    def subscribe_batch(self, request, *args, **kwargs):
+        """
+        Enregistre en une requête les réponses de l'utilisateur à plusieurs
+        événements (INSERT ... ON CONFLICT DO UPDATE) et renvoie les compteurs
+        d'inscriptions à jour de chaque événement.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["subscriptions"]
+
+        EventSubscription.objects.bulk_create(
+            [
+                EventSubscription(
+                    event_id=item["event"],
+                    user=request.user,
+                    answer=item["answer"],
+                    can_invite=item["can_invite"],
+                    is_active=True,
+                )
+                for item in items
+            ],
+            update_conflicts=True,
+            unique_fields=["event", "user"],
+            update_fields=["answer", "can_invite", "is_active", "updated_at"],
+        )
+
+        results = {
+            item["event"]: {
+                "answer": item["answer"],
+                "can_invite": item["can_invite"],
+                "subscriptions_count": {"YES": 0, "NO": 0, "MAYBE": 0},
+            }
+            for item in items
+        }
+        counts = (
+            EventSubscription.objects.filter(event__in=results, is_active=True)
+            .order_by()
+            .values("event", "answer")
+            .annotate(count=Count("pk"))
+        )
+        for row in counts:
+            results[row["event"]]["subscriptions_count"][row["answer"]] = row["count"]
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="calendar-feed",
+        permission_classes=[IsAuthenticated],
+    )
+    def calendar_feed(self, request, *args, **kwargs):
+        """
+        Renvoie l'URL du flux iCalendar personnel de l'utilisateur, à ajouter
+        dans son application de calendrier.
+        """
+        url = reverse(
+            "event-calendar-user",
+            kwargs={"token": EventCalendar.user_token(request.user)},
+        )
+        return Response(
+            {"url": request.build_absolute_uri(url)}, status=status.HTTP_200_OK
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="calendar-feed/rotate",
+        url_name="calendar-feed-rotate",
+        permission_classes=[IsAuthenticated],
+    )
+    def rotate_calendar_feed(self, request, *args, **kwargs):
+        """
+        Révoque l'URL actuelle du flux iCalendar de l'utilisateur et renvoie
+        la nouvelle, par exemple après une fuite de l'ancienne.
+        """
+        url = reverse(
+            "event-calendar-user",
+            kwargs={"token": EventCalendar.rotate_user_token(request.user)},
+        )
+        return Response(
+            {"url": request.build_absolute_uri(url)}, status=status.HTTP_200_OK
+        )
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="assign-carpools",
+        permission_classes=[IsAdminUser],
+    )
+    def assign_carpools(self, request, *args, **kwargs):
+        """
+        Répartit automatiquement les demandes de covoiturage en attente de
+        l'événement sur ses trajets (staff uniquement).
+        """
+        event = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = CarpoolAssignment(event).run(
+            dry_run=serializer.validated_data["dry_run"]
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="allocate-hostings",
+        permission_classes=[IsAdminUser],
+    )
+    def allocate_hostings(self, request, *args, **kwargs):
+        """
+        Attribue automatiquement les lits des hébergements de l'événement aux
+        demandes d'hébergement en attente (staff uniquement).
+        """
+        event = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = HostingAllocation(event).run(
+            dry_run=serializer.validated_data["dry_run"],
+            reject_unassigned=serializer.validated_data["reject_unassigned"],
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"export/(?P<kind>participants|hostings|carpools)",
+        permission_classes=[IsAdminUser],
+    )
+    def export(self, request, kind, *args, **kwargs):
+        """
+        Exporte en CSV les participants, les hébergements ou les covoiturages
+        de l'événement (staff uniquement). Le fichier est envoyé en flux.
+        """
+        event = self.get_object()
+        return EventExport([event.pk]).response(kind, f"{slugify(event.name)}-{kind}")
@@ -8,6 +8,8 @@ from .EventHostingRequestViewSet import EventHostingRequestViewSet
 from .CarpoolTripViewSet import CarpoolTripViewSet
 from .CarpoolRequestViewSet import CarpoolRequestViewSet
 from .CarpoolPaymentViewSet import CarpoolPaymentViewSet
+from .EventCalendarView import EventCalendarView, UserEventCalendarView
+from .ChangeStreamView import ChangeStreamView
 
 __all__ = [
     "EventViewSet",
@@ -17,4 +19,7 @@ __all__ = [
     "CarpoolTripViewSet",
     "CarpoolRequestViewSet",
     "CarpoolPaymentViewSet",
+    "EventCalendarView",
+    "UserEventCalendarView",
+    "ChangeStreamView",
 ]
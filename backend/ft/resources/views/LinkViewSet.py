@@ -1,10 +1,11 @@
 from rest_framework import viewsets
+from ft.common.mixins import QueryOptimizedMixin
 from ft.resources.models import Link
 from ft.resources.serializers import LinkSerializer
 from ft.event.permissions import IsStaffOrReadOnly
 
 
-class LinkViewSet(viewsets.ModelViewSet):
+class LinkViewSet(QueryOptimizedMixin, viewsets.ModelViewSet):
     queryset = Link.objects.all()
     serializer_class = LinkSerializer
     permission_classes = [IsStaffOrReadOnly]
@@ -18,6 +18,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_extensions",
     "corsheaders",
     "rest_framework",
@@ -26,6 +27,7 @@ INSTALLED_APPS = [
     "ft.user",
     "ft.resources",
     "ft.event",
+    "ft.diagnostics",
     "allauth.account",
     "allauth.headless",
     "allauth.usersessions",
@@ -35,14 +37,18 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "ft.common.middleware.CompressionMiddleware",
+    "ft.diagnostics.middleware.MemoryTrackingMiddleware",
+    "ft.diagnostics.middleware.SlowQueryMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # CORS middleware
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "ft.diagnostics.middleware.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
     "allauth.account.middleware.AccountMiddleware",
 ]
 
@@ -113,7 +119,64 @@ STATIC_URL = "/api/static/"
 
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# WhiteNoise génère à la collecte des variantes .gz et .br (si brotli est
+# installé) de chaque fichier statique et les sert selon Accept-Encoding.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Compression des réponses dynamiques (ft.common.middleware)
+COMPRESSION_MIN_SIZE = int(os.getenv("FT_COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("FT_COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Plans de chargement déduits des serializers (ft.common.query) : un champ
+# calculé sans déclaration est une erreur en mode strict.
+QUERY_PLAN_STRICT = DEBUG
+
+# Plan des filtres de visibilité (ft.common.query.VisibilityQuery), choisi
+# avec la commande benchmark_visibility : "union" ou "exists".
+VISIBILITY_STRATEGY = os.getenv("FT_VISIBILITY_STRATEGY", "union")
+
+# Durée de conservation (secondes) des réponses rejouées pour l'en-tête
+# Idempotency-Key (ft.event.idempotency).
+IDEMPOTENCY_KEY_TTL = int(os.getenv("FT_IDEMPOTENCY_KEY_TTL", str(24 * 3600)))
+
+# Flux Server-Sent Events des changements (ft.event.services.ChangeFeed) :
+# battement (secondes), taille de la file par abonné et, sous WSGI, durée
+# d'un flux avant reconnexion du navigateur.
+CHANGE_FEED_HEARTBEAT = float(os.getenv("FT_CHANGE_FEED_HEARTBEAT", "15"))
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("FT_CHANGE_FEED_QUEUE_SIZE", "100"))
+CHANGE_FEED_WSGI_DURATION = float(os.getenv("FT_CHANGE_FEED_WSGI_DURATION", "25"))
+
+# Outbox des effets de bord (ft.event.services.OutboxWorker) : taille des
+# lots, tentatives, délais de reprise et rétention des messages envoyés
+# (secondes), attente entre deux lots vides.
+OUTBOX_BATCH_SIZE = int(os.getenv("FT_OUTBOX_BATCH_SIZE", "20"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("FT_OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_RETRY_BASE = float(os.getenv("FT_OUTBOX_RETRY_BASE", "30"))
+OUTBOX_RETRY_MAX = float(os.getenv("FT_OUTBOX_RETRY_MAX", "3600"))
+OUTBOX_RETENTION = int(os.getenv("FT_OUTBOX_RETENTION", str(7 * 24 * 3600)))
+OUTBOX_POLL_INTERVAL = float(os.getenv("FT_OUTBOX_POLL_INTERVAL", "1"))
+
+# Journal des requêtes SQL lentes (ft.diagnostics)
+SLOW_QUERY_LOG = os.getenv("FT_SLOW_QUERY_LOG", "False") == "True"
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("FT_SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("FT_SLOW_QUERY_EXPLAIN_RATE", "0.1"))
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("FT_SLOW_QUERY_BUFFER_SIZE", "200"))
+
+# Profilage à la demande des requêtes du staff (ft.diagnostics)
+PROFILING_ENABLED = os.getenv("FT_PROFILING_ENABLED", "False") == "True"
+PROFILING_INTERVAL_MS = float(os.getenv("FT_PROFILING_INTERVAL_MS", "5"))
+PROFILING_TTL = int(os.getenv("FT_PROFILING_TTL", "3600"))
+
+# Suivi mémoire des workers (ft.diagnostics)
+MEMORY_TRACKING = os.getenv("FT_MEMORY_TRACKING", "False") == "True"
+MEMORY_TRACKING_FRAMES = int(os.getenv("FT_MEMORY_TRACKING_FRAMES", "1"))
 
 MEDIA_URL = "/api/media/"
 
@@ -135,6 +198,20 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 50,
+    "DEFAULT_RENDERER_CLASSES": [
+        "ft.common.renderers.ORJSONRenderer",
+        "ft.common.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "ft.common.parsers.ORJSONParser",
+        "ft.common.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "profiling": os.getenv("FT_PROFILING_RATE", "20/hour"),
+    },
 }
 
 AUTHENTICATION_BACKENDS = [
@@ -0,0 +1,104 @@
+import gzip
+
+import brotli
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from ft.common.middleware import CompressionMiddleware
+
+
+@pytest.fixture
+def compression_settings(settings):
+    settings.COMPRESSION_MIN_SIZE = 1024
+    settings.COMPRESSION_BROTLI_QUALITY = 4
+
+
+@pytest.mark.usefixtures("compression_settings")
+class TestCompressionMiddleware:
+    """Tests pour le middleware CompressionMiddleware."""
+
+    body = b'{"results": [' + b",".join([b'{"city": "Compi\xc3\xa8gne"}'] * 200) + b"]}"
+
+    def process(self, response, accept_encoding="gzip, deflate, br"):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_brotli_preferred(self):
+        """Test que brotli est utilisé quand le client l'accepte."""
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json")
+        )
+
+        assert response["Content-Encoding"] == "br"
+        assert response["Vary"] == "Accept-Encoding"
+        assert brotli.decompress(response.content) == self.body
+        assert int(response["Content-Length"]) == len(response.content)
+
+    def test_gzip_fallback(self):
+        """Test que gzip est utilisé quand brotli n'est pas accepté."""
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json"),
+            accept_encoding="gzip",
+        )
+
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content) == self.body
+
+    def test_html_stays_gzip(self):
+        """Test que le HTML reste en gzip, avec le bourrage anti-BREACH."""
+        body = b"<html>" + b"<p>Compi\xc3\xa8gne</p>" * 200 + b"</html>"
+        sizes = set()
+        for _ in range(5):
+            response = self.process(
+                HttpResponse(body, content_type="text/html; charset=utf-8")
+            )
+            assert response["Content-Encoding"] == "gzip"
+            assert gzip.decompress(response.content) == body
+            sizes.add(len(response.content))
+
+        assert len(sizes) > 1
+
+    def test_small_response_not_compressed(self):
+        """Test qu'une petite réponse n'est pas compressée."""
+        response = self.process(
+            HttpResponse(b'{"version": "1.0"}', content_type="application/json")
+        )
+
+        assert not response.has_header("Content-Encoding")
+
+    def test_binary_content_not_compressed(self):
+        """Test qu'un contenu non textuel n'est pas compressé."""
+        response = self.process(HttpResponse(self.body, content_type="image/png"))
+
+        assert not response.has_header("Content-Encoding")
+
+    def test_event_stream_not_compressed(self):
+        """Test qu'un flux Server-Sent Events n'est jamais compressé."""
+        response = self.process(
+            StreamingHttpResponse(
+                iter([b"data: 1\n\n"]), content_type="text/event-stream"
+            )
+        )
+
+        assert not response.has_header("Content-Encoding")
+
+    def test_streaming_brotli(self):
+        """Test de la compression brotli d'une réponse en flux."""
+        chunks = [b"id;ville\n"] + [b"1;Compi\xc3\xa8gne\n"] * 500
+        response = self.process(
+            StreamingHttpResponse(iter(chunks), content_type="text/csv")
+        )
+
+        assert response["Content-Encoding"] == "br"
+        content = b"".join(response.streaming_content)
+        assert brotli.decompress(content) == b"".join(chunks)
+
+    def test_strong_etag_weakened(self):
+        """Test qu'un ETag fort devient faible une fois compressé."""
+        response = HttpResponse(self.body, content_type="application/json")
+        response["ETag"] = '"abc"'
+
+        response = self.process(response)
+
+        assert response["ETag"] == 'W/"abc"'
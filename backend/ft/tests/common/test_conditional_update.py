@@ -0,0 +1,202 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ft.common.models import VersionedModel
+from ft.event.models import (
+    CarpoolTrip,
+    Event,
+    EventHosting,
+    EventHostingRequest,
+)
+from ft.event.serializers import CarpoolTripSerializer
+from ft.user.models import User
+
+
+@pytest.fixture
+def event(db):
+    return Event.objects.create(
+        name="Congrès",
+        location="Compiègne",
+        start_date=timezone.now() + datetime.timedelta(days=10),
+        end_date=timezone.now() + datetime.timedelta(days=12),
+        type="CONGRESS",
+    )
+
+
+@pytest.fixture
+def driver(db):
+    return User.objects.create_user(
+        username="driver", email="driver@example.com", password="password123"
+    )
+
+
+@pytest.fixture
+def trip(event, driver):
+    return CarpoolTrip.objects.create(
+        event=event,
+        driver=driver,
+        departure_city="Paris",
+        arrival_city="Compiègne",
+        departure_datetime=timezone.now() + datetime.timedelta(days=9),
+        seats_total=3,
+        price_per_seat=Decimal("10.00"),
+    )
+
+
+@pytest.mark.django_db
+class TestVersionedModel:
+    """Tests pour le verrouillage optimiste des modèles versionnés."""
+
+    def test_save_increments_version(self, trip):
+        """Test que chaque modification incrémente la version."""
+        trip.seats_total = 4
+        trip.save()
+
+        trip.refresh_from_db()
+        assert trip.version == 2
+        assert trip.seats_total == 4
+
+    def test_stale_instance_is_rejected(self, trip):
+        """Test qu'une instance lue avant une modification est refusée."""
+        stale = CarpoolTrip.objects.get(pk=trip.pk)
+        trip.seats_total = 4
+        trip.save()
+
+        stale.seats_total = 2
+        with pytest.raises(VersionedModel.VersionConflict):
+            stale.save()
+
+        assert stale.version == 1
+        trip.refresh_from_db()
+        assert trip.seats_total == 4
+        assert trip.version == 2
+
+    def test_bed_counter_bumps_hosting_version(self, event, driver):
+        """Test qu'une acceptation change la version de l'hébergement."""
+        hosting = EventHosting.objects.create(
+            event=event, host=driver, available_beds=2
+        )
+        requester = User.objects.create_user(
+            username="guest", email="guest@example.com", password="password123"
+        )
+        EventHostingRequest.objects.create(
+            hosting=hosting, requester=requester
+        ).accept()
+
+        hosting.refresh_from_db()
+        assert hosting.beds_taken == 1
+        assert hosting.version == 2
+
+
+@pytest.mark.django_db
+class TestConditionalUpdateMixin:
+    """Tests pour les en-têtes ETag et If-Match des viewsets versionnés."""
+
+    def url(self, trip):
+        return reverse("carpool-trip-detail", kwargs={"pk": trip.id})
+
+    def test_retrieve_returns_etag(self, api_client, driver, trip):
+        """Test que la lecture d'un objet renvoie sa version en ETag."""
+        api_client.force_authenticate(user=driver)
+
+        response = api_client.get(self.url(trip))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == '"1"'
+        assert response.data["version"] == 1
+
+    def test_update_with_matching_if_match(self, api_client, driver, trip):
+        """Test qu'une modification avec la bonne version est appliquée."""
+        api_client.force_authenticate(user=driver)
+
+        response = api_client.patch(
+            self.url(trip), {"seats_total": 4}, format="json", HTTP_IF_MATCH='"1"'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == '"2"'
+        trip.refresh_from_db()
+        assert trip.seats_total == 4
+
+    def test_update_with_stale_if_match(self, api_client, driver, trip):
+        """Test qu'une version dépassée renvoie 412 sans rien écrire."""
+        api_client.force_authenticate(user=driver)
+        trip.additional_info = "Pause à mi-chemin"
+        trip.save()
+
+        response = api_client.patch(
+            self.url(trip), {"seats_total": 4}, format="json", HTTP_IF_MATCH='"1"'
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        trip.refresh_from_db()
+        assert trip.seats_total == 3
+        assert trip.version == 2
+
+    def test_update_with_wildcard_or_without_if_match(self, api_client, driver, trip):
+        """Test que `*` ou l'absence d'If-Match laisse passer la modification."""
+        api_client.force_authenticate(user=driver)
+
+        first = api_client.patch(
+            self.url(trip), {"seats_total": 4}, format="json", HTTP_IF_MATCH="*"
+        )
+        second = api_client.patch(self.url(trip), {"seats_total": 2}, format="json")
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        trip.refresh_from_db()
+        assert trip.seats_total == 2
+        assert trip.version == 3
+
+    def test_weak_etag_from_compression(self, api_client, driver, trip, settings):
+        """
+        Test que l'ETag affaibli par la compression est accepté en If-Match,
+        de bout en bout à travers le middleware.
+        """
+        settings.COMPRESSION_MIN_SIZE = 64
+        api_client.force_authenticate(user=driver)
+
+        read = api_client.get(self.url(trip), HTTP_ACCEPT_ENCODING="br")
+        assert read["Content-Encoding"] == "br"
+        assert read["ETag"] == 'W/"1"'
+
+        response = api_client.patch(
+            self.url(trip),
+            {"seats_total": 4},
+            format="json",
+            HTTP_ACCEPT_ENCODING="br",
+            HTTP_IF_MATCH=read["ETag"],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == 'W/"2"'
+        stale = api_client.patch(
+            self.url(trip),
+            {"seats_total": 2},
+            format="json",
+            HTTP_IF_MATCH=read["ETag"],
+        )
+        assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    def test_concurrent_write_during_update(
+        self, api_client, driver, trip, monkeypatch
+    ):
+        """Test qu'une écriture concurrente pendant la requête renvoie 412."""
+        api_client.force_authenticate(user=driver)
+        original = CarpoolTripSerializer.update
+
+        def update(serializer, instance, validated_data):
+            CarpoolTrip.objects.filter(pk=instance.pk).update(version=5)
+            return original(serializer, instance, validated_data)
+
+        monkeypatch.setattr(CarpoolTripSerializer, "update", update)
+
+        response = api_client.patch(self.url(trip), {"seats_total": 4}, format="json")
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        trip.refresh_from_db()
+        assert trip.seats_total == 3
@@ -0,0 +1,93 @@
+import datetime
+import io
+import json
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from ft.common.parsers import MessagePackParser
+from ft.common.renderers import MessagePackRenderer
+from ft.event.models import Event
+
+
+class TestMessagePackRenderer:
+    """Tests pour le renderer MessagePackRenderer."""
+
+    def test_same_values_as_json(self):
+        """Test que msgpack transporte les mêmes valeurs que le JSON."""
+        data = {
+            "price_per_seat": Decimal("7.50"),
+            "departure": timezone.localtime(
+                datetime.datetime(2025, 7, 14, 7, 30, tzinfo=datetime.timezone.utc)
+            ),
+            "counts": {1: {"YES": 2}},
+            "results": [{"id": 1, "city": "Compiègne"}],
+        }
+
+        packed = MessagePackRenderer().render(data)
+        expected = json.loads(JSONRenderer().render(data))
+        expected["counts"] = {1: {"YES": 2}}
+
+        assert msgpack.unpackb(packed, strict_map_key=False) == expected
+
+    def test_parse_round_trip(self):
+        """Test qu'un corps msgpack est relu à l'identique."""
+        data = {"subscriptions": [{"event": 1, "answer": "YES"}]}
+        stream = io.BytesIO(msgpack.packb(data))
+
+        assert MessagePackParser().parse(stream) == data
+
+    def test_parse_error(self):
+        """Test qu'un corps invalide lève une ParseError."""
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+
+@pytest.mark.django_db
+class TestMessagePackNegotiation:
+    """Tests pour la négociation du format msgpack."""
+
+    @pytest.fixture
+    def event(self):
+        return Event.objects.create(
+            name="Congrès",
+            location="Compiègne",
+            start_date=timezone.now() + datetime.timedelta(days=10),
+            end_date=timezone.now() + datetime.timedelta(days=12),
+            type="CONGRESS",
+        )
+
+    def test_accept_header(self, api_client, event):
+        """Test que l'en-tête Accept sélectionne msgpack."""
+        response = api_client.get(
+            "/api/event/events/", HTTP_ACCEPT="application/msgpack"
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/msgpack"
+        payload = msgpack.unpackb(response.content)
+        assert payload["results"][0]["name"] == "Congrès"
+
+    def test_format_query_parameter(self, api_client, event):
+        """Test que ?format=msgpack sélectionne msgpack."""
+        response = api_client.get("/api/event/events/?format=msgpack")
+
+        assert response["Content-Type"] == "application/msgpack"
+
+    def test_write_endpoint(self, api_client, user, event):
+        """Test qu'un endpoint d'écriture accepte un corps msgpack."""
+        api_client.force_authenticate(user=user)
+        response = api_client.post(
+            "/api/event/events/subscribe-batch/",
+            msgpack.packb({"subscriptions": [{"event": event.id, "answer": "NO"}]}),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        assert response.status_code == 200
+        payload = msgpack.unpackb(response.content, strict_map_key=False)
+        assert payload["results"][event.id]["subscriptions_count"]["NO"] == 1
@@ -0,0 +1,89 @@
+import datetime
+import io
+import zoneinfo
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from ft.common.parsers import ORJSONParser
+from ft.common.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Tests pour le renderer ORJSONRenderer."""
+
+    def test_renders_like_json_renderer(self):
+        """Test que le rendu est identique à celui de JSONRenderer."""
+        paris = zoneinfo.ZoneInfo("Europe/Paris")
+        data = {
+            "price_per_seat": Decimal("7.50"),
+            "departure": datetime.datetime(2025, 7, 14, 9, 30, 15, 123456, paris),
+            "created_at": datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+            "date": datetime.date(2025, 7, 14),
+            "label": gettext_lazy("Trajet retour"),
+            "message": "Départ à 9h gare",
+            "counts": {1: {"YES": 2}},
+            "results": [{"id": 1, "city": "Compiègne"}],
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_render_uses_json_renderer(self):
+        """Test que le rendu indenté de l'API navigable est conservé."""
+        data = {"id": 1, "amount": Decimal("12.00")}
+
+        rendered = ORJSONRenderer().render(
+            data, "application/json; indent=4", {"indent": 4}
+        )
+
+        assert rendered == JSONRenderer().render(
+            data, "application/json; indent=4", {"indent": 4}
+        )
+
+    def test_render_none(self):
+        """Test qu'une réponse vide est rendue en corps vide."""
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    """Tests pour le parser ORJSONParser."""
+
+    def test_parse(self):
+        """Test de lecture d'un corps JSON."""
+        stream = io.BytesIO('{"city": "Compiègne", "seats": 2}'.encode())
+
+        assert ORJSONParser().parse(stream) == {"city": "Compiègne", "seats": 2}
+
+    def test_parse_error(self):
+        """Test qu'un JSON invalide lève une ParseError."""
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"city": '))
+
+
+@pytest.mark.django_db
+class TestORJSONRendererSettings:
+    """Tests pour la configuration des renderers de l'API."""
+
+    def test_api_uses_orjson(self, api_client):
+        """Test que l'API répond en JSON et garde l'API navigable."""
+        response = api_client.get("/api/version/", HTTP_ACCEPT="application/json")
+        assert isinstance(response.accepted_renderer, ORJSONRenderer)
+
+        response = api_client.get("/api/version/", HTTP_ACCEPT="text/html")
+        assert response.status_code == 200
+        assert b"version" in response.content
+
+    def test_api_parses_json_body(self, api_client, user):
+        """Test qu'un corps JSON est lu par le parser orjson."""
+        api_client.force_authenticate(user=user)
+        response = api_client.post(
+            "/api/event/events/subscribe-batch/",
+            b'{"subscriptions": []}',
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert "subscriptions" in response.json()
@@ -0,0 +1,151 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+
+from ft.common.mixins import QueryOptimizedMixin
+from ft.common.query import QueryOptimizer
+from ft.event.models import (
+    CarpoolPayment,
+    CarpoolRequest,
+    CarpoolTrip,
+    Event,
+    EventSubscription,
+)
+from ft.event.urls import api_router as event_router
+from ft.resources.urls import api_router as resources_router
+from ft.user.models import User
+from ft.user.serializers import UserSerializer
+from ft.user.urls import api_router as user_router
+
+VIEWSETS = [
+    viewset
+    for router in (event_router, user_router, resources_router)
+    for _, viewset, _ in router.registry
+]
+
+
+def make_user(index):
+    return User.objects.create_user(
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        password="password123",
+        first_name=f"Prénom{index}",
+        last_name=f"Nom{index}",
+    )
+
+
+def make_event(index):
+    return Event.objects.create(
+        name=f"Événement {index}",
+        location="Paris",
+        start_date=timezone.now() + datetime.timedelta(days=30),
+        end_date=timezone.now() + datetime.timedelta(days=32),
+        type="CONGRESS",
+    )
+
+
+def make_trip(driver, event):
+    return CarpoolTrip.objects.create(
+        driver=driver,
+        event=event,
+        departure_city="Compiègne",
+        arrival_city="Paris",
+        departure_datetime=timezone.now() + datetime.timedelta(days=29),
+        seats_total=3,
+        price_per_seat=Decimal("10.00"),
+    )
+
+
+@pytest.mark.django_db
+class TestQueryOptimizer:
+    """Tests pour le QueryOptimizer et le QueryOptimizedMixin."""
+
+    @pytest.mark.parametrize("viewset", VIEWSETS, ids=lambda v: v.__name__)
+    def test_every_viewset_has_a_complete_plan(self, viewset):
+        """Test que chaque viewset est optimisé et que son plan se construit."""
+        assert issubclass(viewset, QueryOptimizedMixin)
+
+        serializer_class = viewset.serializer_class
+        queryset = QueryOptimizer.optimize(
+            serializer_class.Meta.model.objects.all(), serializer_class
+        )
+
+        assert str(queryset.query)
+
+    def test_only_selects_read_columns(self):
+        """Test que seules les colonnes lues par le serializer sont chargées."""
+        queryset = QueryOptimizer.optimize(User.objects.all(), UserSerializer)
+
+        sql = str(queryset.query)
+        assert '"user_user"."email"' in sql
+        assert '"user_user"."password"' not in sql
+
+    def test_undeclared_field_is_reported(self, settings):
+        """Test qu'un champ calculé non déclaré est signalé."""
+
+        class UndeclaredSerializer(serializers.ModelSerializer):
+            nickname = serializers.SerializerMethodField()
+
+            class Meta:
+                model = User
+                fields = ["id", "nickname"]
+
+            def get_nickname(self, obj):
+                return obj.faluche_nickname
+
+        with pytest.raises(ImproperlyConfigured, match="nickname"):
+            QueryOptimizer.optimize(User.objects.all(), UndeclaredSerializer)
+
+        settings.QUERY_PLAN_STRICT = False
+        queryset = QueryOptimizer.optimize(User.objects.all(), UndeclaredSerializer)
+        assert '"user_user"."password"' in str(queryset.query)
+
+    def test_event_list_query_count(
+        self, api_client, user, django_assert_max_num_queries
+    ):
+        """Test que la liste des événements ne fait pas de requête par ligne."""
+        users = [make_user(index) for index in range(5)]
+        for index in range(6):
+            event = make_event(index)
+            for answer, subscriber in zip(["YES", "YES", "NO", "MAYBE", "YES"], users):
+                EventSubscription.objects.create(
+                    event=event, user=subscriber, answer=answer
+                )
+        api_client.force_authenticate(user=user)
+
+        with django_assert_max_num_queries(3):
+            response = api_client.get(reverse("event-list"))
+
+        event = response.data["results"][0]
+        assert event["subscriptions_count"] == {"YES": 3, "NO": 1, "MAYBE": 1}
+        assert event["first_subscribers"] == ["PN", "PN", "PN"]
+
+    def test_carpool_request_list_query_count(
+        self, api_client, user, django_assert_max_num_queries
+    ):
+        """Test que la liste des demandes de covoiturage a un coût fixe."""
+        event = make_event(0)
+        trips = [make_trip(make_user(index), event) for index in range(3)]
+        for index, trip in enumerate(trips):
+            request = CarpoolRequest.objects.create(
+                passenger=user, trip=trip, status="ACCEPTED", seats_requested=2
+            )
+            CarpoolPayment.objects.create(
+                request=request, amount=Decimal("5.00"), is_completed=index == 0
+            )
+        api_client.force_authenticate(user=user)
+
+        with django_assert_max_num_queries(6):
+            response = api_client.get(reverse("carpool-request-list"))
+
+        results = sorted(response.data["results"], key=lambda item: item["id"])
+        assert [item["is_paid"] for item in results] == [True, False, False]
+        assert results[0]["total_paid"] == Decimal("5.00")
+        assert results[0]["expected_amount"] == Decimal("20.00")
+        assert results[0]["trip"]["seats_available"] == 2
+        assert results[0]["trip"]["event"]["name"] == "Événement 0"
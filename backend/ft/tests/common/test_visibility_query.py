@@ -0,0 +1,120 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from ft.common.query import VisibilityQuery
+from ft.event.models import CarpoolPayment, CarpoolRequest, CarpoolTrip, Event
+from ft.user.models import User
+
+
+def make_user(index):
+    return User.objects.create_user(
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        password="password123",
+        first_name=f"Prénom{index}",
+        last_name=f"Nom{index}",
+    )
+
+
+@pytest.fixture
+def carpools(db):
+    """
+    Deux trajets : `driver` conduit le premier, sur lequel il est aussi
+    passager de lui-même (cas limite), et voyage sur le second.
+    """
+    now = timezone.now()
+    event = Event.objects.create(
+        name="Congrès",
+        location="Compiègne",
+        start_date=now + datetime.timedelta(days=30),
+        end_date=now + datetime.timedelta(days=32),
+        type="CONGRESS",
+    )
+    driver, other, passenger = (make_user(index) for index in range(3))
+    trips = [
+        CarpoolTrip.objects.create(
+            driver=user,
+            event=event,
+            departure_city="Paris",
+            arrival_city="Compiègne",
+            departure_datetime=now + datetime.timedelta(days=30),
+            seats_total=4,
+            price_per_seat=Decimal("5.00"),
+        )
+        for user in (driver, other)
+    ]
+    requests = [
+        CarpoolRequest.objects.create(trip=trips[0], passenger=passenger),
+        CarpoolRequest.objects.create(trip=trips[0], passenger=driver),
+        CarpoolRequest.objects.create(trip=trips[1], passenger=driver),
+        CarpoolRequest.objects.create(trip=trips[1], passenger=passenger),
+    ]
+    for request in requests:
+        CarpoolPayment.objects.create(request=request, amount=Decimal("5.00"))
+    return {"driver": driver, "other": other, "passenger": passenger}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("strategy", VisibilityQuery.STRATEGIES)
+class TestVisibilityQuery:
+    """Tests pour le filtre de visibilité à plusieurs chemins."""
+
+    def test_matches_or_of_querysets(self, carpools, strategy):
+        """Test que le filtre renvoie les mêmes lignes que la forme OR."""
+        visibility = VisibilityQuery("passenger", "trip__driver")
+
+        for user in carpools.values():
+            expected = CarpoolRequest.objects.filter(
+                passenger=user
+            ) | CarpoolRequest.objects.filter(trip__driver=user)
+            result = visibility.apply(CarpoolRequest.objects.all(), user, strategy)
+            assert sorted(result.values_list("pk", flat=True)) == sorted(
+                expected.values_list("pk", flat=True)
+            )
+
+    def test_no_duplicates_when_several_paths_match(self, carpools, strategy):
+        """Test qu'une ligne visible par deux chemins n'apparaît qu'une fois."""
+        visibility = VisibilityQuery("passenger", "trip__driver")
+
+        result = visibility.apply(
+            CarpoolRequest.objects.all(), carpools["driver"], strategy
+        )
+
+        pks = list(result.values_list("pk", flat=True))
+        assert len(pks) == len(set(pks)) == 3
+
+    def test_via_foreign_key(self, carpools, strategy):
+        """Test que les chemins sont suivis depuis la clé étrangère `via`."""
+        visibility = VisibilityQuery("passenger", "trip__driver", via="request")
+
+        result = visibility.apply(
+            CarpoolPayment.objects.all(), carpools["other"], strategy
+        )
+
+        assert set(result.values_list("request__trip__driver", flat=True)) == {
+            carpools["other"].pk
+        }
+        assert result.count() == 2
+
+    def test_keeps_queryset_filters_and_ordering(self, carpools, strategy):
+        """Test que le queryset filtré garde ses filtres et son tri."""
+        visibility = VisibilityQuery("passenger", "trip__driver")
+        queryset = CarpoolRequest.objects.filter(
+            trip__driver=carpools["other"]
+        ).order_by("pk")
+
+        result = visibility.apply(queryset, carpools["passenger"], strategy)
+
+        assert list(result) == list(queryset.filter(passenger=carpools["passenger"]))
+
+
+@pytest.mark.django_db
+def test_unknown_strategy(carpools):
+    """Test qu'une stratégie inconnue est refusée."""
+    with pytest.raises(ValueError):
+        VisibilityQuery("passenger").apply(
+            CarpoolRequest.objects.all(), carpools["driver"], "join"
+        )
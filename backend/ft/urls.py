@@ -21,6 +21,7 @@ urlpatterns = (
         path("api/user/", include("ft.user.urls")),
         path("api/event/", include("ft.event.urls")),
         path("api/resources/", include("ft.resources.urls")),
+        path("api/diagnostics/", include("ft.diagnostics.urls")),
         path("api/version/", VersionView.as_view(), name="version"),
         path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
         path(
@@ -108,7 +108,9 @@ class UserAdmin(UserAdmin):
         ),
     )
 
-    search_fields = ("email", "first_name", "last_name")
+    # Recherche par préfixe, servie par les index `user_*_prefix_idx` : elle
+    # alimente l'autocomplétion des autres admins.
+    search_fields = ("^email", "^first_name", "^last_name", "^faluche_nickname")
     ordering = ("last_name", "first_name", "email")
     list_filter = ("faluche_status", "has_car", "can_host_peoples")
 
@@ -128,8 +130,10 @@ class MembershipAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_filter = ("is_active",)
+    list_select_related = ("user",)
     readonly_fields = ("created_at", "updated_at")
-    search_fields = ("user",)
+    autocomplete_fields = ("user",)
+    search_fields = ("^user__email", "^user__first_name", "^user__last_name")
     ordering = ("start_date", "end_date", "user")
 
     def save_model(self, request, obj, form, change):
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:11
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("user", "0003_user_search_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="membership",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "start_date", "end_date"],
+                name="membership_user_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0004_membership_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="membership",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incrémentée à chaque modification",
+                verbose_name="Version",
+            ),
+        ),
+    ]
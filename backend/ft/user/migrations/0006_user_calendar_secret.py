@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0005_membership_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="calendar_secret",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Entre dans la signature de l'URL du flux iCalendar ; le changer révoque l'URL",
+                max_length=32,
+                verbose_name="Secret du flux calendrier",
+            ),
+        ),
+    ]
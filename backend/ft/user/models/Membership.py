@@ -1,10 +1,11 @@
 from datetime import datetime
 from django.db import models
 
+from ft.common.models import VersionedModel
 from ft.user.models import User
 
 
-class Membership(models.Model):
+class Membership(VersionedModel):
     """
     A membership represent a subscription fee paid by a user to La Tocarde for a year.
     """
@@ -41,6 +42,13 @@ class Membership(models.Model):
         verbose_name = "Adhésion"
         verbose_name_plural = "Adhésions"
         ordering = ["start_date", "end_date"]
+        indexes = [
+            models.Index(
+                fields=["user", "start_date", "end_date"],
+                condition=models.Q(is_active=True),
+                name="membership_user_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return "{} {} ({})".format(
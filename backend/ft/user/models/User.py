@@ -1,6 +1,8 @@
 from datetime import datetime
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from ft.user.managers import UserManager
 
@@ -91,10 +93,33 @@ class User(AbstractUser):
         help_text="Statut de Faluche de l'utilisateur",
     )
 
+    calendar_secret: str = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        verbose_name="Secret du flux calendrier",
+        help_text="Entre dans la signature de l'URL du flux iCalendar ; "
+        "le changer révoque l'URL",
+    )
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["last_name", "first_name"]
+        # Index des recherches par préfixe de l'admin (`^champ`, soit
+        # UPPER(champ::text) LIKE 'XX%') utilisées par l'autocomplétion.
+        indexes = [
+            models.Index(
+                OpClass(Upper(field), "text_pattern_ops"),
+                name=name,
+            )
+            for field, name in [
+                ("email", "user_email_prefix_idx"),
+                ("first_name", "user_first_name_prefix_idx"),
+                ("last_name", "user_last_name_prefix_idx"),
+                ("faluche_nickname", "user_nickname_prefix_idx"),
+            ]
+        ]
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
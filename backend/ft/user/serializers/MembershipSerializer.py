@@ -13,10 +13,12 @@ class MembershipSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
+            "version",
         ]
         read_only_fields = [
             "created_at",
             "updated_at",
+            "version",
         ]
         extra_kwargs = {
             "user": {"read_only": True},
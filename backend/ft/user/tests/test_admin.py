@@ -0,0 +1,49 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from ft.user.models import User, Membership
+from django.utils import timezone
+import datetime
+
+
+@pytest.mark.django_db
+class TestUserAdminSearch:
+    """Tests de la recherche indexée des utilisateurs dans l'admin."""
+
+    @pytest.fixture
+    def superuser_client(self, client, admin_user):
+        client.force_login(admin_user)
+        return client
+
+    def test_prefix_search_uses_index(self):
+        """Test que la recherche par préfixe peut utiliser l'index."""
+        queryset = User.objects.filter(last_name__istartswith="dup").order_by()
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        assert "user_last_name_prefix_idx" in plan
+
+    def test_membership_search_and_autocomplete(self, superuser_client):
+        """Test que la recherche des adhésions porte sur l'utilisateur."""
+        user = User.objects.create_user(
+            username="alice",
+            email="alice@example.com",
+            password="password123",
+            last_name="Martin",
+        )
+        Membership.objects.create(
+            user=user,
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + datetime.timedelta(days=365),
+        )
+
+        response = superuser_client.get(
+            reverse("admin:user_membership_changelist"), {"q": "mart"}
+        )
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == 1
+
+        response = superuser_client.get(reverse("admin:user_membership_add"))
+        assert b"admin-autocomplete" in response.content
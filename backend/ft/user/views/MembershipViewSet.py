@@ -1,9 +1,12 @@
+from ft.common.mixins import ConditionalUpdateMixin, QueryOptimizedMixin
 from ft.user.models import Membership
 from ft.user.serializers import MembershipSerializer
 from rest_framework import viewsets
 
 
-class MembershipViewSet(viewsets.ModelViewSet):
+class MembershipViewSet(
+    QueryOptimizedMixin, ConditionalUpdateMixin, viewsets.ModelViewSet
+):
     queryset = Membership.objects.all()
     serializer_class = MembershipSerializer
 
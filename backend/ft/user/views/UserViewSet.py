@@ -1,9 +1,10 @@
 from rest_framework import viewsets
+from ft.common.mixins import QueryOptimizedMixin
 from ft.user.models import User
 from ft.user.serializers import UserSerializer
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(QueryOptimizedMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
 